@@ -4,7 +4,7 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 
 from app.core.auth import oauth
 from app.database.dependencies import DBSession
-from app.services.user_account import create_user_account, get_user_by_email
+from app.services.user_account import build_session_principal, upsert_user_account
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -22,11 +22,8 @@ async def authenticate(request: Request, db: DBSession) -> HTMLResponse | Redire
         user_info = token["userinfo"]
     except OAuthError:
         return HTMLResponse("<h1>Authentication failed. Please try again.</h1>", status_code=400)
-    request.session["user"] = dict(user_info)
-    email = user_info["email"]
-    user_account = await get_user_by_email(db, email)
-    if not user_account:
-        await create_user_account(db, email, user_info["given_name"])
+    user_account = await upsert_user_account(db, user_info["email"], user_info["given_name"])
+    request.session["user"] = build_session_principal(user_account)
     return RedirectResponse(url="/")
 
 
@@ -1,13 +1,38 @@
-from fastapi import APIRouter, status
+from typing import Annotated
 
+from fastapi import APIRouter, Query, Response, UploadFile, status
+
+from app.core.config import settings
 from app.core.dependencies import CurrentUser
-from app.core.validation import check_user_can_access_travel_idea, check_user_can_access_travel_idea_group
+from app.core.etag import IfNoneMatch, etag_matches, not_modified_response, travel_idea_group_etag
+from app.core.pagination import DEFAULT_PAGE_SIZE, PageLimit, decode_cursor, paginate
+from app.core.response_cache import cached_json_response, response_cache, travel_idea_group_scope
+from app.core.responses import Accept, SchemaJSONResponse, accepts_ndjson, dump_json, ndjson_response
+from app.core.uploads import RecordValidator, read_csv_records, read_geojson_records
+from app.core.validation import (
+    check_user_can_access_travel_idea,
+    check_user_role_in_travel_idea_group,
+    raise_travel_idea_access_error,
+)
 from app.database.dependencies import DBSession
-from app.schemas.enums import TravelIdeaGroupRole
-from app.schemas.travel_idea import TravelIdeaCreate, TravelIdeaRead, TravelIdeaUpdate
+from app.schemas.enums import ImportFormat, TravelIdeaGroupRole
+from app.schemas.shared import Page, construct_page
+from app.schemas.travel_idea import (
+    MAX_IMPORT_ERRORS,
+    TravelIdeaBulkCreate,
+    TravelIdeaCreate,
+    TravelIdeaImportRead,
+    TravelIdeaRead,
+    TravelIdeaUpdate,
+    construct_travel_idea,
+)
 from app.services.travel_idea import (
     create_new_travel_idea,
+    create_new_travel_ideas,
     delete_travel_idea_from_db,
+    get_travel_ideas,
+    import_new_travel_ideas,
+    stream_travel_ideas,
     update_existing_travel_idea,
 )
 
@@ -20,11 +45,45 @@ async def create_travel_idea(
     request_data: TravelIdeaCreate,
     db: DBSession,
     current_user: CurrentUser,
-) -> TravelIdeaRead:
-    travel_idea_group, _, _ = await check_user_can_access_travel_idea_group(
-        db, travel_idea_group_id, current_user, TravelIdeaGroupRole.MEMBER
+) -> SchemaJSONResponse:
+    await check_user_role_in_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.MEMBER)
+    travel_idea = await create_new_travel_idea(db, request_data, current_user, travel_idea_group_id)
+    return SchemaJSONResponse(construct_travel_idea(travel_idea))
+
+
+@router.post("/bulk", response_model=list[TravelIdeaRead], status_code=status.HTTP_201_CREATED)
+async def create_travel_ideas(
+    travel_idea_group_id: int,
+    request_data: TravelIdeaBulkCreate,
+    db: DBSession,
+    current_user: CurrentUser,
+) -> SchemaJSONResponse:
+    await check_user_role_in_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.MEMBER)
+    travel_ideas = await create_new_travel_ideas(db, request_data, current_user, travel_idea_group_id)
+    return SchemaJSONResponse(
+        [construct_travel_idea(travel_idea) for travel_idea in travel_ideas], status_code=status.HTTP_201_CREATED
     )
-    return await create_new_travel_idea(db, request_data, current_user, travel_idea_group)
+
+
+@router.post("/import", response_model=TravelIdeaImportRead)
+async def import_travel_ideas(
+    travel_idea_group_id: int,
+    file: UploadFile,
+    import_format: Annotated[ImportFormat, Query(alias="format")],
+    db: DBSession,
+    current_user: CurrentUser,
+) -> TravelIdeaImportRead:
+    """Imports the valid rows of the file and reports which rows failed validation, rather than failing altogether."""
+    await check_user_role_in_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.MEMBER)
+
+    if import_format == ImportFormat.CSV:
+        records = read_csv_records(file, settings.import_batch_size)
+    else:
+        records = read_geojson_records(file, settings.import_batch_size)
+    validator = RecordValidator(TravelIdeaCreate, MAX_IMPORT_ERRORS)
+    imported = await import_new_travel_ideas(db, validator.valid_batches(records), current_user, travel_idea_group_id)
+
+    return TravelIdeaImportRead(imported=imported, failed=validator.failed, errors=validator.errors)
 
 
 @router.get("/{travel_idea_id}", response_model=TravelIdeaRead)
@@ -33,21 +92,53 @@ async def get_travel_idea(
     travel_idea_id: int,
     db: DBSession,
     current_user: CurrentUser,
-) -> TravelIdeaRead:
-    travel_idea = await check_user_can_access_travel_idea(db, travel_idea_group_id, travel_idea_id, current_user)
-    return travel_idea
+    if_none_match: IfNoneMatch = None,
+) -> Response:
+    access = await check_user_can_access_travel_idea(db, travel_idea_group_id, travel_idea_id, current_user)
+    etag = travel_idea_group_etag(access.version)
+    if etag_matches(etag, if_none_match):
+        return not_modified_response(etag)
 
+    return SchemaJSONResponse(construct_travel_idea(access.TravelIdea), headers={"ETag": etag})
 
-@router.get("/", response_model=list[TravelIdeaRead])
-async def get_travel_ideas(
+
+@router.get("/", response_model=Page[TravelIdeaRead])
+async def get_travel_ideas_for_travel_idea_group(
     travel_idea_group_id: int,
     db: DBSession,
     current_user: CurrentUser,
-) -> list[TravelIdeaRead]:
-    travel_idea_group, _, _ = await check_user_can_access_travel_idea_group(
-        db, travel_idea_group_id, current_user, TravelIdeaGroupRole.MEMBER, load_travel_ideas=True
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    if_none_match: IfNoneMatch = None,
+    accept: Accept = None,
+) -> Response:
+    access = await check_user_role_in_travel_idea_group(
+        db, travel_idea_group_id, current_user, TravelIdeaGroupRole.MEMBER
+    )
+    after_id = decode_cursor(cursor, int)[0] if cursor else None
+
+    if accepts_ndjson(accept):
+        # Streams every idea after the cursor rather than a page, so limit doesn't apply
+        return ndjson_response(await stream_travel_ideas(db, travel_idea_group_id, after_id), construct_travel_idea)
+
+    etag = travel_idea_group_etag(access.version)
+    if etag_matches(etag, if_none_match):
+        return not_modified_response(etag)
+
+    cache_key = await response_cache.key(
+        travel_idea_group_scope(travel_idea_group_id), access.version, "travel-idea", limit, after_id
     )
-    return [travel_idea for travel_idea in travel_idea_group.travel_ideas]
+    body = await response_cache.get(cache_key)
+    if body is not None:
+        return cached_json_response(body, etag)
+
+    travel_ideas = await get_travel_ideas(db, travel_idea_group_id, limit + 1, after_id)
+    items, next_cursor = paginate(travel_ideas, limit, lambda travel_idea: (travel_idea.id,))
+
+    items = [construct_travel_idea(travel_idea) for travel_idea in items]
+    body = dump_json(construct_page(items, next_cursor))
+    await response_cache.set(cache_key, body)
+    return cached_json_response(body, etag)
 
 
 @router.patch("/{travel_idea_id}", response_model=TravelIdeaRead)
@@ -57,9 +148,13 @@ async def update_travel_idea(
     request_data: TravelIdeaUpdate,
     db: DBSession,
     current_user: CurrentUser,
-) -> TravelIdeaRead:
-    travel_idea = await check_user_can_access_travel_idea(db, travel_idea_group_id, travel_idea_id, current_user)
-    return await update_existing_travel_idea(db, request_data, travel_idea)
+) -> SchemaJSONResponse:
+    travel_idea = await update_existing_travel_idea(
+        db, request_data, travel_idea_group_id, travel_idea_id, current_user.id
+    )
+    if travel_idea is None:
+        await raise_travel_idea_access_error(db, travel_idea_group_id, travel_idea_id, current_user)
+    return SchemaJSONResponse(construct_travel_idea(travel_idea))
 
 
 @router.delete("/{travel_idea_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -69,6 +164,6 @@ async def delete_travel_idea(
     db: DBSession,
     current_user: CurrentUser,
 ) -> None:
-    travel_idea = await check_user_can_access_travel_idea(db, travel_idea_group_id, travel_idea_id, current_user)
-    await delete_travel_idea_from_db(db, travel_idea)
+    if not await delete_travel_idea_from_db(db, travel_idea_group_id, travel_idea_id, current_user.id):
+        await raise_travel_idea_access_error(db, travel_idea_group_id, travel_idea_id, current_user)
     return 204
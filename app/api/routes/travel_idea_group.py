@@ -1,25 +1,50 @@
-from fastapi import APIRouter, HTTPException, status
+from typing import Annotated
 
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
 from app.core.dependencies import CurrentUser
-from app.core.validation import check_user_can_access_travel_idea_group
-from app.database.dependencies import DBSession
-from app.schemas.enums import TravelIdeaGroupRole
+from app.core.etag import IfNoneMatch, etag_matches, not_modified_response, travel_idea_group_etag
+from app.core.export import EXPORT_MEDIA_TYPES, export_response
+from app.core.pagination import DEFAULT_PAGE_SIZE, PageLimit, decode_cursor, paginate
+from app.core.response_cache import cached_json_response, response_cache, travel_idea_group_scope
+from app.core.responses import Accept, SchemaJSONResponse, accepts_ndjson, dump_json, ndjson_response
+from app.core.validation import check_user_can_access_travel_idea_group, check_user_role_in_travel_idea_group
+from app.database.dependencies import DBSession, SessionFactory
+from app.schemas.enums import ExportFormat, TravelIdeaGroupRole
+from app.schemas.shared import Page, construct_page
+from app.schemas.travel_idea import TravelIdeaExport, construct_travel_idea_export
 from app.schemas.travel_idea_group import (
     TravelIdeaGroupCreate,
     TravelIdeaGroupRead,
+    TravelIdeaGroupSummary,
     TravelIdeaGroupUpdate,
     construct_travel_idea_group,
+    construct_travel_idea_group_summary,
+)
+from app.schemas.travel_idea_group_invitation import (
+    TravelIdeaGroupInvitationBulkCreate,
+    TravelIdeaGroupInvitationBulkCreateRead,
+    TravelIdeaGroupInvitationCreate,
+    TravelIdeaGroupInvitationDelete,
 )
-from app.schemas.travel_idea_group_invitation import TravelIdeaGroupInvitationCreate, TravelIdeaGroupInvitationDelete
+from app.services.travel_idea import stream_travel_idea_export
 from app.services.travel_idea_group import (
+    clone_travel_idea_group,
     create_new_travel_idea_group,
     delete_travel_idea_group_from_db,
-    get_travel_idea_groups,
+    delete_travel_idea_group_in_chunks,
+    get_travel_idea_group_by_id,
+    get_travel_idea_group_summaries,
+    stream_travel_idea_group_summaries,
     update_existing_travel_idea_group,
 )
 from app.services.travel_idea_group_invitation import (
     create_new_travel_idea_group_invitation,
+    create_new_travel_idea_group_invitations,
     delete_travel_idea_group_invitation,
+    get_members_and_invitees,
     get_outstanding_invitations_for_travel_idea_group,
     get_travel_idea_group_invitation_for_travel_idea_group,
 )
@@ -32,10 +57,23 @@ async def create_travel_idea_group(
     request_body: TravelIdeaGroupCreate,
     db: DBSession,
     current_user: CurrentUser,
-) -> TravelIdeaGroupRead:
+) -> SchemaJSONResponse:
     travel_idea_group = await create_new_travel_idea_group(db, request_body, current_user)
 
-    return construct_travel_idea_group(travel_idea_group, [])
+    return SchemaJSONResponse(construct_travel_idea_group(travel_idea_group, []), status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/{travel_idea_group_id}/clone", response_model=TravelIdeaGroupRead, status_code=status.HTTP_201_CREATED)
+async def clone_travel_idea_group_for_user(
+    travel_idea_group_id: int,
+    request_body: TravelIdeaGroupCreate,
+    db: DBSession,
+    current_user: CurrentUser,
+) -> SchemaJSONResponse:
+    await check_user_role_in_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.MEMBER)
+    travel_idea_group = await clone_travel_idea_group(db, travel_idea_group_id, request_body, current_user)
+
+    return SchemaJSONResponse(construct_travel_idea_group(travel_idea_group, []), status_code=status.HTTP_201_CREATED)
 
 
 @router.post("/{travel_idea_group_id}/invitation", status_code=status.HTTP_201_CREATED)
@@ -57,14 +95,57 @@ async def create_travel_idea_group_invitation(
     return 201
 
 
-@router.get("/", response_model=list[TravelIdeaGroupRead])
+@router.post(
+    "/{travel_idea_group_id}/invitation/bulk",
+    response_model=TravelIdeaGroupInvitationBulkCreateRead,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_travel_idea_group_invitations(
+    travel_idea_group_id: int,
+    body: TravelIdeaGroupInvitationBulkCreate,
+    db: DBSession,
+    current_user: CurrentUser,
+) -> TravelIdeaGroupInvitationBulkCreateRead:
+    await check_user_role_in_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.OWNER)
+
+    emails = list(dict.fromkeys(body.emails))
+    members, invitees = await get_members_and_invitees(db, travel_idea_group_id, emails)
+    emails_to_invite = [email for email in emails if email not in members and email not in invitees]
+
+    if emails_to_invite:
+        await create_new_travel_idea_group_invitations(db, current_user, travel_idea_group_id, emails_to_invite)
+
+    return TravelIdeaGroupInvitationBulkCreateRead(
+        invited=emails_to_invite,
+        already_members=[email for email in emails if email in members],
+        already_invited=[email for email in emails if email in invitees and email not in members],
+    )
+
+
+@router.get("/", response_model=Page[TravelIdeaGroupSummary])
 async def get_travel_idea_groups_for_user(
     db: DBSession,
     current_user: CurrentUser,
-) -> list[TravelIdeaGroupRead]:
-    travel_idea_groups_from_db = await get_travel_idea_groups(db, current_user.id)
+    limit: PageLimit = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    accept: Accept = None,
+) -> Response:
+    after = decode_cursor(cursor, str, int) if cursor else None
+    if accepts_ndjson(accept):
+        # Streams every group after the cursor rather than a page, so limit doesn't apply
+        return ndjson_response(
+            await stream_travel_idea_group_summaries(db, current_user.id, after),
+            lambda row: construct_travel_idea_group_summary(row.TravelIdeaGroup, row.member_count),
+        )
+
+    rows = await get_travel_idea_group_summaries(db, current_user.id, limit + 1, after)
+    rows, next_cursor = paginate(rows, limit, lambda row: (row.TravelIdeaGroup.name, row.TravelIdeaGroup.id))
 
-    return [construct_travel_idea_group(travel_idea_group) for travel_idea_group in travel_idea_groups_from_db]
+    return SchemaJSONResponse(
+        construct_page(
+            [construct_travel_idea_group_summary(row.TravelIdeaGroup, row.member_count) for row in rows], next_cursor
+        )
+    )
 
 
 @router.get("/{travel_idea_group_id}", response_model=TravelIdeaGroupRead)
@@ -72,12 +153,49 @@ async def get_travel_idea_group(
     travel_idea_group_id: int,
     db: DBSession,
     current_user: CurrentUser,
-) -> TravelIdeaGroupRead:
-    travel_idea_group, members, _ = await check_user_can_access_travel_idea_group(
+    if_none_match: IfNoneMatch = None,
+) -> Response:
+    access = await check_user_role_in_travel_idea_group(
         db, travel_idea_group_id, current_user, TravelIdeaGroupRole.MEMBER
     )
+    etag = travel_idea_group_etag(access.version)
+    if etag_matches(etag, if_none_match):
+        return not_modified_response(etag)
+
+    cache_key = await response_cache.key(travel_idea_group_scope(travel_idea_group_id), access.version)
+    body = await response_cache.get(cache_key)
+    if body is not None:
+        return cached_json_response(body, etag)
+
+    travel_idea_group = await get_travel_idea_group_by_id(db, travel_idea_group_id)
+    if travel_idea_group is None:
+        raise HTTPException(status_code=404, detail="Travel idea group not found")
+
+    body = dump_json(construct_travel_idea_group(travel_idea_group))
+    await response_cache.set(cache_key, body)
+    return cached_json_response(body, etag)
+
+
+@router.get(
+    "/{travel_idea_group_id}/export",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}},
+)
+async def export_travel_idea_group(
+    travel_idea_group_id: int,
+    db: DBSession,
+    current_user: CurrentUser,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.JSON,
+) -> StreamingResponse:
+    await check_user_role_in_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.MEMBER)
 
-    return construct_travel_idea_group(travel_idea_group, members)
+    return export_response(
+        await stream_travel_idea_export(db, travel_idea_group_id),
+        construct_travel_idea_export,
+        TravelIdeaExport,
+        export_format,
+        f"travel-idea-group-{travel_idea_group_id}",
+    )
 
 
 @router.get("/{travel_idea_group_id}/invitation", response_model=list[str])
@@ -85,11 +203,21 @@ async def get_travel_idea_group_invitations(
     travel_idea_group_id: int,
     db: DBSession,
     current_user: CurrentUser,
-) -> TravelIdeaGroupRead:
-    await check_user_can_access_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.OWNER)
+    response: Response,
+    if_none_match: IfNoneMatch = None,
+) -> list[str] | Response:
+    access = await check_user_role_in_travel_idea_group(
+        db, travel_idea_group_id, current_user, TravelIdeaGroupRole.OWNER
+    )
 
     invitations = await get_outstanding_invitations_for_travel_idea_group(db, travel_idea_group_id)
 
+    # Invitations drop out of the list as they expire, which doesn't bump the version
+    etag = travel_idea_group_etag(access.version, len(invitations))
+    if etag_matches(etag, if_none_match):
+        return not_modified_response(etag)
+
+    response.headers["ETag"] = etag
     return [invitation.email for invitation in invitations]
 
 
@@ -99,27 +227,44 @@ async def update_travel_idea_group(
     request_body: TravelIdeaGroupUpdate,
     db: DBSession,
     current_user: CurrentUser,
-) -> TravelIdeaGroupRead:
+) -> SchemaJSONResponse:
     travel_idea_group, _, _ = await check_user_can_access_travel_idea_group(
         db, travel_idea_group_id, current_user, TravelIdeaGroupRole.OWNER
     )
 
     await update_existing_travel_idea_group(db, request_body, travel_idea_group)
 
-    return construct_travel_idea_group(travel_idea_group)
+    return SchemaJSONResponse(construct_travel_idea_group(travel_idea_group))
 
 
-@router.delete("/{travel_idea_group_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{travel_idea_group_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    response_model=None,
+    responses={status.HTTP_202_ACCEPTED: {"description": "Deletion continues in the background"}},
+)
 async def delete_travel_idea_group(
     travel_idea_group_id: int,
     db: DBSession,
+    session_factory: SessionFactory,
     current_user: CurrentUser,
-) -> None:
-    travel_idea_group, _, _ = await check_user_can_access_travel_idea_group(
-        db, travel_idea_group_id, current_user, TravelIdeaGroupRole.OWNER
-    )
+    background_tasks: BackgroundTasks,
+    background: bool = False,
+) -> Response | None:
+    await check_user_role_in_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.OWNER)
+
+    if background:
+        background_tasks.add_task(
+            delete_travel_idea_group_in_chunks,
+            session_factory,
+            travel_idea_group_id,
+            settings.travel_idea_group_delete_chunk_size,
+        )
+        # Returned directly, as setting the status on the injected response would still send a JSON null body.
+        # FastAPI attaches the background tasks to it
+        return Response(status_code=status.HTTP_202_ACCEPTED)
 
-    await delete_travel_idea_group_from_db(db, travel_idea_group)
+    await delete_travel_idea_group_from_db(db, travel_idea_group_id)
 
 
 @router.delete("/{travel_idea_group_id}/invitation", status_code=status.HTTP_204_NO_CONTENT)
@@ -129,7 +274,7 @@ async def revoke_travel_idea_group_invitation(
     db: DBSession,
     current_user: CurrentUser,
 ) -> None:
-    await check_user_can_access_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.OWNER)
+    await check_user_role_in_travel_idea_group(db, travel_idea_group_id, current_user, TravelIdeaGroupRole.OWNER)
 
     invitation = await get_travel_idea_group_invitation_for_travel_idea_group(db, travel_idea_group_id, body.email)
     if not invitation:
@@ -1,35 +1,52 @@
-from fastapi import APIRouter, HTTPException
+from datetime import UTC, datetime
+
+from fastapi import APIRouter, HTTPException, Response
 
 from app.core.dependencies import CurrentUser
+from app.core.response_cache import cached_json_response, invitations_scope, response_cache
+from app.core.responses import Accept, accepts_ndjson, dump_json, ndjson_response
 from app.database.dependencies import DBSession
 from app.schemas.enums import TravelIdeaGroupInvitationStatus
-from app.schemas.travel_idea_group import TravelIdeaGroupUser
 from app.schemas.travel_idea_group_invitation import (
     TravelIdeaGroupInvitationRead,
     TravelIdeaGroupInvitationResponseRead,
     TravelIdeaGroupInvitationUpdate,
+    construct_travel_idea_group_invitation,
 )
 from app.services.travel_idea_group_invitation import (
     accept_or_reject_travel_idea_group_invitation,
-    get_travel_idea_group_invitation_for_invitation_code,
     get_travel_idea_group_invitations,
+    stream_travel_idea_group_invitations,
 )
 
 router = APIRouter(prefix="/invitation", tags=["invitation"])
 
 
 @router.get("/", response_model=list[TravelIdeaGroupInvitationRead])
-async def get_invitations(db: DBSession, current_user: CurrentUser) -> list[TravelIdeaGroupInvitationRead]:
+async def get_invitations(db: DBSession, current_user: CurrentUser, accept: Accept = None) -> Response:
+    if accepts_ndjson(accept):
+        return ndjson_response(
+            await stream_travel_idea_group_invitations(db, current_user.email), construct_travel_idea_group_invitation
+        )
+
+    cache_key = await response_cache.key(invitations_scope(current_user.email))
+    body = await response_cache.get(cache_key)
+    if body is not None:
+        return cached_json_response(body)
+
     travel_idea_group_invitations = await get_travel_idea_group_invitations(db, current_user.email)
+    body = dump_json(
+        [construct_travel_idea_group_invitation(invitation) for invitation in travel_idea_group_invitations]
+    )
 
-    return [
-        TravelIdeaGroupInvitationRead(
-            invitation_code=invitation.invitation_code,
-            travel_idea_group_name=invitation.travel_idea_group.name,
-            invited_by=TravelIdeaGroupUser(name=invitation.created_by.name, email=invitation.created_by.email),
-        )
-        for invitation in travel_idea_group_invitations
-    ]
+    # Expiring invitations drop out of the list without a write to invalidate it
+    ttl_seconds = None
+    if travel_idea_group_invitations:
+        # SQLite doesn't keep the offset, which is always UTC
+        expires_at = min(invitation.expires_at for invitation in travel_idea_group_invitations)
+        ttl_seconds = (expires_at.replace(tzinfo=expires_at.tzinfo or UTC) - datetime.now(UTC)).total_seconds()
+    await response_cache.set(cache_key, body, ttl_seconds)
+    return cached_json_response(body)
 
 
 @router.patch("/{invitation_code}", response_model=TravelIdeaGroupInvitationResponseRead)
@@ -39,14 +56,11 @@ async def update_invitation(
     db: DBSession,
     current_user: CurrentUser,
 ) -> TravelIdeaGroupInvitationResponseRead:
-    invitation = await get_travel_idea_group_invitation_for_invitation_code(db, current_user.email, invitation_code)
-    if not invitation:
-        raise HTTPException(status_code=404, detail="Valid invitation not found")
-
-    updated_invitation = await accept_or_reject_travel_idea_group_invitation(
-        db, invitation, current_user, TravelIdeaGroupInvitationStatus.from_response(request_body.status)
+    status = TravelIdeaGroupInvitationStatus.from_response(request_body.status)
+    travel_idea_group_id = await accept_or_reject_travel_idea_group_invitation(
+        db, invitation_code, current_user, status
     )
+    if travel_idea_group_id is None:
+        raise HTTPException(status_code=404, detail="Valid invitation not found")
 
-    return TravelIdeaGroupInvitationResponseRead(
-        invitation_code=updated_invitation.invitation_code, status=updated_invitation.status
-    )
+    return TravelIdeaGroupInvitationResponseRead(invitation_code=invitation_code, status=status)
@@ -1,27 +1,59 @@
+from pathlib import Path
+
+import httpx
 from authlib.integrations.starlette_client import OAuth
 from fastapi import HTTPException, Request
 
 from app import models
 from app.core.config import settings
+from app.core.oidc import OIDCMetadataCache, SharedAsyncTransport
 from app.database.dependencies import DBSession
-from app.services.user_account import get_user_by_email
+from app.services.user_account import build_session_principal, get_user_by_email, get_user_for_session_principal
+
+GOOGLE_SERVER_METADATA_URL = "https://accounts.google.com/.well-known/openid-configuration"
+
+oauth_http_transport = SharedAsyncTransport(
+    httpx.AsyncHTTPTransport(limits=httpx.Limits(max_connections=settings.oauth_http_max_connections), retries=1)
+)
 
 oauth = OAuth()
 oauth.register(
     name="google",
     client_id=settings.google_client_id,
     client_secret=settings.google_client_secret,
-    server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
-    client_kwargs={"scope": "openid email profile"},
+    server_metadata_url=GOOGLE_SERVER_METADATA_URL,
+    client_kwargs={
+        "scope": "openid email profile",
+        "transport": oauth_http_transport,
+        "timeout": httpx.Timeout(settings.oauth_http_timeout_seconds),
+    },
+)
+
+google_metadata_cache = OIDCMetadataCache(
+    oauth.google,
+    GOOGLE_SERVER_METADATA_URL,
+    cache_path=Path(settings.oidc_metadata_cache_path),
+    ttl_seconds=settings.oidc_metadata_ttl_seconds,
+    transport=oauth_http_transport,
+    timeout_seconds=settings.oauth_http_timeout_seconds,
 )
 
 
 async def get_current_user(request: Request, db: DBSession) -> models.UserAccount:
-    session_user = request.session.get("user")
-    if not session_user:
+    principal = request.session.get("user")
+    if not principal:
         raise HTTPException(status_code=401, detail="Not authenticated")
-    email = session_user.get("email")
-    user = await get_user_by_email(db, email)
+
+    if "id" in principal:
+        user = await get_user_for_session_principal(db, principal)
+    else:
+        # Sessions created before the compact principal was introduced hold the full Google userinfo
+        user = await get_user_by_email(db, principal.get("email"))
+
     if not user:
         raise HTTPException(status_code=403, detail="User not found in database")
+
+    session_principal = build_session_principal(user)
+    if principal != session_principal:
+        request.session["user"] = session_principal
     return user
@@ -6,6 +6,23 @@ class Settings(BaseSettings):
     secret_key: str
     google_client_id: str
     google_client_secret: str
+    principal_cache_max_size: int = 1024
+    principal_cache_ttl_seconds: int = 300
+    oidc_metadata_cache_path: str = ".oidc_metadata_cache.json"
+    oidc_metadata_ttl_seconds: int = 3600
+    oauth_http_timeout_seconds: float = 5.0
+    oauth_http_max_connections: int = 20
+    invitation_sweep_interval_seconds: int = 3600
+    invitation_sweep_batch_size: int = 1000
+    travel_idea_group_delete_chunk_size: int = 1000
+    stream_batch_size: int = 500
+    import_batch_size: int = 1000
+    response_cache_url: str | None = None
+    response_cache_max_size: int = 1024
+    response_cache_ttl_seconds: int = 300
+    response_cache_timeout_seconds: float = 0.5
+    # Off by default, as the header exposes database timings to clients
+    server_timing_enabled: bool = False
 
     model_config = SettingsConfigDict(env_file=".env")
 
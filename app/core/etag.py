@@ -0,0 +1,22 @@
+from typing import Annotated
+
+from fastapi import Header, Response, status
+
+IfNoneMatch = Annotated[str | None, Header()]
+
+
+def travel_idea_group_etag(version: int, *parts: object) -> str:
+    """Weak, as it identifies the group's data at a version rather than the exact bytes of the response."""
+    return 'W/"' + "-".join(map(str, (version, *parts))) + '"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Compares weakly, which is how If-None-Match is always compared."""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
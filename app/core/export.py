@@ -0,0 +1,74 @@
+import csv
+import io
+from collections.abc import AsyncIterator, Callable
+
+from fastapi.responses import StreamingResponse
+from pydantic_core import to_jsonable_python
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncResult
+
+from app.core.responses import dump_json
+from app.schemas.enums import ExportFormat
+from app.schemas.shared import BaseSchema, SchemaDict
+
+EXPORT_MEDIA_TYPES = {ExportFormat.CSV: "text/csv", ExportFormat.JSON: "application/json"}
+
+# Spreadsheets run a cell starting with any of these as a formula
+_FORMULA_PREFIXES = frozenset("=+-@\t\r")
+
+
+def _csv_cell(value: object) -> object:
+    """Escapes text that a spreadsheet would run as a formula, as members can write anything into an idea's fields."""
+    if isinstance(value, str) and value[:1] in _FORMULA_PREFIXES:
+        return "'" + value
+    return value
+
+
+async def _csv_chunks(
+    result: AsyncResult, construct: Callable[[Row], SchemaDict], schema: type[BaseSchema]
+) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(field.alias or name for name, field in schema.model_fields.items())
+    async for rows in result.partitions():
+        for values in to_jsonable_python([construct(row) for row in rows]):
+            writer.writerow([_csv_cell(value) for value in values.values()])
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+
+    if buffer.tell():
+        # The header, when there were no rows to follow it
+        yield buffer.getvalue().encode()
+
+
+async def _json_chunks(result: AsyncResult, construct: Callable[[Row], SchemaDict]) -> AsyncIterator[bytes]:
+    separator = b"["
+    async for rows in result.partitions():
+        # Each batch is serialized as one array, with its brackets swapped for the separator
+        yield separator + dump_json([construct(row) for row in rows])[1:-1]
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+def export_response(
+    result: AsyncResult,
+    construct: Callable[[Row], SchemaDict],
+    schema: type[BaseSchema],
+    export_format: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """Streams a download of the result's rows as schema dicts, a batch at a time, so memory use doesn't grow with it.
+
+    The result should be fetched with yield_per, which sets the size of the batches.
+    """
+    if export_format == ExportFormat.CSV:
+        chunks = _csv_chunks(result, construct, schema)
+    else:
+        chunks = _json_chunks(result, construct)
+
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
@@ -0,0 +1,132 @@
+import asyncio
+import contextlib
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from authlib.integrations.starlette_client import StarletteOAuth2App
+
+logger = logging.getLogger(__name__)
+
+
+class SharedAsyncTransport(httpx.AsyncBaseTransport):
+    """Keeps one connection pool alive across the short-lived httpx clients that authlib opens per call."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        # Called whenever an authlib client is closed, so the pool is only torn down by close()
+        pass
+
+    async def close(self) -> None:
+        await self._transport.aclose()
+
+
+class OIDCMetadataCache:
+    """Pre-loads an OIDC provider's discovery document and JWKS into an authlib client.
+
+    The metadata is persisted to disk so a restart does not need the provider to be reachable, refreshed in the
+    background once it is older than the TTL, and the last good copy keeps being served if a refresh fails.
+    """
+
+    def __init__(
+        self,
+        oauth_app: StarletteOAuth2App,
+        metadata_url: str,
+        cache_path: Path,
+        ttl_seconds: float,
+        transport: httpx.AsyncBaseTransport,
+        timeout_seconds: float = 5.0,
+        retry_interval_seconds: float = 60.0,
+    ) -> None:
+        self.oauth_app = oauth_app
+        self.metadata_url = metadata_url
+        self.cache_path = cache_path
+        self.ttl_seconds = ttl_seconds
+        self.retry_interval_seconds = retry_interval_seconds
+        self.fetched_at: float | None = None
+        self._transport = transport
+        self._timeout = httpx.Timeout(timeout_seconds)
+        self._refresh_task: asyncio.Task | None = None
+
+    @property
+    def is_expired(self) -> bool:
+        return self.fetched_at is None or time.time() - self.fetched_at >= self.ttl_seconds
+
+    async def fetch(self) -> dict[str, Any]:
+        async with httpx.AsyncClient(transport=self._transport, timeout=self._timeout) as client:
+            response = await client.get(self.metadata_url)
+            response.raise_for_status()
+            metadata = response.json()
+
+            response = await client.get(metadata["jwks_uri"])
+            response.raise_for_status()
+            metadata["jwks"] = response.json()
+
+        return metadata
+
+    async def refresh(self) -> None:
+        metadata = await self.fetch()
+        self._apply(metadata, time.time())
+        await asyncio.to_thread(self._write_cache_file, metadata)
+
+    async def load(self) -> None:
+        cached = await asyncio.to_thread(self._read_cache_file)
+        if cached is not None:
+            self._apply(*cached)
+
+        if not self.is_expired:
+            return
+
+        try:
+            await self.refresh()
+        except (httpx.HTTPError, KeyError, ValueError):
+            fallback = "it will be loaded on demand" if self.fetched_at is None else "serving the cached copy"
+            logger.exception("Could not refresh OIDC metadata from %s; %s", self.metadata_url, fallback)
+
+    async def start(self) -> None:
+        await self.load()
+        self._refresh_task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        if self._refresh_task is None:
+            return
+        self._refresh_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._refresh_task
+        self._refresh_task = None
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(0 if self.is_expired else self.ttl_seconds - (time.time() - self.fetched_at))
+
+            try:
+                await self.refresh()
+            except (httpx.HTTPError, KeyError, ValueError):
+                logger.exception("Could not refresh OIDC metadata from %s; serving the cached copy", self.metadata_url)
+                await asyncio.sleep(self.retry_interval_seconds)
+
+    def _apply(self, metadata: dict[str, Any], fetched_at: float) -> None:
+        # authlib skips its own lazy fetch once "_loaded_at" is present, and reuses "jwks" when it is set
+        self.oauth_app.server_metadata.update(metadata, _loaded_at=fetched_at)
+        self.fetched_at = fetched_at
+
+    def _read_cache_file(self) -> tuple[dict[str, Any], float] | None:
+        try:
+            cached = json.loads(self.cache_path.read_text())
+            return cached["metadata"], cached["fetched_at"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_cache_file(self, metadata: dict[str, Any]) -> None:
+        try:
+            self.cache_path.write_text(json.dumps({"metadata": metadata, "fetched_at": self.fetched_at}))
+        except OSError:
+            logger.exception("Could not persist OIDC metadata to %s", self.cache_path)
@@ -0,0 +1,54 @@
+import base64
+import json
+from collections.abc import Callable
+from typing import Annotated
+
+from fastapi import HTTPException, Query
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+PageLimit = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+CursorValue = int | str
+
+# Cursor ints are compared with BIGINT columns, which the drivers can't bind outside this range
+_MIN_CURSOR_INT = -(2**63)
+_MAX_CURSOR_INT = 2**63 - 1
+
+
+def encode_cursor(*values: CursorValue) -> str:
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+
+def _is_cursor_value(value: object, type_: type[CursorValue]) -> bool:
+    if type_ is int:
+        # bool is a subclass of int, but JSON's true and false aren't ids
+        return type(value) is int and _MIN_CURSOR_INT <= value <= _MAX_CURSOR_INT
+    return isinstance(value, type_)
+
+
+def decode_cursor(cursor: str, *types: type[CursorValue]) -> tuple[CursorValue, ...]:
+    """Decodes a cursor created by encode_cursor, checking it holds values of the given types."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+    if (
+        not isinstance(values, list)
+        or len(values) != len(types)
+        or not all(_is_cursor_value(value, type_) for value, type_ in zip(values, types, strict=True))
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+    return tuple(values)
+
+
+def paginate[T](
+    rows: list[T], limit: int, cursor_values: Callable[[T], tuple[CursorValue, ...]]
+) -> tuple[list[T], str | None]:
+    """Splits rows fetched with limit + 1 into the page and the cursor for the next page (if there is one)."""
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(*cursor_values(page[-1]))
@@ -0,0 +1,174 @@
+import logging
+import secrets
+from collections.abc import Awaitable
+from typing import Protocol
+
+from fastapi import Response
+from redis.asyncio import Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import NoBackoff
+from redis.exceptions import RedisError
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.schemas.shared import normalize_email
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCacheError(Exception):
+    pass
+
+
+class ResponseCacheBackend(Protocol):
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float, only_if_absent: bool = False) -> bool: ...
+
+    async def delete(self, *keys: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class MemoryResponseCacheBackend:
+    """Keeps entries in this process, so each worker has its own copy and only sees its own invalidations."""
+
+    def __init__(self, max_size: int, ttl_seconds: float) -> None:
+        self.entries: TTLCache[str, bytes] = TTLCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    async def get(self, key: str) -> bytes | None:
+        return self.entries.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float, only_if_absent: bool = False) -> bool:
+        if only_if_absent and self.entries.get(key) is not None:
+            return False
+        self.entries.set(key, value, ttl_seconds)
+        return True
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self.entries.invalidate(key)
+
+    async def close(self) -> None:
+        self.entries.clear()
+
+
+class RedisResponseCacheBackend:
+    """Shares the cache between workers through Redis, over a pool of connections.
+
+    LRU eviction is left to the server, which should be run with an LRU maxmemory-policy.
+    """
+
+    def __init__(self, url: str, timeout_seconds: float) -> None:
+        self.redis = Redis.from_url(
+            url,
+            socket_timeout=timeout_seconds,
+            socket_connect_timeout=timeout_seconds,
+            # A miss is cheaper than waiting on retries
+            retry=Retry(NoBackoff(), retries=0),
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._call(self.redis.get(key))
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float, only_if_absent: bool = False) -> bool:
+        return bool(await self._call(self.redis.set(key, value, px=max(int(ttl_seconds * 1000), 1), nx=only_if_absent)))
+
+    async def delete(self, *keys: str) -> None:
+        await self._call(self.redis.delete(*keys))
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+    async def _call[T](self, command: Awaitable[T]) -> T:
+        try:
+            return await command
+        except RedisError as e:
+            raise ResponseCacheError("Could not use the response cache") from e
+
+
+class ResponseCache:
+    """Serialized responses, grouped into scopes that a write invalidates all at once.
+
+    Keys include their scope's current version, a random token that invalidation discards. Entries stored before a
+    write can then never be read again and are left for the backend to evict. Look the key up before reading what is
+    to be cached, so a write that commits in between invalidates whatever gets stored under it.
+
+    Failures of the backend are logged and treated as misses, leaving entries that failed to be invalidated to expire.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend, ttl_seconds: float) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    async def key(self, scope: str, *parts: object) -> str | None:
+        """Returns None, which get() and set() ignore, if the backend is unavailable."""
+        version_key = f"{scope}:version"
+        try:
+            version = await self.backend.get(version_key)
+            if version is None:
+                version = secrets.token_hex(8).encode()
+                if not await self.backend.set(version_key, version, self.ttl_seconds, only_if_absent=True):
+                    # Another request set the version first
+                    version = await self.backend.get(version_key) or version
+        except ResponseCacheError:
+            logger.exception("Response cache unavailable")
+            return None
+
+        return ":".join([scope, version.decode(), *map(str, parts)])
+
+    async def get(self, key: str | None) -> bytes | None:
+        if key is None:
+            return None
+        return await self._call(self.backend.get(key))
+
+    async def set(self, key: str | None, value: bytes, ttl_seconds: float | None = None) -> None:
+        ttl_seconds = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        if key is not None and ttl_seconds > 0:
+            await self._call(self.backend.set(key, value, ttl_seconds))
+
+    async def invalidate(self, *scopes: str) -> None:
+        if scopes:
+            await self._call(self.backend.delete(*(f"{scope}:version" for scope in scopes)))
+
+    async def close(self) -> None:
+        await self.backend.close()
+
+    async def _call[T](self, operation: Awaitable[T]) -> T | None:
+        try:
+            return await operation
+        except ResponseCacheError:
+            logger.exception("Response cache unavailable")
+            return None
+
+
+def create_response_cache_backend() -> ResponseCacheBackend:
+    if settings.response_cache_url:
+        return RedisResponseCacheBackend(settings.response_cache_url, settings.response_cache_timeout_seconds)
+    return MemoryResponseCacheBackend(settings.response_cache_max_size, settings.response_cache_ttl_seconds)
+
+
+response_cache = ResponseCache(create_response_cache_backend(), settings.response_cache_ttl_seconds)
+
+
+def cached_json_response(body: bytes, etag: str | None = None) -> Response:
+    return Response(body, media_type="application/json", headers={"ETag": etag} if etag else None)
+
+
+def travel_idea_group_scope(travel_idea_group_id: int) -> str:
+    """Covers everything cached about the group that its members can read."""
+    return f"travel-idea-group:{travel_idea_group_id}"
+
+
+def invitations_scope(email: str) -> str:
+    return f"invitations:{normalize_email(email)}"
+
+
+async def invalidate_travel_idea_group(*travel_idea_group_ids: int) -> None:
+    await response_cache.invalidate(
+        *(travel_idea_group_scope(travel_idea_group_id) for travel_idea_group_id in travel_idea_group_ids)
+    )
+
+
+async def invalidate_invitations(*emails: str) -> None:
+    await response_cache.invalidate(*(invitations_scope(email) for email in emails))
@@ -0,0 +1,52 @@
+from collections.abc import AsyncIterable, AsyncIterator, Callable
+from typing import Annotated
+
+from fastapi import Header, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+from app.schemas.shared import SchemaDict
+
+type SchemaContent = BaseModel | SchemaDict | list[BaseModel] | list[SchemaDict]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+Accept = Annotated[str | None, Header()]
+
+
+def dump_json(content: SchemaContent) -> bytes:
+    """Serializes response schemas or their dicts, or lists of them, with pydantic-core rather than validating them."""
+    return to_json(content, by_alias=True)
+
+
+class SchemaJSONResponse(Response):
+    """For returning schema dicts built from trusted data, or schemas.
+
+    FastAPI would otherwise re-validate the content against the route's response_model before encoding it.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: SchemaContent) -> bytes:
+        return dump_json(content)
+
+
+def accepts_ndjson(accept: str | None) -> bool:
+    """Streaming is opt-in, so only an Accept header that names NDJSON selects it, not a wildcard."""
+    if not accept:
+        return False
+    return any(media_range.split(";")[0].strip() == NDJSON_MEDIA_TYPE for media_range in accept.split(","))
+
+
+def ndjson_response[T](rows: AsyncIterable[T], construct: Callable[[T], SchemaDict]) -> StreamingResponse:
+    """Streams a schema dict per row, one JSON document to a line, serializing each as it is fetched.
+
+    Check access before returning it, as the status code is sent with the first line.
+    """
+
+    async def lines() -> AsyncIterator[bytes]:
+        async for row in rows:
+            yield dump_json(construct(row)) + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
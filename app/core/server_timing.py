@@ -0,0 +1,48 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database.instrumentation import track_queries
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """Reports how many statements a request executed and the time they took in a Server-Timing header.
+
+    The header is sent before the body, so it leaves out the statements of a streamed body; the debug log written
+    once the response is complete includes them.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        with track_queries() as stats:
+
+            async def send_with_server_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration_seconds * 1000:.1f};desc="{stats.count} queries", '
+                        f"app;dur={(time.perf_counter() - started_at) * 1000:.1f}",
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_server_timing)
+
+        logger.debug(
+            "%s %s executed %d queries in %.1f ms",
+            scope["method"],
+            scope["path"],
+            stats.count,
+            stats.duration_seconds * 1000,
+        )
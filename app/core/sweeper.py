@@ -0,0 +1,72 @@
+import asyncio
+import contextlib
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.database.dialect import try_advisory_xact_lock
+from app.database.init_db import SessionLocal
+from app.services.travel_idea_group_invitation import delete_dead_travel_idea_group_invitations
+
+logger = logging.getLogger(__name__)
+
+# Arbitrary, but must stay the same across every worker sharing the database
+INVITATION_SWEEPER_LOCK_KEY = 72_617_001
+
+
+class InvitationSweeper:
+    """Periodically deletes invitations that can no longer be acted on, one bounded batch per transaction.
+
+    Each batch takes an advisory lock, so when several workers run a sweeper only one of them deletes at a time and
+    the rest skip that round.
+    """
+
+    def __init__(
+        self, session_factory: async_sessionmaker[AsyncSession], interval_seconds: float, batch_size: int
+    ) -> None:
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._sweep_task: asyncio.Task | None = None
+
+    async def sweep(self) -> int:
+        deleted = 0
+        while True:
+            async with self.session_factory() as db:
+                if not await try_advisory_xact_lock(db, INVITATION_SWEEPER_LOCK_KEY):
+                    return deleted
+                batch_deleted = await delete_dead_travel_idea_group_invitations(db, self.batch_size)
+                await db.commit()
+
+            deleted += batch_deleted
+            if batch_deleted < self.batch_size:
+                return deleted
+
+    async def start(self) -> None:
+        self._sweep_task = asyncio.create_task(self._sweep_periodically())
+
+    async def stop(self) -> None:
+        if self._sweep_task is None:
+            return
+        self._sweep_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._sweep_task
+        self._sweep_task = None
+
+    async def _sweep_periodically(self) -> None:
+        while True:
+            try:
+                deleted = await self.sweep()
+                logger.info("Deleted %d expired or accepted invitations", deleted)
+            except Exception:
+                # Whatever went wrong, the next round may succeed, so it mustn't end the task. Cancellation isn't an
+                # Exception, so stop() still ends it
+                logger.exception("Could not delete expired or accepted invitations")
+
+            await asyncio.sleep(self.interval_seconds)
+
+
+invitation_sweeper = InvitationSweeper(
+    SessionLocal, settings.invitation_sweep_interval_seconds, settings.invitation_sweep_batch_size
+)
@@ -0,0 +1,185 @@
+import codecs
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator
+from itertools import islice
+
+from fastapi import HTTPException, UploadFile
+from pydantic import BaseModel, ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from app.schemas.shared import ImportRowError
+
+CHUNK_SIZE = 64 * 1024
+
+# The longest JSON token that fails to decode, rather than decoding short, when it's cut off
+_PARTIAL_TOKEN_LENGTH = len("-Infinity")
+
+# A batch of records read from an upload, each with its 1-based position in the file
+type RecordBatch = list[tuple[int, object]]
+
+
+def _invalid_upload(kind: str, reason: object) -> HTTPException:
+    return HTTPException(status_code=400, detail=f"Invalid {kind} file: {reason}")
+
+
+async def read_csv_records(upload: UploadFile, batch_size: int) -> AsyncIterator[RecordBatch]:
+    """Reads the rows of a CSV file with a header row as dicts, a batch at a time.
+
+    Rows are numbered from the first after the header.
+    """
+    text = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+    reader = csv.DictReader(text)
+    row = 0
+    try:
+        # The upload may have been spooled to disk, so it's read in a thread
+        while records := await run_in_threadpool(lambda: list(islice(reader, batch_size))):
+            yield [(row := row + 1, record) for record in records]
+    except (csv.Error, UnicodeDecodeError) as e:
+        raise _invalid_upload("CSV", e) from e
+    finally:
+        # Leaves the upload to be closed with the request rather than when the wrapper is collected
+        text.detach()
+
+
+class _JSONReader:
+    """Decodes a JSON document a value at a time from an upload, holding no more of it than the current value."""
+
+    def __init__(self, upload: UploadFile) -> None:
+        self.upload = upload
+        self.decoder = json.JSONDecoder()
+        self.text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    async def _fill(self, size: int) -> None:
+        chunk = await self.upload.read(size)
+        self.eof = not chunk
+        self.buffer = self.buffer[self.position :] + self.text_decoder.decode(chunk, final=self.eof)
+        self.position = 0
+
+    async def peek(self) -> str:
+        """Returns the next character that isn't whitespace without consuming it, or an empty string at the end."""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in " \t\n\r":
+                self.position += 1
+            if self.position < len(self.buffer) or self.eof:
+                return self.buffer[self.position : self.position + 1]
+            await self._fill(CHUNK_SIZE)
+
+    async def expect(self, *characters: str) -> str:
+        character = await self.peek()
+        if character not in characters:
+            expected = " or ".join(repr(c) for c in characters)
+            raise ValueError(f"Expected {expected} but found {character!r}" if character else f"Expected {expected}")
+        self.position += 1
+        return character
+
+    def _decode(self) -> tuple[object, int] | None:
+        """Decodes the value at the current position, or returns None if it may continue past the end of the buffer."""
+        try:
+            value, end = self.decoder.raw_decode(self.buffer, self.position)
+        except json.JSONDecodeError as e:
+            # Only a string without its closing quote, or a token cut off at the end, can be completed by reading more
+            cut_off = e.msg.startswith("Unterminated string") or e.pos >= len(self.buffer) - _PARTIAL_TOKEN_LENGTH
+            if self.eof or not cut_off:
+                raise
+            return None
+
+        # A number running up to the end of the buffer may continue in the next chunk
+        if end == len(self.buffer) and not self.eof:
+            return None
+        return value, end
+
+    async def value(self) -> object:
+        await self.peek()
+        decoded = self._decode()
+        read_size = CHUNK_SIZE
+        while decoded is None:
+            # Each attempt decodes the value from its start, so the reads double to keep a large value from being
+            # decoded once per chunk, and the larger decodes run in a thread to keep them off the event loop
+            await self._fill(read_size)
+            read_size *= 2
+            decoded = await run_in_threadpool(self._decode)
+        value, self.position = decoded
+        return value
+
+
+async def _read_features(reader: _JSONReader) -> AsyncIterator[object]:
+    await reader.expect("{")
+    if await reader.peek() == "}":
+        await reader.expect("}")
+        return
+
+    while True:
+        key = await reader.value()
+        await reader.expect(":")
+        if key == "features":
+            await reader.expect("[")
+            if await reader.peek() == "]":
+                await reader.expect("]")
+            else:
+                while True:
+                    yield await reader.value()
+                    if await reader.expect(",", "]") == "]":
+                        break
+        else:
+            value = await reader.value()
+            if key == "type" and value != "FeatureCollection":
+                raise ValueError("Expected a FeatureCollection")
+
+        if await reader.expect(",", "}") == "}":
+            return
+
+
+async def read_geojson_records(upload: UploadFile, batch_size: int) -> AsyncIterator[RecordBatch]:
+    """Reads the properties of each feature of a GeoJSON FeatureCollection, a batch at a time.
+
+    Features are numbered from the first, and their geometry is ignored.
+    """
+    reader = _JSONReader(upload)
+    batch: RecordBatch = []
+    row = 0
+    try:
+        async for feature in _read_features(reader):
+            row += 1
+            batch.append((row, (feature.get("properties") or {}) if isinstance(feature, dict) else feature))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if await reader.peek():
+            raise ValueError("Unexpected data after the FeatureCollection")
+    except (ValueError, UnicodeDecodeError) as e:
+        raise _invalid_upload("GeoJSON", e) from e
+
+    if batch:
+        yield batch
+
+
+class RecordValidator[T: BaseModel]:
+    """Validates batches of records against a schema, keeping the first max_errors rows' errors for a report."""
+
+    def __init__(self, schema: type[T], max_errors: int) -> None:
+        self.schema = schema
+        self.max_errors = max_errors
+        self.failed = 0
+        self.errors: list[ImportRowError] = []
+
+    async def valid_batches(self, batches: AsyncIterable[RecordBatch]) -> AsyncIterator[list[T]]:
+        async for batch in batches:
+            valid = []
+            for row, record in batch:
+                try:
+                    valid.append(self.schema.model_validate(record))
+                except ValidationError as e:
+                    self.failed += 1
+                    if len(self.errors) < self.max_errors:
+                        self.errors.append(
+                            ImportRowError(
+                                row=row, errors=e.errors(include_url=False, include_context=False, include_input=False)
+                            )
+                        )
+            if valid:
+                yield valid
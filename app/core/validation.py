@@ -1,35 +1,65 @@
+from typing import NoReturn
+
 from fastapi import HTTPException
+from sqlalchemy import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.travel_idea import TravelIdea
 from app.models.travel_idea_group import TravelIdeaGroup
 from app.models.user_account import UserAccount
 from app.schemas.enums import TravelIdeaGroupRole
-from app.services.travel_idea import get_travel_idea_by_id
+from app.services.travel_idea import get_travel_idea_with_access
 from app.services.travel_idea_group import (
+    get_travel_idea_group_access,
     get_travel_idea_group_by_id,
 )
 
 
+def _check_role(role: TravelIdeaGroupRole | None, required_access_level: TravelIdeaGroupRole) -> None:
+    if required_access_level == TravelIdeaGroupRole.OWNER and role != TravelIdeaGroupRole.OWNER:
+        raise HTTPException(status_code=403, detail="Not authorised to perform this action")
+
+    if required_access_level == TravelIdeaGroupRole.MEMBER and role is None:
+        raise HTTPException(status_code=403, detail="Not authorised to access this travel idea group")
+
+
+async def check_user_role_in_travel_idea_group(
+    db_session: AsyncSession,
+    travel_idea_group_id: int,
+    user: UserAccount,
+    required_access_level: TravelIdeaGroupRole,
+) -> Row:
+    """Checks access with a single EXISTS query, for routes that don't need the group's members.
+
+    Returns the user's role along with the group's version.
+    """
+    access = await get_travel_idea_group_access(db_session, travel_idea_group_id, user.id)
+    if access is None:
+        raise HTTPException(status_code=404, detail="Travel idea group not found")
+
+    _check_role(access.role, required_access_level)
+    return access
+
+
 async def check_user_can_access_travel_idea_group(
     db_session: AsyncSession,
     travel_idea_group_id: int,
     user: UserAccount,
     required_access_level: TravelIdeaGroupRole,
-    load_travel_ideas: bool = False,
 ) -> tuple[TravelIdeaGroup, list[UserAccount], UserAccount]:
-    travel_idea_group = await get_travel_idea_group_by_id(db_session, travel_idea_group_id, load_travel_ideas)
+    travel_idea_group = await get_travel_idea_group_by_id(db_session, travel_idea_group_id)
     if travel_idea_group is None:
         raise HTTPException(status_code=404, detail="Travel idea group not found")
 
     members = [member.user_account for member in travel_idea_group.members]
     owner = travel_idea_group.owned_by
 
-    if required_access_level == TravelIdeaGroupRole.OWNER and user != owner:
-        raise HTTPException(status_code=403, detail="Not authorised to perform this action")
-
-    if required_access_level == TravelIdeaGroupRole.MEMBER and user not in members and user != owner:
-        raise HTTPException(status_code=403, detail="Not authorised to access this travel idea group")
+    if user == owner:
+        role = TravelIdeaGroupRole.OWNER
+    elif user in members:
+        role = TravelIdeaGroupRole.MEMBER
+    else:
+        role = None
+    _check_role(role, required_access_level)
 
     return travel_idea_group, members, owner
 
@@ -39,11 +69,27 @@ async def check_user_can_access_travel_idea(
     travel_idea_group_id: int,
     travel_idea_id: int,
     user: UserAccount,
-) -> TravelIdea:
-    await check_user_can_access_travel_idea_group(db_session, travel_idea_group_id, user, TravelIdeaGroupRole.MEMBER)
+) -> Row:
+    """Returns the travel idea along with the user's role and the group's version."""
+    access = await get_travel_idea_with_access(db_session, travel_idea_group_id, travel_idea_id, user.id)
+    if access is None:
+        raise HTTPException(status_code=404, detail="Travel idea group not found")
+
+    _check_role(access.role, TravelIdeaGroupRole.MEMBER)
 
-    travel_idea = await get_travel_idea_by_id(db_session, travel_idea_id)
-    if travel_idea is None:
+    if access.TravelIdea is None:
         raise HTTPException(status_code=404, detail="Travel idea not found")
 
-    return travel_idea
+    return access
+
+
+async def raise_travel_idea_access_error(
+    db_session: AsyncSession,
+    travel_idea_group_id: int,
+    travel_idea_id: int,
+    user: UserAccount,
+) -> NoReturn:
+    """Reports why a write guarded by group membership matched no travel idea."""
+    await check_user_can_access_travel_idea(db_session, travel_idea_group_id, travel_idea_id, user)
+    # Only reachable if the idea was deleted after the write
+    raise HTTPException(status_code=404, detail="Travel idea not found")
@@ -1,8 +1,9 @@
 from typing import Annotated
 
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.database.init_db import get_db
+from app.database.init_db import get_db, get_session_factory
 
 DBSession = Annotated[AsyncSession, Depends(get_db)]
+SessionFactory = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
@@ -0,0 +1,22 @@
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.init_db import Base
+
+
+def dialect_insert(db: AsyncSession, model: type[Base]) -> postgresql.Insert | sqlite.Insert:
+    """Returns an INSERT for the session's backend that supports ON CONFLICT clauses."""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+
+async def try_advisory_xact_lock(db: AsyncSession, key: int) -> bool:
+    """Takes an advisory lock held until the transaction ends, returning False if another session already holds it.
+
+    Only Postgres has advisory locks; elsewhere there is a single process, so the lock is always granted.
+    """
+    if db.get_bind().dialect.name != "postgresql":
+        return True
+    return await db.scalar(select(func.pg_try_advisory_xact_lock(key)))
@@ -3,13 +3,31 @@ from collections.abc import AsyncGenerator
 
 from alembic import command
 from alembic.config import Config
-from sqlalchemy import MetaData
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import MetaData, event
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from app.core.config import settings
+from app.database.instrumentation import instrument_engine
+
+
+def enable_sqlite_foreign_keys(engine: AsyncEngine) -> None:
+    """SQLite only enforces foreign keys, and so ON DELETE CASCADE, when it is switched on for each connection."""
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_foreign_keys_pragma(dbapi_connection: DBAPIConnection, connection_record: ConnectionPoolEntry) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 
 engine = create_async_engine(settings.database_url)
+enable_sqlite_foreign_keys(engine)
+instrument_engine(engine)
 
 SessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False, class_=AsyncSession)
 
@@ -33,3 +51,8 @@ async def run_migrations() -> None:
 async def get_db() -> AsyncGenerator[AsyncSession]:
     async with SessionLocal() as session:
         yield session
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """For work that outlives the request, such as background tasks, and so needs sessions of its own."""
+    return SessionLocal
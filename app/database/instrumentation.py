@@ -0,0 +1,67 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryStats:
+    """How many statements were executed while it was being tracked, and the time spent waiting for the database.
+
+    Rows fetched after a statement returns, such as those streamed with yield_per, aren't included in the time. The
+    statements' SQL is only kept when asked for, as it can be large and isn't needed outside of tests.
+    """
+
+    def __init__(self, record_statements: bool = False) -> None:
+        self.count = 0
+        self.duration_seconds = 0.0
+        self.statements: list[str] | None = [] if record_statements else None
+
+
+# Every QueryStats being tracked in the current context, as tracking can be nested
+_tracked: ContextVar[tuple[QueryStats, ...]] = ContextVar("tracked_query_stats", default=())
+
+
+@contextmanager
+def track_queries(record_statements: bool = False) -> Iterator[QueryStats]:
+    """Attributes the statements executed in the current context, such as a request, to the QueryStats it yields."""
+    stats = QueryStats(record_statements)
+    token = _tracked.set((*_tracked.get(), stats))
+    try:
+        yield stats
+    finally:
+        _tracked.reset(token)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: object,
+        statement: str,
+        parameters: object,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        # Overwritten rather than stacked, as a connection runs one statement at a time and a statement that fails
+        # doesn't reach after_cursor_execute
+        conn.info["query_started_at"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Connection,
+        cursor: object,
+        statement: str,
+        parameters: object,
+        context: ExecutionContext | None,
+        executemany: bool,
+    ) -> None:
+        duration_seconds = time.perf_counter() - conn.info["query_started_at"]
+        for stats in _tracked.get():
+            stats.count += 1
+            stats.duration_seconds += duration_seconds
+            if stats.statements is not None:
+                stats.statements.append(statement)
@@ -16,7 +16,11 @@ from app.api.routes import (
 from app.api.routes import (
     travel_idea_group_invitation as travel_idea_group_invitation_router,
 )
+from app.core.auth import google_metadata_cache, oauth_http_transport
 from app.core.config import settings
+from app.core.response_cache import response_cache
+from app.core.server_timing import ServerTimingMiddleware
+from app.core.sweeper import invitation_sweeper
 from app.database.dependencies import DBSession
 from app.database.init_db import run_migrations
 from app.services.user_account import get_user_by_email
@@ -28,12 +32,22 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     print("Run Alembic upgrade head...")
     await run_migrations()
     print("Migrations successful!")
+    print("Loading Google OIDC metadata...")
+    await google_metadata_cache.start()
+    print("Starting invitation sweeper...")
+    await invitation_sweeper.start()
     yield
     print("Application shutting down!")
+    await invitation_sweeper.stop()
+    await google_metadata_cache.stop()
+    await oauth_http_transport.close()
+    await response_cache.close()
 
 
 app = FastAPI(lifespan=lifespan)
 app.add_middleware(SessionMiddleware, secret_key=settings.secret_key)
+if settings.server_timing_enabled:
+    app.add_middleware(ServerTimingMiddleware)
 app.include_router(auth_router.router)
 app.include_router(travel_idea_router.router)
 app.include_router(travel_idea_group_router.router)
@@ -1,10 +1,11 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, ForeignKey, String, func
+from sqlalchemy import DateTime, ForeignKey, String, and_, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.init_db import Base
+from app.schemas.enums import TravelIdeaGroupRole
 
 from .travel_idea_group_member import TravelIdeaGroupMember
 from .user_account import UserAccount
@@ -20,18 +21,37 @@ class TravelIdeaGroup(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     name: Mapped[str] = mapped_column(String(50), nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    owned_by_id: Mapped[int] = mapped_column(ForeignKey("user_account.id"), nullable=False)
+    owned_by_id: Mapped[int] = mapped_column(ForeignKey("user_account.id"), nullable=False, index=True)
+    # Bumped by every write to the group or its travel ideas, members or invitations
+    version: Mapped[int] = mapped_column(nullable=False, default=1, server_default="1")
 
     owned_by: Mapped[UserAccount] = relationship("UserAccount")
-    members: Mapped[list[TravelIdeaGroupMember]] = relationship(
+    # Every user with access to the group, including the owner
+    memberships: Mapped[list[TravelIdeaGroupMember]] = relationship(
         "TravelIdeaGroupMember",
         back_populates="travel_idea_group",
         order_by="TravelIdeaGroupMember.id",
         cascade="all, delete",
+        passive_deletes=True,
     )
+    # The users the group has been shared with, excluding the owner
+    members: Mapped[list[TravelIdeaGroupMember]] = relationship(
+        "TravelIdeaGroupMember",
+        primaryjoin=lambda: and_(
+            TravelIdeaGroup.id == TravelIdeaGroupMember.travel_idea_group_id,
+            TravelIdeaGroupMember.role == TravelIdeaGroupRole.MEMBER,
+        ),
+        order_by="TravelIdeaGroupMember.id",
+        viewonly=True,
+    )
+    # The foreign keys cascade deletes, so deleting a group doesn't need to load these first
     invitations: Mapped[list["TravelIdeaGroupInvitation"]] = relationship(
-        "TravelIdeaGroupInvitation", back_populates="travel_idea_group", cascade="all, delete"
+        "TravelIdeaGroupInvitation", back_populates="travel_idea_group", cascade="all, delete", passive_deletes=True
     )
     travel_ideas: Mapped[list["TravelIdea"]] = relationship(
-        "TravelIdea", back_populates="travel_idea_group", order_by="TravelIdea.id", cascade="all, delete"
+        "TravelIdea",
+        back_populates="travel_idea_group",
+        order_by="TravelIdea.id",
+        cascade="all, delete",
+        passive_deletes=True,
     )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, func
+from sqlalchemy import DateTime, Enum, ForeignKey, Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.init_db import Base
@@ -8,14 +8,30 @@ from app.schemas.enums import TravelIdeaGroupInvitationStatus
 
 from .travel_idea_group import TravelIdeaGroup
 from .user_account import UserAccount
-
-
-def get_enum_values(enum_class: type[Enum]) -> list[str]:
-    return [member.value for member in enum_class]
+from .utils import get_enum_values
 
 
 class TravelIdeaGroupInvitation(Base):
     __tablename__ = "travel_idea_group_invitation"
+    __table_args__ = (
+        Index(None, "travel_idea_group_id", "status"),
+        # Only pending invitations are ever looked up by email, so the index skips the rest
+        Index(
+            "ix_travel_idea_group_invitation_pending_email",
+            text("lower(email)"),
+            "expires_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+        # Lets the sweeper find dead invitations without reading live ones
+        Index(None, "expires_at"),
+        Index(
+            "ix_travel_idea_group_invitation_accepted",
+            "status",
+            postgresql_where=text("status = 'accepted'"),
+            sqlite_where=text("status = 'accepted'"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     email: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -25,8 +41,10 @@ class TravelIdeaGroupInvitation(Base):
     )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
-    created_by_id: Mapped[int] = mapped_column(ForeignKey("user_account.id"), nullable=False)
-    travel_idea_group_id: Mapped[int] = mapped_column(ForeignKey("travel_idea_group.id"), nullable=False)
+    created_by_id: Mapped[int] = mapped_column(ForeignKey("user_account.id"), nullable=False, index=True)
+    travel_idea_group_id: Mapped[int] = mapped_column(
+        ForeignKey("travel_idea_group.id", ondelete="CASCADE"), nullable=False
+    )
 
     created_by: Mapped[UserAccount] = relationship("UserAccount")
     travel_idea_group: Mapped[TravelIdeaGroup] = relationship("TravelIdeaGroup")
@@ -1,11 +1,13 @@
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import Enum, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.init_db import Base
+from app.schemas.enums import TravelIdeaGroupRole
 
 from .user_account import UserAccount
+from .utils import get_enum_values
 
 if TYPE_CHECKING:
     from .travel_idea_group import TravelIdeaGroup
@@ -13,10 +15,23 @@ if TYPE_CHECKING:
 
 class TravelIdeaGroupMember(Base):
     __tablename__ = "travel_idea_group_member"
+    # The unique constraint also serves lookups by user; the index serves lookups of a group's members by role
+    __table_args__ = (
+        UniqueConstraint("user_account_id", "travel_idea_group_id"),
+        Index(None, "travel_idea_group_id", "role"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     user_account_id: Mapped[int] = mapped_column(ForeignKey("user_account.id"), nullable=False)
-    travel_idea_group_id: Mapped[int] = mapped_column(ForeignKey("travel_idea_group.id"), nullable=False)
+    travel_idea_group_id: Mapped[int] = mapped_column(
+        ForeignKey("travel_idea_group.id", ondelete="CASCADE"), nullable=False
+    )
+    role: Mapped[TravelIdeaGroupRole] = mapped_column(
+        Enum(TravelIdeaGroupRole, values_callable=get_enum_values),
+        nullable=False,
+        default=TravelIdeaGroupRole.MEMBER,
+        server_default=TravelIdeaGroupRole.MEMBER.value,
+    )
 
     user_account: Mapped[UserAccount] = relationship("UserAccount")
-    travel_idea_group: Mapped["TravelIdeaGroup"] = relationship("TravelIdeaGroup")
+    travel_idea_group: Mapped["TravelIdeaGroup"] = relationship("TravelIdeaGroup", back_populates="memberships")
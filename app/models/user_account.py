@@ -1,4 +1,4 @@
-from sqlalchemy import String
+from sqlalchemy import Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database.init_db import Base
@@ -8,5 +8,10 @@ class UserAccount(Base):
     __tablename__ = "user_account"
 
     id: Mapped[int] = mapped_column(primary_key=True)
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
+    version: Mapped[int] = mapped_column(nullable=False, default=1, server_default="1")
+
+
+# Emails are stored normalised, but uniqueness and lookups go through lower(email) so they are case-insensitive
+Index("ix_user_account_lower_email", func.lower(UserAccount.email), unique=True)
@@ -0,0 +1,5 @@
+from enum import Enum
+
+
+def get_enum_values(enum_class: type[Enum]) -> list[str]:
+    return [member.value for member in enum_class]
@@ -19,3 +19,13 @@ class TravelIdeaGroupInvitationStatus(Enum):
 class TravelIdeaGroupRole(Enum):
     OWNER = "owner"
     MEMBER = "member"
+
+
+class ExportFormat(Enum):
+    CSV = "csv"
+    JSON = "json"
+
+
+class ImportFormat(Enum):
+    CSV = "csv"
+    GEOJSON = "geojson"
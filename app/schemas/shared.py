@@ -1,9 +1,21 @@
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import AfterValidator, BaseModel, ConfigDict, EmailStr, field_validator
 from pydantic.alias_generators import to_camel
 
 
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+NormalizedEmail = Annotated[EmailStr, AfterValidator(normalize_email)]
+
+# The JSON form of a read schema, keyed by its fields' aliases. Responses are built from these rather than the schemas
+# when the data is already known to be valid, such as rows read from the database, as constructing a schema instance
+# costs more than validating one
+type SchemaDict = dict[str, object]
+
+
 class BaseSchema(BaseModel):
     model_config = ConfigDict(
         alias_generator=to_camel,
@@ -21,3 +33,17 @@ class BaseSchema(BaseModel):
         if isinstance(v, str) and v == "":
             return None
         return v
+
+
+class Page[T](BaseSchema):
+    items: list[T]
+    next_cursor: str | None
+
+
+def construct_page(items: list[SchemaDict], next_cursor: str | None) -> SchemaDict:
+    return {"items": items, "nextCursor": next_cursor}
+
+
+class ImportRowError(BaseSchema):
+    row: int
+    errors: list[dict[str, Any]]
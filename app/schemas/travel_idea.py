@@ -1,21 +1,32 @@
-from pydantic import field_validator
+from datetime import datetime
+from typing import Annotated
 
-from app.schemas.shared import BaseSchema
+from pydantic import Field, field_validator
+from sqlalchemy import Row
+
+from app.models.travel_idea import TravelIdea
+from app.schemas.shared import BaseSchema, ImportRowError, SchemaDict
 
 
 class TravelIdeaBase(BaseSchema):
-    name: str
-    notes: str | None = None
-    image_url: str
+    # Limited to the lengths of the columns, which Postgres would otherwise reject the insert for
+    name: Annotated[str, Field(max_length=50)]
+    notes: Annotated[str | None, Field(max_length=750)] = None
+    image_url: Annotated[str, Field(max_length=255)]
 
 
 class TravelIdeaCreate(TravelIdeaBase):
     pass
 
 
+MAX_BULK_CREATE_SIZE = 500
+
+TravelIdeaBulkCreate = Annotated[list[TravelIdeaCreate], Field(min_length=1, max_length=MAX_BULK_CREATE_SIZE)]
+
+
 class TravelIdeaUpdate(TravelIdeaBase):
-    name: str | None = None
-    image_url: str | None = None
+    name: Annotated[str | None, Field(max_length=50)] = None
+    image_url: Annotated[str | None, Field(max_length=255)] = None
 
     @field_validator("name", "image_url", mode="after")
     @classmethod
@@ -25,5 +36,42 @@ class TravelIdeaUpdate(TravelIdeaBase):
         return v
 
 
+class TravelIdeaImportRead(BaseSchema):
+    imported: int
+    failed: int
+    # Only the first MAX_IMPORT_ERRORS failed rows are reported
+    errors: list[ImportRowError]
+
+
+MAX_IMPORT_ERRORS = 1000
+
+
 class TravelIdeaRead(TravelIdeaBase):
     id: int
+
+
+def construct_travel_idea(travel_idea: TravelIdea) -> SchemaDict:
+    # Skips validation, as the data has come from the database
+    return {
+        "name": travel_idea.name,
+        "notes": travel_idea.notes,
+        "imageUrl": travel_idea.image_url,
+        "id": travel_idea.id,
+    }
+
+
+class TravelIdeaExport(TravelIdeaRead):
+    created_at: datetime
+    created_by_name: str
+
+
+def construct_travel_idea_export(row: Row) -> SchemaDict:
+    # In the order of TravelIdeaExport's fields, which the CSV export's columns follow
+    return {
+        "name": row.name,
+        "notes": row.notes,
+        "imageUrl": row.image_url,
+        "id": row.id,
+        "createdAt": row.created_at,
+        "createdByName": row.created_by_name,
+    }
@@ -1,6 +1,6 @@
 from app.models.travel_idea_group import TravelIdeaGroup
 from app.models.user_account import UserAccount
-from app.schemas.shared import BaseSchema
+from app.schemas.shared import BaseSchema, SchemaDict
 
 
 class TravelIdeaGroupUser(BaseSchema):
@@ -26,18 +26,36 @@ class TravelIdeaGroupRead(TravelIdeaGroupBase):
     shared_with: list[TravelIdeaGroupUser]
 
 
+class TravelIdeaGroupSummary(TravelIdeaGroupBase):
+    id: int
+    owned_by: TravelIdeaGroupUser
+    member_count: int
+
+
+# These skip validation, as the data has come from the database
+def construct_travel_idea_group_user(user_account: UserAccount) -> SchemaDict:
+    return {"email": user_account.email, "name": user_account.name}
+
+
 def construct_travel_idea_group(
     travel_idea_group: TravelIdeaGroup,
     members_user_accounts: list[UserAccount] | None = None,
-) -> TravelIdeaGroupRead:
+) -> SchemaDict:
     if members_user_accounts is None:
         members_user_accounts = [member.user_account for member in travel_idea_group.members]
 
-    shared_with = [
-        TravelIdeaGroupUser(email=user_account.email, name=user_account.name) for user_account in members_user_accounts
-    ]
-    owned_by = TravelIdeaGroupUser(email=travel_idea_group.owned_by.email, name=travel_idea_group.owned_by.name)
-
-    return TravelIdeaGroupRead(
-        id=travel_idea_group.id, name=travel_idea_group.name, shared_with=shared_with, owned_by=owned_by
-    )
+    return {
+        "name": travel_idea_group.name,
+        "id": travel_idea_group.id,
+        "ownedBy": construct_travel_idea_group_user(travel_idea_group.owned_by),
+        "sharedWith": [construct_travel_idea_group_user(user_account) for user_account in members_user_accounts],
+    }
+
+
+def construct_travel_idea_group_summary(travel_idea_group: TravelIdeaGroup, member_count: int) -> SchemaDict:
+    return {
+        "name": travel_idea_group.name,
+        "id": travel_idea_group.id,
+        "ownedBy": construct_travel_idea_group_user(travel_idea_group.owned_by),
+        "memberCount": member_count,
+    }
@@ -1,24 +1,49 @@
-from pydantic import EmailStr
+from typing import Annotated
 
+from pydantic import Field
+
+from app.models.travel_idea_group_invitation import TravelIdeaGroupInvitation
 from app.schemas.enums import TravelIdeaGroupInvitationResponseStatus, TravelIdeaGroupInvitationStatus
-from app.schemas.shared import BaseSchema
-from app.schemas.travel_idea_group import TravelIdeaGroupUser
+from app.schemas.shared import BaseSchema, NormalizedEmail, SchemaDict
+from app.schemas.travel_idea_group import TravelIdeaGroupUser, construct_travel_idea_group_user
 
 
 class TravelIdeaGroupInvitationCreate(BaseSchema):
-    email: EmailStr
+    email: NormalizedEmail
 
 
 class TravelIdeaGroupInvitationDelete(TravelIdeaGroupInvitationCreate):
     pass
 
 
+MAX_BULK_INVITATION_SIZE = 100
+
+
+class TravelIdeaGroupInvitationBulkCreate(BaseSchema):
+    emails: Annotated[list[NormalizedEmail], Field(min_length=1, max_length=MAX_BULK_INVITATION_SIZE)]
+
+
+class TravelIdeaGroupInvitationBulkCreateRead(BaseSchema):
+    invited: list[str]
+    already_members: list[str]
+    already_invited: list[str]
+
+
 class TravelIdeaGroupInvitationRead(BaseSchema):
     invitation_code: str
     travel_idea_group_name: str
     invited_by: TravelIdeaGroupUser
 
 
+def construct_travel_idea_group_invitation(invitation: TravelIdeaGroupInvitation) -> SchemaDict:
+    # Skips validation, as the data has come from the database
+    return {
+        "invitationCode": invitation.invitation_code,
+        "travelIdeaGroupName": invitation.travel_idea_group.name,
+        "invitedBy": construct_travel_idea_group_user(invitation.created_by),
+    }
+
+
 class TravelIdeaGroupInvitationUpdate(BaseSchema):
     status: TravelIdeaGroupInvitationResponseStatus
 
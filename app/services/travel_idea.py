@@ -1,45 +1,193 @@
-from sqlalchemy.ext.asyncio import AsyncSession
+from collections.abc import AsyncIterable
 
+from sqlalchemy import Row, Select, and_, delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncScalarResult, AsyncSession
+
+from app.core.config import settings
+from app.core.response_cache import invalidate_travel_idea_group
 from app.models import TravelIdea, TravelIdeaGroup, UserAccount
 from app.schemas.travel_idea import TravelIdeaCreate, TravelIdeaUpdate
+from app.services.travel_idea_group import (
+    bump_travel_idea_group_version,
+    select_travel_idea_group_access,
+    travel_idea_group_member_exists,
+)
 
 
 async def create_new_travel_idea(
-    db: AsyncSession, request_data: TravelIdeaCreate, current_user: UserAccount, travel_idea_group: TravelIdeaGroup
+    db: AsyncSession, request_data: TravelIdeaCreate, current_user: UserAccount, travel_idea_group_id: int
 ) -> TravelIdea:
     travel_idea = TravelIdea(
         name=request_data.name,
         notes=request_data.notes,
         image_url=request_data.image_url,
         created_by=current_user,
-        travel_idea_group=travel_idea_group,
+        travel_idea_group_id=travel_idea_group_id,
     )
     db.add(travel_idea)
+    await bump_travel_idea_group_version(db, travel_idea_group_id)
     await db.commit()
+    await invalidate_travel_idea_group(travel_idea_group_id)
     return travel_idea
 
 
-async def get_travel_idea_by_id(db: AsyncSession, travel_idea_id: int) -> TravelIdea | None:
-    result = await db.get(TravelIdea, travel_idea_id)
-    return result
+def _travel_idea_values(
+    request_data: list[TravelIdeaCreate], current_user: UserAccount, travel_idea_group_id: int
+) -> list[dict[str, object]]:
+    return [
+        {
+            "name": travel_idea.name,
+            "notes": travel_idea.notes,
+            "image_url": travel_idea.image_url,
+            "created_by_id": current_user.id,
+            "travel_idea_group_id": travel_idea_group_id,
+        }
+        for travel_idea in request_data
+    ]
 
 
-async def update_existing_travel_idea(
-    db: AsyncSession, request_data: TravelIdeaUpdate, travel_idea: TravelIdea
-) -> TravelIdea:
-    if "name" in request_data.model_fields_set:
-        travel_idea.name = request_data.name
+async def create_new_travel_ideas(
+    db: AsyncSession, request_data: list[TravelIdeaCreate], current_user: UserAccount, travel_idea_group_id: int
+) -> list[TravelIdea]:
+    values = _travel_idea_values(request_data, current_user, travel_idea_group_id)
+    # Sent as multi-row INSERT ... RETURNING statements rather than one round trip per idea. Asking SQLAlchemy to
+    # keep RETURNING in parameter order would fall back to row-at-a-time inserts, so the ideas are ordered by id instead
+    result = await db.scalars(insert(TravelIdea).returning(TravelIdea), values)
+    travel_ideas = sorted(result.all(), key=lambda travel_idea: travel_idea.id)
+    await bump_travel_idea_group_version(db, travel_idea_group_id)
+    await db.commit()
+    await invalidate_travel_idea_group(travel_idea_group_id)
+    return travel_ideas
+
+
+async def import_new_travel_ideas(
+    db: AsyncSession,
+    batches: AsyncIterable[list[TravelIdeaCreate]],
+    current_user: UserAccount,
+    travel_idea_group_id: int,
+) -> int:
+    """Inserts each batch as it is read, without RETURNING, and commits them all together. Returns how many."""
+    imported = 0
+    async for batch in batches:
+        # Into the table rather than through the ORM, whose bulk insert starts a new statement whenever the next
+        # idea's notes switch between being set and null
+        await db.execute(insert(TravelIdea.__table__), _travel_idea_values(batch, current_user, travel_idea_group_id))
+        imported += len(batch)
+
+    if imported:
+        await bump_travel_idea_group_version(db, travel_idea_group_id)
+        await db.commit()
+        await invalidate_travel_idea_group(travel_idea_group_id)
+    return imported
+
+
+async def get_travel_idea_with_access(
+    db: AsyncSession, travel_idea_group_id: int, travel_idea_id: int, user_account_id: int
+) -> Row | None:
+    """Returns None if the group doesn't exist, otherwise the user's role and the idea if it belongs to the group."""
+    result = await db.execute(
+        select_travel_idea_group_access(travel_idea_group_id, user_account_id)
+        .add_columns(TravelIdea)
+        .outerjoin(
+            TravelIdea,
+            and_(TravelIdea.travel_idea_group_id == TravelIdeaGroup.id, TravelIdea.id == travel_idea_id),
+        )
+    )
+    return result.one_or_none()
+
+
+def select_travel_ideas(travel_idea_group_id: int, after_id: int | None = None) -> Select:
+    stmt = select(TravelIdea).where(TravelIdea.travel_idea_group_id == travel_idea_group_id)
+    if after_id is not None:
+        stmt = stmt.where(TravelIdea.id > after_id)
+    return stmt.order_by(TravelIdea.id)
+
 
-    if "notes" in request_data.model_fields_set:
-        travel_idea.notes = request_data.notes
+async def get_travel_ideas(
+    db: AsyncSession, travel_idea_group_id: int, limit: int, after_id: int | None = None
+) -> list[TravelIdea]:
+    result = await db.execute(select_travel_ideas(travel_idea_group_id, after_id).limit(limit))
+    return result.scalars().all()
 
-    if "image_url" in request_data.model_fields_set:
-        travel_idea.image_url = request_data.image_url
 
+async def stream_travel_ideas(
+    db: AsyncSession, travel_idea_group_id: int, after_id: int | None = None
+) -> AsyncScalarResult[TravelIdea]:
+    """Fetches every idea after after_id in batches from a server-side cursor, rather than loading them all at once."""
+    return await db.stream_scalars(
+        select_travel_ideas(travel_idea_group_id, after_id).execution_options(yield_per=settings.stream_batch_size)
+    )
+
+
+async def stream_travel_idea_export(db: AsyncSession, travel_idea_group_id: int) -> AsyncResult:
+    """Fetches every idea in the group with its creator's name, in batches from a server-side cursor."""
+    return await db.stream(
+        select(
+            TravelIdea.id,
+            TravelIdea.name,
+            TravelIdea.notes,
+            TravelIdea.image_url,
+            TravelIdea.created_at,
+            UserAccount.name.label("created_by_name"),
+        )
+        .join(UserAccount, UserAccount.id == TravelIdea.created_by_id)
+        .where(TravelIdea.travel_idea_group_id == travel_idea_group_id)
+        .order_by(TravelIdea.id)
+        .execution_options(yield_per=settings.stream_batch_size)
+    )
+
+
+async def update_existing_travel_idea(
+    db: AsyncSession,
+    request_data: TravelIdeaUpdate,
+    travel_idea_group_id: int,
+    travel_idea_id: int,
+    user_account_id: int,
+) -> TravelIdea | None:
+    """Returns None, having changed nothing, if the idea isn't in the group or the user isn't one of its members."""
+    values = request_data.model_dump(include=request_data.model_fields_set, by_alias=False)
+    if not values:
+        access = await get_travel_idea_with_access(db, travel_idea_group_id, travel_idea_id, user_account_id)
+        return access.TravelIdea if access is not None and access.role is not None else None
+
+    result = await db.scalars(
+        update(TravelIdea)
+        .where(
+            TravelIdea.id == travel_idea_id,
+            TravelIdea.travel_idea_group_id == travel_idea_group_id,
+            travel_idea_group_member_exists(travel_idea_group_id, user_account_id),
+        )
+        .values(values)
+        .returning(TravelIdea),
+        execution_options={"populate_existing": True},
+    )
+    travel_idea = result.one_or_none()
+    if travel_idea is None:
+        await db.commit()
+        return None
+
+    await bump_travel_idea_group_version(db, travel_idea_group_id)
     await db.commit()
+    await invalidate_travel_idea_group(travel_idea_group_id)
     return travel_idea
 
 
-async def delete_travel_idea_from_db(db: AsyncSession, travel_idea: TravelIdea) -> None:
-    await db.delete(travel_idea)
+async def delete_travel_idea_from_db(
+    db: AsyncSession, travel_idea_group_id: int, travel_idea_id: int, user_account_id: int
+) -> bool:
+    """Returns False, having deleted nothing, if the idea isn't in the group or the user isn't one of its members."""
+    result = await db.execute(
+        delete(TravelIdea).where(
+            TravelIdea.id == travel_idea_id,
+            TravelIdea.travel_idea_group_id == travel_idea_group_id,
+            travel_idea_group_member_exists(travel_idea_group_id, user_account_id),
+        )
+    )
+    if result.rowcount != 1:
+        await db.commit()
+        return False
+
+    await bump_travel_idea_group_version(db, travel_idea_group_id)
     await db.commit()
+    await invalidate_travel_idea_group(travel_idea_group_id)
+    return True
@@ -1,9 +1,12 @@
-from sqlalchemy import Select, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Exists, Row, Select, and_, delete, exists, func, insert, literal, or_, select, tuple_, update
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import joinedload, selectinload
 
-from app.models import TravelIdeaGroup, UserAccount
+from app.core.config import settings
+from app.core.response_cache import invalidate_invitations, invalidate_travel_idea_group
+from app.models import TravelIdea, TravelIdeaGroup, TravelIdeaGroupInvitation, UserAccount
 from app.models.travel_idea_group_member import TravelIdeaGroupMember
+from app.schemas.enums import TravelIdeaGroupInvitationStatus, TravelIdeaGroupRole
 from app.schemas.travel_idea_group import TravelIdeaGroupCreate, TravelIdeaGroupUpdate
 
 
@@ -13,57 +16,216 @@ async def create_new_travel_idea_group(
     travel_idea_group = TravelIdeaGroup(
         name=request_data.name,
         owned_by=current_user,
+        memberships=[TravelIdeaGroupMember(user_account=current_user, role=TravelIdeaGroupRole.OWNER)],
     )
     db.add(travel_idea_group)
     await db.commit()
     return travel_idea_group
 
 
-def select_travel_idea_group(load_travel_ideas: bool = False) -> Select:
-    options = [
+async def clone_travel_idea_group(
+    db: AsyncSession, travel_idea_group_id: int, request_data: TravelIdeaGroupCreate, current_user: UserAccount
+) -> TravelIdeaGroup:
+    """Creates a group owned by the user with a copy of each of the group's travel ideas, created by the user."""
+    travel_idea_group = TravelIdeaGroup(
+        name=request_data.name,
+        owned_by=current_user,
+        memberships=[TravelIdeaGroupMember(user_account=current_user, role=TravelIdeaGroupRole.OWNER)],
+    )
+    db.add(travel_idea_group)
+    await db.flush()
+
+    # Copied by a single INSERT ... SELECT, so the ideas are never loaded however many there are
+    await db.execute(
+        insert(TravelIdea).from_select(
+            ["name", "notes", "image_url", "created_by_id", "travel_idea_group_id"],
+            select(
+                TravelIdea.name,
+                TravelIdea.notes,
+                TravelIdea.image_url,
+                literal(current_user.id),
+                literal(travel_idea_group.id),
+            )
+            .where(TravelIdea.travel_idea_group_id == travel_idea_group_id)
+            .order_by(TravelIdea.id),
+        )
+    )
+    await db.commit()
+    return travel_idea_group
+
+
+def select_travel_idea_group() -> Select:
+    return select(TravelIdeaGroup).options(
         selectinload(TravelIdeaGroup.members).joinedload(TravelIdeaGroupMember.user_account),
         joinedload(TravelIdeaGroup.owned_by),
-    ]
+    )
 
-    if load_travel_ideas:
-        options.append(selectinload(TravelIdeaGroup.travel_ideas))
 
-    return select(TravelIdeaGroup).options(*options)
+async def get_travel_idea_group_by_id(db: AsyncSession, travel_idea_group_id: int) -> TravelIdeaGroup | None:
+    result = await db.execute(select_travel_idea_group().where(TravelIdeaGroup.id == travel_idea_group_id))
+    travel_idea_group = result.scalars().one_or_none()
+    return travel_idea_group
 
 
-async def get_travel_idea_group_by_id(
-    db: AsyncSession, travel_idea_group_id: int, load_travel_ideas: bool = False
-) -> TravelIdeaGroup | None:
-    result = await db.execute(
-        select_travel_idea_group(load_travel_ideas).where(TravelIdeaGroup.id == travel_idea_group_id)
+def select_travel_idea_group_access(travel_idea_group_id: int, user_account_id: int) -> Select:
+    return (
+        select(TravelIdeaGroupMember.role, TravelIdeaGroup.version)
+        .select_from(TravelIdeaGroup)
+        .outerjoin(
+            TravelIdeaGroupMember,
+            and_(
+                TravelIdeaGroupMember.travel_idea_group_id == TravelIdeaGroup.id,
+                TravelIdeaGroupMember.user_account_id == user_account_id,
+            ),
+        )
+        .where(TravelIdeaGroup.id == travel_idea_group_id)
     )
-    travel_idea_group = result.scalars().one_or_none()
-    return travel_idea_group
 
 
-async def get_travel_idea_groups(db: AsyncSession, user_account_id: int) -> list[TravelIdeaGroup]:
-    result = await db.execute(
-        select_travel_idea_group()
+def travel_idea_group_member_exists(travel_idea_group_id: int, user_account_id: int) -> Exists:
+    """For guarding a write on the group's data in the statement itself, rather than with a query beforehand."""
+    return exists().where(
+        TravelIdeaGroupMember.travel_idea_group_id == travel_idea_group_id,
+        TravelIdeaGroupMember.user_account_id == user_account_id,
+    )
+
+
+async def get_travel_idea_group_access(db: AsyncSession, travel_idea_group_id: int, user_account_id: int) -> Row | None:
+    """Returns None if the group doesn't exist, otherwise a row of the user's role in it (if any) and its version."""
+    result = await db.execute(select_travel_idea_group_access(travel_idea_group_id, user_account_id))
+    return result.one_or_none()
+
+
+async def bump_travel_idea_group_version(db: AsyncSession, travel_idea_group_id: int) -> None:
+    """Call in the same transaction as any write to the group or its travel ideas, members or invitations."""
+    await db.execute(
+        update(TravelIdeaGroup)
+        .where(TravelIdeaGroup.id == travel_idea_group_id)
+        .values(version=TravelIdeaGroup.version + 1)
+    )
+
+
+async def bump_user_travel_idea_group_versions(db: AsyncSession, user_account_id: int) -> list[int]:
+    """Bumps the version of every group the user owns or is a member of, returning their ids."""
+    result = await db.scalars(
+        update(TravelIdeaGroup)
         .where(
             or_(
                 TravelIdeaGroup.owned_by_id == user_account_id,
-                TravelIdeaGroup.members.any(TravelIdeaGroupMember.user_account_id == user_account_id),
+                TravelIdeaGroup.id.in_(
+                    select(TravelIdeaGroupMember.travel_idea_group_id).where(
+                        TravelIdeaGroupMember.user_account_id == user_account_id
+                    )
+                ),
             )
         )
-        .order_by(TravelIdeaGroup.name)
+        .values(version=TravelIdeaGroup.version + 1)
+        .returning(TravelIdeaGroup.id)
+        .execution_options(synchronize_session=False)
+    )
+    return result.all()
+
+
+async def get_pending_invitee_emails(db: AsyncSession, travel_idea_group_id: int) -> list[str]:
+    result = await db.scalars(
+        select(TravelIdeaGroupInvitation.email).where(
+            TravelIdeaGroupInvitation.travel_idea_group_id == travel_idea_group_id,
+            TravelIdeaGroupInvitation.status == TravelIdeaGroupInvitationStatus.PENDING,
+        )
+    )
+    return result.all()
+
+
+def select_travel_idea_group_summaries(user_account_id: int, after: tuple[str, int] | None = None) -> Select:
+    member_count = (
+        select(func.count())
+        .where(
+            TravelIdeaGroupMember.travel_idea_group_id == TravelIdeaGroup.id,
+            TravelIdeaGroupMember.role == TravelIdeaGroupRole.MEMBER,
+        )
+        .correlate(TravelIdeaGroup)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(TravelIdeaGroup, member_count.label("member_count"))
+        .join(TravelIdeaGroup.memberships)
+        .options(joinedload(TravelIdeaGroup.owned_by))
+        .where(TravelIdeaGroupMember.user_account_id == user_account_id)
+    )
+    if after is not None:
+        stmt = stmt.where(tuple_(TravelIdeaGroup.name, TravelIdeaGroup.id) > tuple_(*after))
+    return stmt.order_by(TravelIdeaGroup.name, TravelIdeaGroup.id)
+
+
+async def get_travel_idea_group_summaries(
+    db: AsyncSession, user_account_id: int, limit: int, after: tuple[str, int] | None = None
+) -> list[Row[tuple[TravelIdeaGroup, int]]]:
+    result = await db.execute(select_travel_idea_group_summaries(user_account_id, after).limit(limit))
+    return result.all()
+
+
+async def stream_travel_idea_group_summaries(
+    db: AsyncSession, user_account_id: int, after: tuple[str, int] | None = None
+) -> AsyncResult[tuple[TravelIdeaGroup, int]]:
+    return await db.stream(
+        select_travel_idea_group_summaries(user_account_id, after).execution_options(
+            yield_per=settings.stream_batch_size
+        )
     )
-    travel_idea_groups = result.scalars().all()
-    return travel_idea_groups
 
 
 async def update_existing_travel_idea_group(
     db: AsyncSession, request_data: TravelIdeaGroupUpdate, travel_idea_group: TravelIdeaGroup
 ) -> TravelIdeaGroup:
     travel_idea_group.name = request_data.name
+    await bump_travel_idea_group_version(db, travel_idea_group.id)
+    # Invitees see the group's name in their invitations
+    invitee_emails = await get_pending_invitee_emails(db, travel_idea_group.id)
     await db.commit()
+    await invalidate_travel_idea_group(travel_idea_group.id)
+    await invalidate_invitations(*invitee_emails)
     return travel_idea_group
 
 
-async def delete_travel_idea_group_from_db(db: AsyncSession, travel_idea_group: TravelIdeaGroup) -> None:
-    await db.delete(travel_idea_group)
+async def delete_travel_idea_group_from_db(db: AsyncSession, travel_idea_group_id: int) -> None:
+    invitee_emails = await get_pending_invitee_emails(db, travel_idea_group_id)
+    # The database cascades this to the group's members, invitations and travel ideas
+    await db.execute(
+        delete(TravelIdeaGroup)
+        .where(TravelIdeaGroup.id == travel_idea_group_id)
+        .execution_options(synchronize_session=False)
+    )
     await db.commit()
+    await invalidate_travel_idea_group(travel_idea_group_id)
+    await invalidate_invitations(*invitee_emails)
+
+
+async def delete_travel_idea_group_in_chunks(
+    session_factory: async_sessionmaker[AsyncSession], travel_idea_group_id: int, chunk_size: int
+) -> None:
+    """Deletes a group's travel ideas a chunk per transaction before deleting the group itself.
+
+    Keeps each transaction short for groups too large to cascade through in one go.
+    """
+    while True:
+        async with session_factory() as db:
+            travel_idea_ids = (
+                select(TravelIdea.id)
+                .where(TravelIdea.travel_idea_group_id == travel_idea_group_id)
+                .order_by(TravelIdea.id)
+                .limit(chunk_size)
+            )
+            result = await db.execute(
+                delete(TravelIdea)
+                .where(TravelIdea.id.in_(travel_idea_ids))
+                .execution_options(synchronize_session=False)
+            )
+            await bump_travel_idea_group_version(db, travel_idea_group_id)
+            await db.commit()
+        await invalidate_travel_idea_group(travel_idea_group_id)
+
+        if result.rowcount < chunk_size:
+            break
+
+    async with session_factory() as db:
+        await delete_travel_idea_group_from_db(db, travel_idea_group_id)
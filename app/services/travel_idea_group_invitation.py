@@ -2,35 +2,120 @@ import random
 import string
 from datetime import UTC, datetime, timedelta
 
-from pydantic import EmailStr
-from sqlalchemy import Select, or_, select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
 from sqlalchemy.orm import joinedload
 
-from app.models import TravelIdeaGroup, UserAccount
+from app.core.config import settings
+from app.core.response_cache import invalidate_invitations, invalidate_travel_idea_group
+from app.models import TravelIdeaGroup, TravelIdeaGroupMember, UserAccount
 from app.models.travel_idea_group_invitation import TravelIdeaGroupInvitation
 from app.schemas.enums import TravelIdeaGroupInvitationStatus
+from app.schemas.shared import normalize_email
+from app.services.travel_idea_group import bump_travel_idea_group_version
 from app.services.travel_idea_group_member import create_new_travel_idea_group_member
 
 
+def _generate_invitation_code() -> str:
+    return "".join(random.SystemRandom().choice(string.ascii_uppercase + string.digits) for _ in range(10))
+
+
+def _has_status(status: TravelIdeaGroupInvitationStatus) -> ColumnElement[bool]:
+    # Rendered inline rather than bound so the planner can match the partial indexes on status
+    return TravelIdeaGroupInvitation.status == literal(
+        status, TravelIdeaGroupInvitation.status.type, literal_execute=True
+    )
+
+
 async def create_new_travel_idea_group_invitation(
-    db: AsyncSession, current_user: UserAccount, travel_idea_group: TravelIdeaGroup, email: EmailStr
+    db: AsyncSession, current_user: UserAccount, travel_idea_group: TravelIdeaGroup, email: str
 ) -> TravelIdeaGroupInvitation:
-    invitation_code = "".join(random.SystemRandom().choice(string.ascii_uppercase + string.digits) for _ in range(10))
-
     invitation = TravelIdeaGroupInvitation(
-        email=email,
-        invitation_code=invitation_code,
+        email=normalize_email(email),
+        invitation_code=_generate_invitation_code(),
         status=TravelIdeaGroupInvitationStatus.PENDING,
         expires_at=datetime.now(UTC) + timedelta(weeks=2),
         created_by=current_user,
         travel_idea_group=travel_idea_group,
     )
     db.add(invitation)
+    await bump_travel_idea_group_version(db, travel_idea_group.id)
     await db.commit()
+    await invalidate_invitations(invitation.email)
     return invitation
 
 
+async def get_pending_invitee_emails_invited_by(db: AsyncSession, user_account_id: int) -> list[str]:
+    result = await db.scalars(
+        select(TravelIdeaGroupInvitation.email).where(
+            TravelIdeaGroupInvitation.created_by_id == user_account_id,
+            _has_status(TravelIdeaGroupInvitationStatus.PENDING),
+        )
+    )
+    return result.all()
+
+
+async def create_new_travel_idea_group_invitations(
+    db: AsyncSession, current_user: UserAccount, travel_idea_group_id: int, emails: list[str]
+) -> None:
+    expires_at = datetime.now(UTC) + timedelta(weeks=2)
+    values = [
+        {
+            "email": normalize_email(email),
+            "invitation_code": _generate_invitation_code(),
+            "status": TravelIdeaGroupInvitationStatus.PENDING,
+            "expires_at": expires_at,
+            "created_by_id": current_user.id,
+            "travel_idea_group_id": travel_idea_group_id,
+        }
+        for email in emails
+    ]
+    # A single multi-row INSERT rather than one statement per invitation
+    await db.execute(insert(TravelIdeaGroupInvitation).values(values))
+    await bump_travel_idea_group_version(db, travel_idea_group_id)
+    await db.commit()
+    await invalidate_invitations(*emails)
+
+
+async def get_members_and_invitees(
+    db: AsyncSession, travel_idea_group_id: int, emails: list[str]
+) -> tuple[set[str], set[str]]:
+    """Returns which of the emails already belong to the group's members, and which have a pending invitation."""
+    emails = [normalize_email(email) for email in emails]
+    member_emails = (
+        select(func.lower(UserAccount.email), literal_column("'member'"))
+        .join(TravelIdeaGroupMember, TravelIdeaGroupMember.user_account_id == UserAccount.id)
+        .where(
+            TravelIdeaGroupMember.travel_idea_group_id == travel_idea_group_id,
+            func.lower(UserAccount.email).in_(emails),
+        )
+    )
+    invitee_emails = select(func.lower(TravelIdeaGroupInvitation.email), literal_column("'invitee'")).where(
+        TravelIdeaGroupInvitation.travel_idea_group_id == travel_idea_group_id,
+        func.lower(TravelIdeaGroupInvitation.email).in_(emails),
+        _has_status(TravelIdeaGroupInvitationStatus.PENDING),
+        TravelIdeaGroupInvitation.expires_at >= datetime.now(UTC),
+    )
+    result = await db.execute(union_all(member_emails, invitee_emails))
+
+    members, invitees = set(), set()
+    for email, kind in result.all():
+        (members if kind == "member" else invitees).add(email)
+    return members, invitees
+
+
 def select_travel_idea_group_invitation(
     email: str | None = None,
     travel_idea_group_id: int | None = None,
@@ -47,10 +132,10 @@ def select_travel_idea_group_invitation(
             )
         )
     else:
-        filters.append(TravelIdeaGroupInvitation.status == TravelIdeaGroupInvitationStatus.PENDING)
+        filters.append(_has_status(TravelIdeaGroupInvitationStatus.PENDING))
 
     if email:
-        filters.append(TravelIdeaGroupInvitation.email == email)
+        filters.append(func.lower(TravelIdeaGroupInvitation.email) == normalize_email(email))
 
     if travel_idea_group_id:
         filters.append(TravelIdeaGroupInvitation.travel_idea_group_id == travel_idea_group_id)
@@ -79,20 +164,14 @@ async def get_outstanding_invitations_for_travel_idea_group(
     db: AsyncSession, travel_idea_group_id: int
 ) -> list[TravelIdeaGroupInvitation]:
     result = await db.execute(
-        select_travel_idea_group_invitation(travel_idea_group_id=travel_idea_group_id, include_rejected=True)
+        select_travel_idea_group_invitation(travel_idea_group_id=travel_idea_group_id, include_rejected=True).order_by(
+            TravelIdeaGroupInvitation.id
+        )
     )
     invitations = result.scalars().all()
     return invitations
 
 
-async def get_travel_idea_group_invitation_for_invitation_code(
-    db: AsyncSession, email: str, invitation_code: str
-) -> TravelIdeaGroup | None:
-    result = await db.execute(select_travel_idea_group_invitation(email, invitation_code=invitation_code))
-    invitation = result.scalars().one_or_none()
-    return invitation
-
-
 async def get_travel_idea_group_invitations(db: AsyncSession, email: str) -> list[TravelIdeaGroup]:
     result = await db.execute(
         (select_travel_idea_group_invitation(email)).order_by(TravelIdeaGroupInvitation.created_at)
@@ -102,20 +181,76 @@ async def get_travel_idea_group_invitations(db: AsyncSession, email: str) -> lis
     return travel_idea_group_invitations
 
 
+async def stream_travel_idea_group_invitations(
+    db: AsyncSession, email: str
+) -> AsyncScalarResult[TravelIdeaGroupInvitation]:
+    return await db.stream_scalars(
+        select_travel_idea_group_invitation(email)
+        .order_by(TravelIdeaGroupInvitation.created_at)
+        .execution_options(yield_per=settings.stream_batch_size)
+    )
+
+
 async def accept_or_reject_travel_idea_group_invitation(
     db: AsyncSession,
-    invitation: TravelIdeaGroupInvitation,
+    invitation_code: str,
     user: UserAccount,
     status: TravelIdeaGroupInvitationStatus,
-) -> TravelIdeaGroupInvitation:
-    invitation.status = status
+) -> int | None:
+    """Returns the invitation's group, or None if the user has no pending, unexpired invitation with the code.
+
+    Only one of several concurrent responses to the same invitation can match the pending status.
+    """
+    result = await db.execute(
+        update(TravelIdeaGroupInvitation)
+        .where(
+            TravelIdeaGroupInvitation.invitation_code == invitation_code,
+            func.lower(TravelIdeaGroupInvitation.email) == normalize_email(user.email),
+            _has_status(TravelIdeaGroupInvitationStatus.PENDING),
+            TravelIdeaGroupInvitation.expires_at >= datetime.now(UTC),
+        )
+        .values(status=status)
+        .returning(TravelIdeaGroupInvitation.travel_idea_group_id)
+        .execution_options(synchronize_session=False)
+    )
+    travel_idea_group_id = result.scalar_one_or_none()
+    if travel_idea_group_id is None:
+        return None
+
     if status == TravelIdeaGroupInvitationStatus.ACCEPTED:
-        await create_new_travel_idea_group_member(db, invitation.travel_idea_group, user)
+        await create_new_travel_idea_group_member(db, travel_idea_group_id, user.id)
 
+    await bump_travel_idea_group_version(db, travel_idea_group_id)
     await db.commit()
-    return invitation
+    await invalidate_invitations(user.email)
+    if status == TravelIdeaGroupInvitationStatus.ACCEPTED:
+        await invalidate_travel_idea_group(travel_idea_group_id)
+    return travel_idea_group_id
 
 
 async def delete_travel_idea_group_invitation(db: AsyncSession, invitation: TravelIdeaGroupInvitation) -> None:
     await db.delete(invitation)
+    await bump_travel_idea_group_version(db, invitation.travel_idea_group_id)
     await db.commit()
+    await invalidate_invitations(invitation.email)
+
+
+async def delete_dead_travel_idea_group_invitations(db: AsyncSession, batch_size: int) -> int:
+    """Deletes up to batch_size expired or accepted invitations without committing, returning how many were deleted.
+
+    None of them are listed anywhere, so there is nothing cached to invalidate and no group version to bump.
+    """
+    dead_invitation_ids = (
+        select(TravelIdeaGroupInvitation.id)
+        .where(
+            or_(
+                TravelIdeaGroupInvitation.expires_at < datetime.now(UTC),
+                _has_status(TravelIdeaGroupInvitationStatus.ACCEPTED),
+            )
+        )
+        .limit(batch_size)
+    )
+    result = await db.execute(
+        delete(TravelIdeaGroupInvitation).where(TravelIdeaGroupInvitation.id.in_(dead_invitation_ids))
+    )
+    return result.rowcount
@@ -1,11 +1,23 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import TravelIdeaGroup, TravelIdeaGroupMember, UserAccount
+from app.database.dialect import dialect_insert
+from app.models import TravelIdeaGroupMember
+from app.schemas.enums import TravelIdeaGroupRole
 
 
 async def create_new_travel_idea_group_member(
-    db: AsyncSession, travel_idea_group: TravelIdeaGroup, user_account: UserAccount
-) -> TravelIdeaGroupMember:
-    travel_idea_group_member = TravelIdeaGroupMember(travel_idea_group=travel_idea_group, user_account=user_account)
-    db.add(travel_idea_group_member)
-    return travel_idea_group_member
+    db: AsyncSession, travel_idea_group_id: int, user_account_id: int
+) -> None:
+    # Users who already have access keep their existing membership, so concurrent joins can't duplicate it
+    stmt = (
+        dialect_insert(db, TravelIdeaGroupMember)
+        .values(
+            user_account_id=user_account_id,
+            travel_idea_group_id=travel_idea_group_id,
+            role=TravelIdeaGroupRole.MEMBER,
+        )
+        .on_conflict_do_nothing(
+            index_elements=[TravelIdeaGroupMember.user_account_id, TravelIdeaGroupMember.travel_idea_group_id]
+        )
+    )
+    await db.execute(stmt)
@@ -1,19 +1,98 @@
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import case, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.core.response_cache import invalidate_invitations, invalidate_travel_idea_group
+from app.database.dialect import dialect_insert
 from app.models.user_account import UserAccount
+from app.schemas.shared import normalize_email
+from app.services.travel_idea_group import bump_user_travel_idea_group_versions
+from app.services.travel_idea_group_invitation import get_pending_invitee_emails_invited_by
+
+principal_cache: TTLCache[int, UserAccount] = TTLCache(
+    max_size=settings.principal_cache_max_size, ttl_seconds=settings.principal_cache_ttl_seconds
+)
+
+
+def _detached_user_account(id: int, email: str, name: str, version: int) -> UserAccount:
+    # A detached instance can be merged into any session without another SELECT
+    user_account = UserAccount(id=id, email=email, name=name, version=version)
+    make_transient_to_detached(user_account)
+    return user_account
+
+
+def cache_user_account(user_account: UserAccount) -> None:
+    principal_cache.set(
+        user_account.id,
+        _detached_user_account(user_account.id, user_account.email, user_account.name, user_account.version),
+    )
+
+
+def build_session_principal(user_account: UserAccount) -> dict[str, Any]:
+    return {
+        "id": user_account.id,
+        "email": user_account.email,
+        "name": user_account.name,
+        "version": user_account.version,
+    }
 
 
 async def get_user_by_email(db: AsyncSession, email: str) -> UserAccount | None:
-    stmt = select(UserAccount).where(UserAccount.email == email)
+    stmt = select(UserAccount).where(func.lower(UserAccount.email) == normalize_email(email))
     result = await db.execute(stmt)
     user = result.scalars().first()
     return user
 
 
-async def create_user_account(db: AsyncSession, email: str, name: str) -> UserAccount:
-    user_account = UserAccount(email=email, name=name)
-    db.add(user_account)
+async def get_user_for_session_principal(db: AsyncSession, principal: dict[str, Any]) -> UserAccount | None:
+    cached_user = principal_cache.get(principal["id"])
+
+    if cached_user is None:
+        # Nothing newer is known to this process, so the signed session can be trusted as-is
+        cached_user = _detached_user_account(
+            principal["id"], principal["email"], principal["name"], principal["version"]
+        )
+        principal_cache.set(cached_user.id, cached_user)
+    elif cached_user.version != principal["version"]:
+        user = await db.get(UserAccount, principal["id"], populate_existing=True)
+        if user:
+            cache_user_account(user)
+        return user
+
+    return await db.merge(cached_user, load=False)
+
+
+async def upsert_user_account(db: AsyncSession, email: str, name: str) -> UserAccount:
+    previous_name = await db.scalar(
+        select(UserAccount.name).where(func.lower(UserAccount.email) == normalize_email(email))
+    )
+    stmt = dialect_insert(db, UserAccount).values(email=normalize_email(email), name=name)
+    # DO UPDATE (rather than DO NOTHING) makes RETURNING yield the existing row on conflict. A changed name bumps the
+    # version, so sessions signed with the old one are reloaded from the database
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[func.lower(UserAccount.email)],
+        set_={
+            "name": stmt.excluded.name,
+            "version": case(
+                (UserAccount.name != stmt.excluded.name, UserAccount.version + 1), else_=UserAccount.version
+            ),
+        },
+    )
+    result = await db.scalars(stmt.returning(UserAccount), execution_options={"populate_existing": True})
+    user_account = result.one()
+
+    renamed = previous_name is not None and previous_name != name
+    if renamed:
+        # Members of the user's groups, and the people they've invited, see the user's name
+        travel_idea_group_ids = await bump_user_travel_idea_group_versions(db, user_account.id)
+        invitee_emails = await get_pending_invitee_emails_invited_by(db, user_account.id)
     await db.commit()
-    await db.refresh(user_account)
+    cache_user_account(user_account)
+    if renamed:
+        await invalidate_travel_idea_group(*travel_idea_group_ids)
+        await invalidate_invitations(*invitee_emails)
     return user_account
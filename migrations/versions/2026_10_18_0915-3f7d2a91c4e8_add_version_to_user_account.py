@@ -0,0 +1,28 @@
+"""Add version to user_account
+
+Revision ID: 3f7d2a91c4e8
+Revises: 5e3b78147a7d
+Create Date: 2026-10-18 09:15:12.402817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7d2a91c4e8'
+down_revision: Union[str, Sequence[str], None] = '5e3b78147a7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('user_account', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('user_account', 'version')
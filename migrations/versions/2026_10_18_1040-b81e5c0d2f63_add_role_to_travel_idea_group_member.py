@@ -0,0 +1,59 @@
+"""Add role to travel_idea_group_member and store owners as members
+
+Revision ID: b81e5c0d2f63
+Revises: 3f7d2a91c4e8
+Create Date: 2026-10-18 10:40:31.118406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b81e5c0d2f63'
+down_revision: Union[str, Sequence[str], None] = '3f7d2a91c4e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    travel_idea_group_role = sa.Enum('owner', 'member', name='travelideagrouprole')
+    travel_idea_group_role.create(op.get_bind(), checkfirst=True)
+    op.add_column('travel_idea_group_member', sa.Column('role', travel_idea_group_role, server_default='member', nullable=False))
+
+    # Remove duplicate memberships and owners who were also added as members before adding the owner rows
+    op.execute(
+        """
+        DELETE FROM travel_idea_group_member duplicate
+        USING travel_idea_group_member original
+        WHERE duplicate.user_account_id = original.user_account_id
+        AND duplicate.travel_idea_group_id = original.travel_idea_group_id
+        AND duplicate.id > original.id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM travel_idea_group_member membership
+        USING travel_idea_group
+        WHERE membership.travel_idea_group_id = travel_idea_group.id
+        AND membership.user_account_id = travel_idea_group.owned_by_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO travel_idea_group_member (user_account_id, travel_idea_group_id, role)
+        SELECT owned_by_id, id, 'owner' FROM travel_idea_group
+        """
+    )
+    op.create_unique_constraint(op.f('uq_travel_idea_group_member_user_account_id'), 'travel_idea_group_member', ['user_account_id', 'travel_idea_group_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint(op.f('uq_travel_idea_group_member_user_account_id'), 'travel_idea_group_member', type_='unique')
+    op.execute("DELETE FROM travel_idea_group_member WHERE role = 'owner'")
+    op.drop_column('travel_idea_group_member', 'role')
+    op.execute('DROP TYPE IF EXISTS travelideagrouprole')
@@ -0,0 +1,40 @@
+"""Add indexes for lookup paths
+
+Revision ID: 6c19e4a0d7b2
+Revises: b81e5c0d2f63
+Create Date: 2026-10-18 11:25:43.918204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c19e4a0d7b2'
+down_revision: Union[str, Sequence[str], None] = 'b81e5c0d2f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_travel_idea_created_by_id'), 'travel_idea', ['created_by_id'], unique=False)
+    op.create_index(op.f('ix_travel_idea_travel_idea_group_id'), 'travel_idea', ['travel_idea_group_id', 'id'], unique=False)
+    op.create_index(op.f('ix_travel_idea_group_owned_by_id'), 'travel_idea_group', ['owned_by_id'], unique=False)
+    op.create_index(op.f('ix_travel_idea_group_invitation_created_by_id'), 'travel_idea_group_invitation', ['created_by_id'], unique=False)
+    op.create_index('ix_travel_idea_group_invitation_pending_email', 'travel_idea_group_invitation', ['email', 'expires_at'], unique=False, postgresql_where=sa.text("status = 'pending'"), sqlite_where=sa.text("status = 'pending'"))
+    op.create_index(op.f('ix_travel_idea_group_invitation_travel_idea_group_id'), 'travel_idea_group_invitation', ['travel_idea_group_id', 'status'], unique=False)
+    op.create_index(op.f('ix_travel_idea_group_member_travel_idea_group_id'), 'travel_idea_group_member', ['travel_idea_group_id', 'role'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_travel_idea_group_member_travel_idea_group_id'), table_name='travel_idea_group_member')
+    op.drop_index(op.f('ix_travel_idea_group_invitation_travel_idea_group_id'), table_name='travel_idea_group_invitation')
+    op.drop_index('ix_travel_idea_group_invitation_pending_email', table_name='travel_idea_group_invitation', postgresql_where=sa.text("status = 'pending'"))
+    op.drop_index(op.f('ix_travel_idea_group_invitation_created_by_id'), table_name='travel_idea_group_invitation')
+    op.drop_index(op.f('ix_travel_idea_group_owned_by_id'), table_name='travel_idea_group')
+    op.drop_index(op.f('ix_travel_idea_created_by_id'), table_name='travel_idea')
+    op.drop_index(op.f('ix_travel_idea_travel_idea_group_id'), table_name='travel_idea')
@@ -0,0 +1,40 @@
+"""Make email lookups case-insensitive
+
+Revision ID: d4e7a3b9f1c5
+Revises: 6c19e4a0d7b2
+Create Date: 2026-10-18 12:10:27.553190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e7a3b9f1c5'
+down_revision: Union[str, Sequence[str], None] = '6c19e4a0d7b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Fails on the unique index below if two accounts only differ by case, which needs resolving by hand
+    op.execute("UPDATE user_account SET email = lower(trim(email)) WHERE email <> lower(trim(email))")
+    op.execute("UPDATE travel_idea_group_invitation SET email = lower(trim(email)) WHERE email <> lower(trim(email))")
+
+    op.drop_constraint(op.f('uq_user_account_email'), 'user_account', type_='unique')
+    op.create_index('ix_user_account_lower_email', 'user_account', [sa.text('lower(email)')], unique=True)
+
+    op.drop_index('ix_travel_idea_group_invitation_pending_email', table_name='travel_idea_group_invitation', postgresql_where=sa.text("status = 'pending'"))
+    op.create_index('ix_travel_idea_group_invitation_pending_email', 'travel_idea_group_invitation', [sa.text('lower(email)'), 'expires_at'], unique=False, postgresql_where=sa.text("status = 'pending'"), sqlite_where=sa.text("status = 'pending'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_travel_idea_group_invitation_pending_email', table_name='travel_idea_group_invitation', postgresql_where=sa.text("status = 'pending'"))
+    op.create_index('ix_travel_idea_group_invitation_pending_email', 'travel_idea_group_invitation', ['email', 'expires_at'], unique=False, postgresql_where=sa.text("status = 'pending'"), sqlite_where=sa.text("status = 'pending'"))
+
+    op.drop_index('ix_user_account_lower_email', table_name='user_account')
+    op.create_unique_constraint(op.f('uq_user_account_email'), 'user_account', ['email'])
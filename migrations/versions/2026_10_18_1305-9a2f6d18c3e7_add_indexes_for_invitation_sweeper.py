@@ -0,0 +1,30 @@
+"""Add indexes for invitation sweeper
+
+Revision ID: 9a2f6d18c3e7
+Revises: d4e7a3b9f1c5
+Create Date: 2026-10-18 13:05:51.204466
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a2f6d18c3e7'
+down_revision: Union[str, Sequence[str], None] = 'd4e7a3b9f1c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_travel_idea_group_invitation_expires_at'), 'travel_idea_group_invitation', ['expires_at'], unique=False)
+    op.create_index('ix_travel_idea_group_invitation_accepted', 'travel_idea_group_invitation', ['status'], unique=False, postgresql_where=sa.text("status = 'accepted'"), sqlite_where=sa.text("status = 'accepted'"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_travel_idea_group_invitation_accepted', table_name='travel_idea_group_invitation', postgresql_where=sa.text("status = 'accepted'"))
+    op.drop_index(op.f('ix_travel_idea_group_invitation_expires_at'), table_name='travel_idea_group_invitation')
@@ -0,0 +1,39 @@
+"""Cascade travel_idea_group deletes
+
+Revision ID: e5b2c8f47a10
+Revises: 9a2f6d18c3e7
+Create Date: 2026-10-18 14:20:06.781342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2c8f47a10'
+down_revision: Union[str, Sequence[str], None] = '9a2f6d18c3e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Postgres truncates identifiers to 63 characters, so two of these were created with hashed suffixes
+FOREIGN_KEYS = [
+    ('fk_travel_idea_travel_idea_group_id_travel_idea_group', 'travel_idea'),
+    ('fk_travel_idea_group_member_travel_idea_group_id_travel_ede3', 'travel_idea_group_member'),
+    ('fk_travel_idea_group_invitation_travel_idea_group_id_tr_d188', 'travel_idea_group_invitation'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table in FOREIGN_KEYS:
+        op.drop_constraint(op.f(name), table, type_='foreignkey')
+        op.create_foreign_key(op.f(name), table, 'travel_idea_group', ['travel_idea_group_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table in FOREIGN_KEYS:
+        op.drop_constraint(op.f(name), table, type_='foreignkey')
+        op.create_foreign_key(op.f(name), table, 'travel_idea_group', ['travel_idea_group_id'], ['id'])
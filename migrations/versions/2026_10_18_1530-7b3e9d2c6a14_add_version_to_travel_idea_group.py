@@ -0,0 +1,28 @@
+"""Add version to travel_idea_group
+
+Revision ID: 7b3e9d2c6a14
+Revises: e5b2c8f47a10
+Create Date: 2026-10-18 15:30:41.209583
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e9d2c6a14'
+down_revision: Union[str, Sequence[str], None] = 'e5b2c8f47a10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('travel_idea_group', sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('travel_idea_group', 'version')
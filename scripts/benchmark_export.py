@@ -0,0 +1,123 @@
+"""Times exporting a large travel idea group and measures the memory the export holds on to while it streams.
+
+Seeds a group in a temporary SQLite database, or in the database given with --database-url, then drains the export's
+StreamingResponse directly. Going through an ASGI test client instead would buffer the whole body in memory.
+
+Run from the repository root with: uv run python -m scripts.benchmark_export [--ideas 1000000]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_CLIENT_ID", "benchmark")
+os.environ.setdefault("GOOGLE_CLIENT_SECRET", "benchmark")
+
+from sqlalchemy import insert, inspect  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.export import export_response  # noqa: E402
+from app.database.init_db import Base  # noqa: E402
+from app.models import TravelIdea, TravelIdeaGroup, UserAccount  # noqa: E402
+from app.schemas.enums import ExportFormat  # noqa: E402
+from app.schemas.travel_idea import TravelIdeaExport, construct_travel_idea_export  # noqa: E402
+from app.services.travel_idea import stream_travel_idea_export  # noqa: E402
+
+SEED_BATCH_SIZE = 10_000
+
+
+async def seed(db: AsyncSession, ideas: int) -> int:
+    users = [UserAccount(email=f"user_{i}@email.com", name=f"User {i}") for i in range(10)]
+    travel_idea_group = TravelIdeaGroup(name="Everywhere", owned_by=users[0])
+    db.add_all([*users, travel_idea_group])
+    await db.flush()
+
+    for start in range(0, ideas, SEED_BATCH_SIZE):
+        await db.execute(
+            insert(TravelIdea),
+            [
+                {
+                    "name": f"Idea {i}",
+                    "notes": 'Somewhere, worth "seeing"' if i % 3 else None,
+                    "image_url": f"https://images.example.com/{i}.jpg",
+                    "created_by_id": users[i % len(users)].id,
+                    "travel_idea_group_id": travel_idea_group.id,
+                }
+                for i in range(start, min(start + SEED_BATCH_SIZE, ideas))
+            ],
+        )
+    await db.commit()
+    return travel_idea_group.id
+
+
+async def export(db: AsyncSession, travel_idea_group_id: int, export_format: ExportFormat) -> int:
+    response = export_response(
+        await stream_travel_idea_export(db, travel_idea_group_id),
+        construct_travel_idea_export,
+        TravelIdeaExport,
+        export_format,
+        "benchmark",
+    )
+    size = 0
+    async for chunk in response.body_iterator:
+        size += len(chunk)
+    await db.rollback()
+    return size
+
+
+async def main(ideas: int, database_url: str | None) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(database_url or f"sqlite+aiosqlite:///{directory}/benchmark.db")
+        async with engine.begin() as conn:
+            # The tables are dropped afterwards, so a database that already has some, such as the app's, is refused
+            existing_tables = await conn.run_sync(lambda sync_conn: inspect(sync_conn).get_table_names())
+            if existing_tables:
+                await engine.dispose()
+                raise SystemExit(f"Refusing to use a database that already has tables: {', '.join(existing_tables)}")
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        started = time.perf_counter()
+        async with session_factory() as db:
+            travel_idea_group_id = await seed(db, ideas)
+        print(f"Seeded {ideas:,} ideas in {time.perf_counter() - started:.1f} s")
+        print(f"Exporting in batches of {settings.stream_batch_size}")
+
+        for export_format in ExportFormat:
+            async with session_factory() as db:
+                started = time.perf_counter()
+                size = await export(db, travel_idea_group_id, export_format)
+                elapsed = time.perf_counter() - started
+
+            # Measured in a second pass, as tracing allocations slows the export down several times over
+            tracemalloc.start()
+            async with session_factory() as db:
+                await export(db, travel_idea_group_id, export_format)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(
+                f"{export_format.value:>4}: {size / 1e6:.1f} MB in {elapsed:.1f} s "
+                f"({ideas / elapsed:,.0f} ideas/s), peak traced memory {peak / 1e6:.1f} MB"
+            )
+
+        if database_url:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ideas", type=int, default=1_000_000)
+    parser.add_argument(
+        "--database-url", help="An empty database to seed, whose tables are dropped afterwards. Refused if it has any"
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.ideas, args.database_url))
@@ -0,0 +1,99 @@
+"""Times importing travel ideas from CSV and GeoJSON uploads into a temporary SQLite database.
+
+Each upload is parsed, validated and inserted the way the import route does it, from a spooled file like the ones
+Starlette hands the route.
+
+Run from the repository root with: uv run python -m scripts.benchmark_import [--ideas 100000]
+"""
+
+import argparse
+import asyncio
+import csv
+import io
+import json
+import os
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_CLIENT_ID", "benchmark")
+os.environ.setdefault("GOOGLE_CLIENT_SECRET", "benchmark")
+
+from fastapi import UploadFile  # noqa: E402
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from app.core.uploads import RecordValidator, read_csv_records, read_geojson_records  # noqa: E402
+from app.database.init_db import Base  # noqa: E402
+from app.models import TravelIdeaGroup, UserAccount  # noqa: E402
+from app.schemas.travel_idea import MAX_IMPORT_ERRORS, TravelIdeaCreate  # noqa: E402
+from app.services.travel_idea import import_new_travel_ideas  # noqa: E402
+
+# Starlette's default, above which uploads are written to disk
+SPOOL_MAX_SIZE = 1024 * 1024
+
+
+def write_csv(upload: io.IOBase, ideas: int) -> None:
+    text = io.TextIOWrapper(upload, encoding="utf-8", newline="")
+    writer = csv.writer(text)
+    writer.writerow(["name", "notes", "imageUrl"])
+    for i in range(ideas):
+        writer.writerow([f"Idea {i}", 'Somewhere, worth "seeing"' if i % 3 else "", f"https://example.com/{i}.jpg"])
+    text.detach()
+
+
+def write_geojson(upload: io.IOBase, ideas: int) -> None:
+    upload.write(b'{"type": "FeatureCollection", "features": [')
+    for i in range(ideas):
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [-3.588, 37.176]},
+            "properties": {"name": f"Idea {i}", "imageUrl": f"https://example.com/{i}.jpg"},
+        }
+        upload.write((", " if i else "").encode() + json.dumps(feature).encode())
+    upload.write(b"]}")
+
+
+async def main(ideas: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{directory}/benchmark.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with session_factory() as db:
+            user = UserAccount(email="importer@email.com", name="Importer")
+            travel_idea_group = TravelIdeaGroup(name="Everywhere", owned_by=user)
+            db.add(travel_idea_group)
+            await db.commit()
+
+        print(f"Importing {ideas:,} ideas in batches of {settings.import_batch_size}")
+        formats = [("csv", write_csv, read_csv_records), ("geojson", write_geojson, read_geojson_records)]
+        for name, write, read in formats:
+            file = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)  # noqa: SIM115, closed with the upload
+            write(file, ideas)
+            size = file.tell()
+            file.seek(0)
+            upload = UploadFile(file, size=size)
+
+            async with session_factory() as db:
+                started = time.perf_counter()
+                validator = RecordValidator(TravelIdeaCreate, MAX_IMPORT_ERRORS)
+                imported = await import_new_travel_ideas(
+                    db, validator.valid_batches(read(upload, settings.import_batch_size)), user, travel_idea_group.id
+                )
+                elapsed = time.perf_counter() - started
+            await upload.close()
+
+            assert imported == ideas and validator.failed == 0
+            print(f"{name:>7}: {size / 1e6:.1f} MB in {elapsed:.1f} s ({ideas / elapsed:,.0f} ideas/s)")
+
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ideas", type=int, default=100_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.ideas))
@@ -0,0 +1,110 @@
+"""Compares the per-item cost of serializing list responses with and without validation.
+
+The validated path mirrors what FastAPI does with a route's response_model: build the schemas, validate the content
+against the response model, dump it to JSON-compatible Python and encode that with json.dumps.
+
+Run from the repository root with: uv run python -m scripts.benchmark_serialization
+"""
+
+import json
+import os
+import timeit
+
+os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("GOOGLE_CLIENT_ID", "benchmark")
+os.environ.setdefault("GOOGLE_CLIENT_SECRET", "benchmark")
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.core.responses import dump_json  # noqa: E402
+from app.models import TravelIdea, TravelIdeaGroup, TravelIdeaGroupInvitation, UserAccount  # noqa: E402
+from app.schemas.shared import Page, construct_page  # noqa: E402
+from app.schemas.travel_idea import TravelIdeaRead, construct_travel_idea  # noqa: E402
+from app.schemas.travel_idea_group import (  # noqa: E402
+    TravelIdeaGroupRead,
+    TravelIdeaGroupUser,
+    construct_travel_idea_group,
+)
+from app.schemas.travel_idea_group_invitation import (  # noqa: E402
+    TravelIdeaGroupInvitationRead,
+    construct_travel_idea_group_invitation,
+)
+
+ITEMS = 200
+REPEATS = 200
+
+
+def encode_validated(content: object, adapter: TypeAdapter) -> bytes:
+    value = adapter.validate_python(content, from_attributes=True)
+    return json.dumps(
+        adapter.dump_python(value, mode="json", by_alias=True), ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+def main() -> None:
+    owner = UserAccount(id=1, email="owner@email.com", name="Owner")
+    users = [UserAccount(id=i, email=f"user_{i}@email.com", name=f"User {i}") for i in range(2, ITEMS + 2)]
+    travel_idea_group = TravelIdeaGroup(id=1, name="Somewhere", owned_by=owner)
+    travel_ideas = [
+        TravelIdea(id=i, name=f"Idea {i}", notes="Some notes", image_url=f"img_{i}") for i in range(1, ITEMS + 1)
+    ]
+    invitations = [
+        TravelIdeaGroupInvitation(invitation_code=f"code_{i}", travel_idea_group=travel_idea_group, created_by=owner)
+        for i in range(ITEMS)
+    ]
+
+    def validated_group() -> TravelIdeaGroupRead:
+        return TravelIdeaGroupRead(
+            id=travel_idea_group.id,
+            name=travel_idea_group.name,
+            owned_by=TravelIdeaGroupUser(email=owner.email, name=owner.name),
+            shared_with=[TravelIdeaGroupUser(email=user.email, name=user.name) for user in users],
+        )
+
+    def validated_invitations() -> list[TravelIdeaGroupInvitationRead]:
+        return [
+            TravelIdeaGroupInvitationRead(
+                invitation_code=invitation.invitation_code,
+                travel_idea_group_name=invitation.travel_idea_group.name,
+                invited_by=TravelIdeaGroupUser(email=invitation.created_by.email, name=invitation.created_by.name),
+            )
+            for invitation in invitations
+        ]
+
+    travel_idea_page_adapter = TypeAdapter(Page[TravelIdeaRead])
+    travel_idea_group_adapter = TypeAdapter(TravelIdeaGroupRead)
+    invitation_list_adapter = TypeAdapter(list[TravelIdeaGroupInvitationRead])
+
+    cases = {
+        "travel idea list": (
+            lambda: encode_validated(
+                Page[TravelIdeaRead](items=travel_ideas, next_cursor=None), travel_idea_page_adapter
+            ),
+            lambda: dump_json(
+                construct_page([construct_travel_idea(travel_idea) for travel_idea in travel_ideas], None)
+            ),
+        ),
+        "group members": (
+            lambda: encode_validated(validated_group(), travel_idea_group_adapter),
+            lambda: dump_json(construct_travel_idea_group(travel_idea_group, users)),
+        ),
+        "invitation list": (
+            lambda: encode_validated(validated_invitations(), invitation_list_adapter),
+            lambda: dump_json([construct_travel_idea_group_invitation(invitation) for invitation in invitations]),
+        ),
+    }
+
+    print(f"Per-item cost over {ITEMS} items, best of 5 runs of {REPEATS}")
+    for name, (validated, constructed) in cases.items():
+        assert json.loads(validated()) == json.loads(constructed())
+        validated_us = min(timeit.repeat(validated, number=REPEATS, repeat=5)) / REPEATS / ITEMS * 1e6
+        constructed_us = min(timeit.repeat(constructed, number=REPEATS, repeat=5)) / REPEATS / ITEMS * 1e6
+        print(
+            f"{name:>17}: validated {validated_us:.2f} µs, constructed {constructed_us:.2f} µs "
+            f"({validated_us / constructed_us:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
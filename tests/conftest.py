@@ -1,24 +1,41 @@
 from collections.abc import AsyncGenerator
 
+import pytest
 import pytest_asyncio
 from httpx import AsyncClient
 from httpx._transports.asgi import ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.auth import get_current_user
-from app.database.init_db import Base, get_db
+from app.core.response_cache import response_cache
+from app.database.init_db import Base, enable_sqlite_foreign_keys, get_db, get_session_factory
+from app.database.instrumentation import instrument_engine
 from app.main import app
 from app.models import UserAccount
+from app.services.user_account import principal_cache
 
 engine = create_async_engine(
     "sqlite+aiosqlite:///:memory:",
     connect_args={"check_same_thread": False},
     echo=False,
 )
+enable_sqlite_foreign_keys(engine)
+instrument_engine(engine)
 
 TestingSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
 
 
+@pytest.fixture(autouse=True)
+def clear_principal_cache() -> None:
+    principal_cache.clear()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def clear_response_cache() -> None:
+    # Ids are reused once the database is recreated for the next test
+    await response_cache.close()
+
+
 @pytest_asyncio.fixture
 async def db_session() -> AsyncGenerator[AsyncSession]:
     async with engine.begin() as conn:
@@ -61,6 +78,7 @@ async def authenticated_client(db_session: AsyncSession, user: UserAccount) -> A
         return user
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
     app.dependency_overrides[get_current_user] = override_get_current_user
 
     transport = ASGITransport(app=app)
@@ -57,6 +57,11 @@ async def create_travel_idea_group(
     ]
     db_session.add(members[0])
     db_session.add(members[1])
+    db_session.add(
+        models.TravelIdeaGroupMember(
+            travel_idea_group=travel_idea_group, user_account=owner, role=TravelIdeaGroupRole.OWNER
+        )
+    )
 
     await db_session.commit()
     return travel_idea_group, users_to_make_members, owner
@@ -79,6 +84,11 @@ async def create_travel_idea_group_invitation(
         owned_by=creator,
     )
     db_session.add(travel_idea_group)
+    db_session.add(
+        models.TravelIdeaGroupMember(
+            travel_idea_group=travel_idea_group, user_account=creator, role=TravelIdeaGroupRole.OWNER
+        )
+    )
 
     invitation = models.TravelIdeaGroupInvitation(
         email=email,
@@ -0,0 +1,15 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from app.database.instrumentation import QueryStats, track_queries
+
+
+@contextmanager
+def query_budget(max_queries: int) -> Iterator[QueryStats]:
+    """Fails if the block executes more than max_queries statements, such as when a route regresses into N+1 queries."""
+    with track_queries(record_statements=True) as stats:
+        yield stats
+
+    assert stats.count <= max_queries, (
+        f"Executed {stats.count} queries, over the budget of {max_queries}:\n" + "\n".join(stats.statements)
+    )
@@ -0,0 +1,161 @@
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from app import models
+from app.core.auth import get_current_user, oauth
+from app.database.instrumentation import track_queries
+from app.services.user_account import (
+    build_session_principal,
+    cache_user_account,
+    principal_cache,
+    upsert_user_account,
+)
+
+
+def _request_with_session(session: dict) -> Request:
+    return Request({"type": "http", "session": session})
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_fails_not_authenticated(db_session: AsyncSession) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(_request_with_session({}), db_session)
+
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_fails_user_not_in_database(db_session: AsyncSession) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        await get_current_user(_request_with_session({"user": {"email": "nobody@nowhere.com"}}), db_session)
+
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_trusts_session_principal(db_session: AsyncSession, user: models.UserAccount) -> None:
+    request = _request_with_session({"user": build_session_principal(user)})
+
+    with track_queries() as stats:
+        first = await get_current_user(request, db_session)
+        second = await get_current_user(request, db_session)
+
+    assert first.id == second.id == user.id
+    assert second.email == user.email
+    assert second.name == user.name
+    assert stats.count == 0
+    assert principal_cache.hits == 1
+    assert principal_cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_reloads_stale_principal(db_session: AsyncSession, user: models.UserAccount) -> None:
+    stale_principal = build_session_principal(user)
+    await db_session.execute(
+        update(models.UserAccount).where(models.UserAccount.id == user.id).values(name="Renamed", version=2)
+    )
+    await db_session.commit()
+    await db_session.refresh(user)
+    cache_user_account(user)
+
+    request = _request_with_session({"user": stale_principal})
+    with track_queries() as stats:
+        current_user = await get_current_user(request, db_session)
+
+    assert current_user.name == "Renamed"
+    assert stats.count == 1
+    assert request.session["user"] == {"id": user.id, "email": user.email, "name": "Renamed", "version": 2}
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_upgrades_legacy_session(db_session: AsyncSession, user: models.UserAccount) -> None:
+    request = _request_with_session({"user": {"email": user.email, "given_name": user.name, "picture": "img"}})
+
+    current_user = await get_current_user(request, db_session)
+
+    assert current_user == user
+    assert request.session["user"] == {"id": user.id, "email": user.email, "name": user.name, "version": 1}
+
+
+@pytest.mark.asyncio
+async def test_upsert_user_account_creates_user(db_session: AsyncSession) -> None:
+    with track_queries() as stats:
+        user_account = await upsert_user_account(db_session, "new@user.com", "New")
+
+    assert user_account.id is not None
+    assert user_account.name == "New"
+    assert user_account.version == 1
+    assert stats.count == 2
+    assert principal_cache.get(user_account.id).email == "new@user.com"
+
+
+@pytest.mark.asyncio
+async def test_upsert_user_account_returns_existing_user(db_session: AsyncSession, user: models.UserAccount) -> None:
+    with track_queries() as stats:
+        user_account = await upsert_user_account(db_session, user.email, "Another name")
+
+    assert user_account.id == user.id
+    assert user_account.name == "Another name"
+    assert user_account.version == 2
+    assert stats.count == 4
+    user_count = await db_session.execute(select(func.count()).select_from(models.UserAccount))
+    assert user_count.scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_upsert_user_account_keeps_version_of_unchanged_name(
+    db_session: AsyncSession, user: models.UserAccount
+) -> None:
+    user_account = await upsert_user_account(db_session, user.email, user.name)
+
+    assert user_account.version == 1
+
+
+@pytest.mark.asyncio
+async def test_sign_in_with_new_name_reloads_older_sessions(db_session: AsyncSession) -> None:
+    older_principal = build_session_principal(await upsert_user_account(db_session, "new@user.com", "New"))
+    await upsert_user_account(db_session, "new@user.com", "Renamed")
+
+    request = _request_with_session({"user": older_principal})
+    with track_queries() as stats:
+        current_user = await get_current_user(request, db_session)
+
+    assert current_user.name == "Renamed"
+    assert stats.count == 1
+    assert request.session["user"] == {**older_principal, "name": "Renamed", "version": 2}
+
+
+@pytest.mark.asyncio
+async def test_upsert_user_account_matches_email_case_insensitively(
+    db_session: AsyncSession, user: models.UserAccount
+) -> None:
+    user_account = await upsert_user_account(db_session, " SomeBody@SomeWhere.com", "Somebody")
+
+    assert user_account.id == user.id
+    assert user_account.email == "somebody@somewhere.com"
+    user_count = await db_session.execute(select(func.count()).select_from(models.UserAccount))
+    assert user_count.scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_authenticate_stores_compact_principal(
+    client: AsyncClient, db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    async def authorize_access_token(request: Request) -> dict:
+        return {"userinfo": {"email": "new@user.com", "given_name": "New", "picture": "https://img"}}
+
+    monkeypatch.setattr(oauth.google, "authorize_access_token", authorize_access_token)
+
+    response = await client.get("/auth/callback")
+
+    assert response.status_code == 307
+    result = await db_session.execute(select(models.UserAccount))
+    user_account = result.scalars().one()
+    assert user_account.email == "new@user.com"
+
+    response = await client.get("/")
+    assert "Signed in as new@user.com (name: New)" in response.text
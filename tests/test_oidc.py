@@ -0,0 +1,105 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+from authlib.integrations.starlette_client import OAuth, StarletteOAuth2App
+
+from app.core.oidc import OIDCMetadataCache
+
+METADATA_URL = "https://fake-idp.test/.well-known/openid-configuration"
+METADATA = {"issuer": "https://fake-idp.test", "jwks_uri": "https://fake-idp.test/jwks"}
+JWKS = {"keys": [{"kty": "oct", "kid": "1", "k": "c2VjcmV0"}]}
+
+
+class FakeOIDCProvider:
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+        self.failing = False
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(str(request.url))
+        if self.failing:
+            return httpx.Response(503)
+        if str(request.url) == METADATA_URL:
+            return httpx.Response(200, json=METADATA)
+        if str(request.url) == METADATA["jwks_uri"]:
+            return httpx.Response(200, json=JWKS)
+        return httpx.Response(404)
+
+
+def _create_oauth_app(transport: httpx.AsyncBaseTransport) -> StarletteOAuth2App:
+    oauth = OAuth()
+    return oauth.register(
+        name="fake", client_id="id", server_metadata_url=METADATA_URL, client_kwargs={"transport": transport}
+    )
+
+
+def _create_metadata_cache(
+    provider: FakeOIDCProvider, cache_path: Path, ttl_seconds: float = 60
+) -> tuple[OIDCMetadataCache, StarletteOAuth2App]:
+    transport = httpx.MockTransport(provider.handle)
+    oauth_app = _create_oauth_app(transport)
+    cache = OIDCMetadataCache(oauth_app, METADATA_URL, cache_path, ttl_seconds, transport)
+    return cache, oauth_app
+
+
+@pytest.mark.asyncio
+async def test_load_prewarms_metadata_and_jwks(tmp_path: Path) -> None:
+    provider = FakeOIDCProvider()
+    cache, oauth_app = _create_metadata_cache(provider, tmp_path / "oidc.json")
+
+    await cache.load()
+    provider.requests.clear()
+
+    metadata = await oauth_app.load_server_metadata()
+    jwks = await oauth_app.fetch_jwk_set()
+
+    assert metadata["issuer"] == METADATA["issuer"]
+    assert jwks == JWKS
+    assert provider.requests == []
+
+
+@pytest.mark.asyncio
+async def test_load_uses_persisted_metadata(tmp_path: Path) -> None:
+    cache_path = tmp_path / "oidc.json"
+    await _create_metadata_cache(FakeOIDCProvider(), cache_path)[0].load()
+
+    provider = FakeOIDCProvider()
+    cache, oauth_app = _create_metadata_cache(provider, cache_path)
+    await cache.load()
+
+    assert provider.requests == []
+    assert oauth_app.server_metadata["jwks"] == JWKS
+
+
+@pytest.mark.asyncio
+async def test_load_serves_stale_metadata_when_refresh_fails(tmp_path: Path) -> None:
+    cache_path = tmp_path / "oidc.json"
+    cache_path.write_text(json.dumps({"metadata": {**METADATA, "jwks": JWKS}, "fetched_at": time.time() - 120}))
+
+    provider = FakeOIDCProvider()
+    provider.failing = True
+    cache, oauth_app = _create_metadata_cache(provider, cache_path)
+    await cache.load()
+
+    assert len(provider.requests) == 1
+    assert cache.is_expired
+    assert oauth_app.server_metadata["jwks"] == JWKS
+
+
+@pytest.mark.asyncio
+async def test_background_refresh_replaces_expired_metadata(tmp_path: Path) -> None:
+    provider = FakeOIDCProvider()
+    cache, oauth_app = _create_metadata_cache(provider, tmp_path / "oidc.json", ttl_seconds=0.05)
+
+    await cache.start()
+    first_fetched_at = cache.fetched_at
+    await asyncio.sleep(0.12)
+    await cache.stop()
+
+    assert len(provider.requests) >= 4
+    assert cache.fetched_at > first_fetched_at
+    assert oauth_app.server_metadata["_loaded_at"] == cache.fetched_at
@@ -0,0 +1,150 @@
+import json
+import re
+from datetime import UTC, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models
+from app.core.config import settings
+from app.core.server_timing import ServerTimingMiddleware
+from app.main import app
+from app.schemas.enums import TravelIdeaGroupInvitationStatus, TravelIdeaGroupRole
+from tests.factory import create_travel_idea_group, create_travel_idea_group_invitation
+from tests.query_budget import query_budget
+
+# Enough of everything that a query per row would go over budget
+ROWS = 5
+NEW_EMAILS = [f"new_{i}@email.com" for i in range(ROWS)]
+NEW_TRAVEL_IDEAS = [{"name": f"Idea {i}", "imageUrl": "img"} for i in range(ROWS)]
+
+
+@pytest_asyncio.fixture
+async def ids(db_session: AsyncSession, user: models.UserAccount) -> dict[str, object]:
+    travel_idea_group, members, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+    travel_ideas = [
+        models.TravelIdea(
+            name=f"Idea {i}", image_url=f"img_{i}", created_by=members[i % 2], travel_idea_group=travel_idea_group
+        )
+        for i in range(ROWS)
+    ]
+    invitations = [
+        models.TravelIdeaGroupInvitation(
+            email=f"invitee_{i}@email.com",
+            invitation_code=f"code_{i}",
+            status=TravelIdeaGroupInvitationStatus.PENDING,
+            expires_at=datetime.now(UTC) + timedelta(weeks=2),
+            created_by=user,
+            travel_idea_group=travel_idea_group,
+        )
+        for i in range(ROWS)
+    ]
+    db_session.add_all([*travel_ideas, *invitations])
+    await db_session.commit()
+
+    for i in range(ROWS):
+        await create_travel_idea_group(
+            db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER, name_prefix=f"shared_{i}"
+        )
+        await create_travel_idea_group_invitation(
+            db_session,
+            user.email,
+            TravelIdeaGroupInvitationStatus.PENDING,
+            name_prefix=f"invited_{i}",
+            expires_at=datetime.now(UTC) + timedelta(weeks=2),
+        )
+
+    return {"group": travel_idea_group.id, "idea": travel_ideas[0].id}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("method", "path", "body", "max_queries"),
+    [
+        ("GET", "/travel-idea-group/", None, 1),
+        ("POST", "/travel-idea-group/", {"name": "New"}, 2),
+        ("GET", "/travel-idea-group/{group}", None, 3),
+        ("PUT", "/travel-idea-group/{group}", {"name": "Renamed"}, 5),
+        ("DELETE", "/travel-idea-group/{group}", None, 3),
+        ("POST", "/travel-idea-group/{group}/clone", {"name": "Cloned"}, 4),
+        ("GET", "/travel-idea-group/{group}/export", None, 2),
+        ("GET", "/travel-idea-group/{group}/invitation", None, 2),
+        ("POST", "/travel-idea-group/{group}/invitation", {"email": NEW_EMAILS[0]}, 4),
+        ("DELETE", "/travel-idea-group/{group}/invitation", {"email": "invitee_0@email.com"}, 4),
+        ("POST", "/travel-idea-group/{group}/invitation/bulk", {"emails": NEW_EMAILS}, 4),
+        ("GET", "/travel-idea-group/{group}/travel-idea/", None, 2),
+        ("GET", "/travel-idea-group/{group}/travel-idea/{idea}", None, 1),
+        ("POST", "/travel-idea-group/{group}/travel-idea/", {"name": "Idea", "imageUrl": "img"}, 3),
+        ("POST", "/travel-idea-group/{group}/travel-idea/bulk", NEW_TRAVEL_IDEAS, 3),
+        ("PATCH", "/travel-idea-group/{group}/travel-idea/{idea}", {"name": "Renamed"}, 2),
+        ("DELETE", "/travel-idea-group/{group}/travel-idea/{idea}", None, 2),
+        ("GET", "/invitation/", None, 1),
+        ("PATCH", "/invitation/invited_0_code", {"status": "accepted"}, 3),
+    ],
+)
+async def test_route_stays_within_query_budget(
+    authenticated_client: AsyncClient,
+    ids: dict[str, object],
+    method: str,
+    path: str,
+    body: object,
+    max_queries: int,
+) -> None:
+    with query_budget(max_queries):
+        response = await authenticated_client.request(method, path.format(**ids), json=body)
+
+    assert response.status_code < 300, response.text
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("import_format", "upload"),
+    [
+        ("csv", "name,imageUrl\n" + "".join(f"Idea {i},img_{i}\n" for i in range(4 * ROWS))),
+        (
+            "geojson",
+            json.dumps(
+                {
+                    "type": "FeatureCollection",
+                    "features": [
+                        {"properties": {"name": f"Idea {i}", "imageUrl": f"img_{i}"}} for i in range(4 * ROWS)
+                    ],
+                }
+            ),
+        ),
+    ],
+)
+async def test_import_stays_within_query_budget(
+    authenticated_client: AsyncClient,
+    ids: dict[str, object],
+    monkeypatch: pytest.MonkeyPatch,
+    import_format: str,
+    upload: str,
+) -> None:
+    # Two batches, each inserted by one statement, so a query per row would go over budget
+    monkeypatch.setattr(settings, "import_batch_size", 2 * ROWS)
+
+    with query_budget(4):
+        response = await authenticated_client.post(
+            f"/travel-idea-group/{ids['group']}/travel-idea/import",
+            params={"format": import_format},
+            files={"file": ("upload", upload.encode())},
+        )
+
+    assert response.status_code == 200, response.text
+    assert response.json()["imported"] == 4 * ROWS
+
+
+@pytest.mark.asyncio
+async def test_server_timing_reports_queries(authenticated_client: AsyncClient, ids: dict[str, object]) -> None:
+    # The middleware is off by default, so it's wrapped around the app here rather than enabled in settings
+    transport = ASGITransport(app=ServerTimingMiddleware(app))
+    async with AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.get(f"/travel-idea-group/{ids['group']}/travel-idea/")
+
+    assert response.status_code == 200
+    assert re.fullmatch(r'db;dur=\d+\.\d;desc="2 queries", app;dur=\d+\.\d', response.headers["server-timing"])
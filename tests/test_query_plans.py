@@ -0,0 +1,147 @@
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models
+from app.schemas.enums import TravelIdeaGroupInvitationStatus, TravelIdeaGroupRole
+from app.schemas.travel_idea import TravelIdeaCreate, TravelIdeaUpdate
+from app.schemas.travel_idea_group import TravelIdeaGroupUpdate
+from app.services.travel_idea import (
+    create_new_travel_idea,
+    delete_travel_idea_from_db,
+    get_travel_idea_with_access,
+    get_travel_ideas,
+    update_existing_travel_idea,
+)
+from app.services.travel_idea_group import (
+    delete_travel_idea_group_from_db,
+    get_travel_idea_group_access,
+    get_travel_idea_group_by_id,
+    get_travel_idea_group_summaries,
+    update_existing_travel_idea_group,
+)
+from app.services.travel_idea_group_invitation import (
+    accept_or_reject_travel_idea_group_invitation,
+    delete_dead_travel_idea_group_invitations,
+    delete_travel_idea_group_invitation,
+    get_members_and_invitees,
+    get_outstanding_invitations_for_travel_idea_group,
+    get_travel_idea_group_invitation_for_travel_idea_group,
+    get_travel_idea_group_invitations,
+)
+from app.services.user_account import get_user_by_email, get_user_for_session_principal, upsert_user_account
+from tests.factory import create_travel_idea_group, create_travel_idea_group_invitation
+
+# Any "SCAN" step reads a whole table or index; everything on a hot path should be a "SEARCH"
+FULL_SCAN = re.compile(r"^SCAN (?!CONSTANT ROW)")
+
+
+@contextmanager
+def _capture_statements(db_session: AsyncSession) -> Iterator[list[tuple[str, tuple]]]:
+    statements = []
+
+    def before_cursor_execute(*args: object) -> None:
+        statement, parameters, _, executemany = args[2:]
+        # The plan of an executemany is the same for every parameter set
+        statements.append((statement, parameters[0] if executemany else parameters))
+
+    sync_engine = db_session.get_bind()
+    event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+
+async def _assert_no_full_scans(db_session: AsyncSession, statements: list[tuple[str, tuple]]) -> None:
+    connection = await db_session.connection()
+    explained = 0
+    for statement, parameters in statements:
+        if not statement.startswith(("SELECT", "UPDATE", "DELETE")):
+            continue
+
+        result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        scans = [detail for _, _, _, detail in result if FULL_SCAN.match(detail)]
+        assert scans == [], f"{statement} -> {scans}"
+        explained += 1
+
+    assert explained > 0
+
+
+@pytest.mark.asyncio
+async def test_user_account_queries_use_indexes(db_session: AsyncSession, user: models.UserAccount) -> None:
+    principal = {"id": user.id, "email": user.email, "name": user.name, "version": user.version + 1}
+
+    with _capture_statements(db_session) as statements:
+        await get_user_by_email(db_session, user.email)
+        await get_user_for_session_principal(db_session, principal)
+        await upsert_user_account(db_session, user.email, user.name)
+        await upsert_user_account(db_session, user.email, "Renamed")
+
+    await _assert_no_full_scans(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_travel_idea_group_queries_use_indexes(db_session: AsyncSession, user: models.UserAccount) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(db_session, user, TravelIdeaGroupRole.OWNER)
+    await create_travel_idea_group(db_session, user, TravelIdeaGroupRole.MEMBER, "other")
+
+    with _capture_statements(db_session) as statements:
+        await get_travel_idea_group_access(db_session, travel_idea_group.id, user.id)
+        await get_travel_idea_group_by_id(db_session, travel_idea_group.id)
+        await get_travel_idea_group_summaries(db_session, user.id, 10)
+        await get_travel_idea_group_summaries(db_session, user.id, 10, (travel_idea_group.name, travel_idea_group.id))
+        await update_existing_travel_idea_group(db_session, TravelIdeaGroupUpdate(name="New name"), travel_idea_group)
+        await delete_travel_idea_group_from_db(db_session, travel_idea_group.id)
+
+    await _assert_no_full_scans(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_travel_idea_queries_use_indexes(db_session: AsyncSession, user: models.UserAccount) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(db_session, user, TravelIdeaGroupRole.MEMBER)
+    travel_idea = await create_new_travel_idea(
+        db_session, TravelIdeaCreate(name="Paris", image_url="paris.jpg"), user, travel_idea_group.id
+    )
+
+    with _capture_statements(db_session) as statements:
+        await get_travel_idea_with_access(db_session, travel_idea_group.id, travel_idea.id, user.id)
+        await get_travel_ideas(db_session, travel_idea_group.id, 10)
+        await get_travel_ideas(db_session, travel_idea_group.id, 10, travel_idea.id)
+        await update_existing_travel_idea(
+            db_session, TravelIdeaUpdate(name="Rome"), travel_idea_group.id, travel_idea.id, user.id
+        )
+        await delete_travel_idea_from_db(db_session, travel_idea_group.id, travel_idea.id, user.id)
+
+    await _assert_no_full_scans(db_session, statements)
+
+
+@pytest.mark.asyncio
+async def test_travel_idea_group_invitation_queries_use_indexes(
+    db_session: AsyncSession, user: models.UserAccount
+) -> None:
+    expires_at = datetime.now(UTC) + timedelta(days=1)
+    invitation, travel_idea_group, _ = await create_travel_idea_group_invitation(
+        db_session, user.email, TravelIdeaGroupInvitationStatus.PENDING, "accepted", expires_at
+    )
+    other_invitation, _, _ = await create_travel_idea_group_invitation(
+        db_session, user.email, TravelIdeaGroupInvitationStatus.PENDING, "revoked", expires_at
+    )
+
+    with _capture_statements(db_session) as statements:
+        await get_travel_idea_group_invitations(db_session, user.email)
+        await get_travel_idea_group_invitation_for_travel_idea_group(db_session, travel_idea_group.id, user.email)
+        await get_outstanding_invitations_for_travel_idea_group(db_session, travel_idea_group.id)
+        await get_members_and_invitees(db_session, travel_idea_group.id, [user.email, "someone@email.com"])
+        await accept_or_reject_travel_idea_group_invitation(
+            db_session, invitation.invitation_code, user, TravelIdeaGroupInvitationStatus.ACCEPTED
+        )
+        await delete_travel_idea_group_invitation(db_session, other_invitation)
+        await delete_dead_travel_idea_group_invitations(db_session, 100)
+
+    await _assert_no_full_scans(db_session, statements)
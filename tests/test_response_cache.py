@@ -0,0 +1,93 @@
+import asyncio
+from collections.abc import AsyncGenerator
+
+import pytest
+import pytest_asyncio
+
+from app.core.response_cache import (
+    MemoryResponseCacheBackend,
+    RedisResponseCacheBackend,
+    ResponseCache,
+    ResponseCacheBackend,
+)
+
+
+@pytest_asyncio.fixture
+async def backend() -> AsyncGenerator[ResponseCacheBackend]:
+    backend = MemoryResponseCacheBackend(max_size=100, ttl_seconds=60)
+    yield backend
+    await backend.close()
+
+
+@pytest.mark.asyncio
+async def test_response_cache_stores_responses(backend: ResponseCacheBackend) -> None:
+    response_cache = ResponseCache(backend, ttl_seconds=60)
+
+    key = await response_cache.key("travel-idea-group:1", "travel-idea", 50)
+    assert await response_cache.get(key) is None
+
+    await response_cache.set(key, b'{"items": []}')
+
+    assert await response_cache.key("travel-idea-group:1", "travel-idea", 50) == key
+    assert await response_cache.get(key) == b'{"items": []}'
+    assert await response_cache.get(await response_cache.key("travel-idea-group:2", "travel-idea", 50)) is None
+
+
+@pytest.mark.asyncio
+async def test_response_cache_invalidates_scope(backend: ResponseCacheBackend) -> None:
+    response_cache = ResponseCache(backend, ttl_seconds=60)
+    group_key = await response_cache.key("travel-idea-group:1")
+    other_group_key = await response_cache.key("travel-idea-group:2")
+    await response_cache.set(group_key, b"group")
+    await response_cache.set(other_group_key, b"other group")
+
+    await response_cache.invalidate("travel-idea-group:1")
+
+    new_group_key = await response_cache.key("travel-idea-group:1")
+    assert new_group_key != group_key
+    assert await response_cache.get(new_group_key) is None
+    assert await response_cache.get(other_group_key) == b"other group"
+
+
+@pytest.mark.asyncio
+async def test_response_cache_expires_entries(backend: ResponseCacheBackend) -> None:
+    response_cache = ResponseCache(backend, ttl_seconds=60)
+    key = await response_cache.key("invitations:somebody@somewhere.com")
+
+    await response_cache.set(key, b"expiring", ttl_seconds=0.05)
+    await response_cache.set(await response_cache.key("invitations:nobody@somewhere.com"), b"expired", ttl_seconds=0)
+    assert await response_cache.get(key) == b"expiring"
+
+    await asyncio.sleep(0.1)
+
+    assert await response_cache.get(key) is None
+    assert await response_cache.get(await response_cache.key("invitations:nobody@somewhere.com")) is None
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_evicts_least_recently_used() -> None:
+    backend = MemoryResponseCacheBackend(max_size=2, ttl_seconds=60)
+    await backend.set("a", b"a", 60)
+    await backend.set("b", b"b", 60)
+    await backend.get("a")
+
+    await backend.set("c", b"c", 60)
+
+    assert await backend.get("a") == b"a"
+    assert await backend.get("b") is None
+    assert await backend.get("c") == b"c"
+
+
+@pytest.mark.asyncio
+async def test_redis_backend_unavailable_is_treated_as_a_miss(caplog: pytest.LogCaptureFixture) -> None:
+    # Nothing listens on port 1, so every command fails to connect
+    backend = RedisResponseCacheBackend("redis://127.0.0.1:1/0", timeout_seconds=1)
+    response_cache = ResponseCache(backend, ttl_seconds=60)
+
+    assert await response_cache.key("travel-idea-group:1") is None
+    assert await response_cache.get("travel-idea-group:1:version:key") is None
+    await response_cache.set("travel-idea-group:1:version:key", b"value")
+    await response_cache.invalidate("travel-idea-group:1")
+    await backend.close()
+
+    assert "Response cache unavailable" in caplog.text
@@ -0,0 +1,61 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+import pytest
+from pydantic_core import to_jsonable_python
+
+from app import models
+from app.schemas.shared import BaseSchema, Page, SchemaDict, construct_page
+from app.schemas.travel_idea import (
+    TravelIdeaExport,
+    TravelIdeaRead,
+    construct_travel_idea,
+    construct_travel_idea_export,
+)
+from app.schemas.travel_idea_group import (
+    TravelIdeaGroupRead,
+    TravelIdeaGroupSummary,
+    construct_travel_idea_group,
+    construct_travel_idea_group_summary,
+)
+from app.schemas.travel_idea_group_invitation import (
+    TravelIdeaGroupInvitationRead,
+    construct_travel_idea_group_invitation,
+)
+
+owner = models.UserAccount(id=1, email="owner@email.com", name="Owner")
+member = models.UserAccount(id=2, email="member@email.com", name="Member")
+travel_idea_group = models.TravelIdeaGroup(id=1, name="Somewhere", owned_by=owner)
+travel_idea = models.TravelIdea(id=1, name="Idea", notes=None, image_url="https://example.com/idea.jpg")
+export_row = SimpleNamespace(
+    id=1,
+    name="Idea",
+    notes="Some notes",
+    image_url="https://example.com/idea.jpg",
+    created_at=datetime(2026, 1, 1, tzinfo=UTC),
+    created_by_name="Owner",
+)
+
+
+@pytest.mark.parametrize(
+    ("schema", "content"),
+    [
+        (TravelIdeaRead, construct_travel_idea(travel_idea)),
+        (TravelIdeaExport, construct_travel_idea_export(export_row)),
+        (TravelIdeaGroupRead, construct_travel_idea_group(travel_idea_group, [member])),
+        (TravelIdeaGroupSummary, construct_travel_idea_group_summary(travel_idea_group, 2)),
+        (
+            TravelIdeaGroupInvitationRead,
+            construct_travel_idea_group_invitation(
+                models.TravelIdeaGroupInvitation(
+                    invitation_code="code", travel_idea_group=travel_idea_group, created_by=owner
+                )
+            ),
+        ),
+        (Page[TravelIdeaRead], construct_page([construct_travel_idea(travel_idea)], "cursor")),
+    ],
+)
+def test_constructed_content_matches_schema(schema: type[BaseSchema], content: SchemaDict) -> None:
+    # Keys must follow the fields' order too, as the CSV export's columns do
+    assert list(content) == [field.alias or name for name, field in schema.model_fields.items()]
+    assert schema.model_validate(content).model_dump(mode="json") == to_jsonable_python(content)
@@ -0,0 +1,92 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.sweeper import InvitationSweeper
+from app.models.travel_idea_group_invitation import TravelIdeaGroupInvitation
+from app.schemas.enums import TravelIdeaGroupInvitationStatus
+from tests.factory import create_travel_idea_group_invitation
+
+
+async def _create_invitations(db_session: AsyncSession) -> None:
+    in_two_weeks = datetime.now(UTC) + timedelta(weeks=2)
+    a_second_ago = datetime.now(UTC) - timedelta(seconds=1)
+    invitations = [
+        ("pending", TravelIdeaGroupInvitationStatus.PENDING, in_two_weeks),
+        ("rejected", TravelIdeaGroupInvitationStatus.REJECTED, in_two_weeks),
+        ("accepted", TravelIdeaGroupInvitationStatus.ACCEPTED, in_two_weeks),
+        ("pending_expired", TravelIdeaGroupInvitationStatus.PENDING, a_second_ago),
+        ("rejected_expired", TravelIdeaGroupInvitationStatus.REJECTED, a_second_ago),
+    ]
+    for name_prefix, status, expires_at in invitations:
+        await create_travel_idea_group_invitation(db_session, "someone@email.com", status, name_prefix, expires_at)
+
+
+async def _invitation_codes(db_session: AsyncSession) -> list[str]:
+    result = await db_session.execute(select(TravelIdeaGroupInvitation.invitation_code))
+    return sorted(result.scalars().all())
+
+
+def _create_sweeper(db_session: AsyncSession, batch_size: int = 2) -> InvitationSweeper:
+    session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False, class_=AsyncSession)
+    return InvitationSweeper(session_factory, interval_seconds=60, batch_size=batch_size)
+
+
+@pytest.mark.asyncio
+async def test_sweep_deletes_expired_and_accepted_invitations_in_batches(db_session: AsyncSession) -> None:
+    await _create_invitations(db_session)
+
+    deleted = await _create_sweeper(db_session, batch_size=2).sweep()
+
+    assert deleted == 3
+    assert await _invitation_codes(db_session) == ["pending_code", "rejected_code"]
+
+
+@pytest.mark.asyncio
+async def test_sweeper_runs_in_background(db_session: AsyncSession) -> None:
+    await _create_invitations(db_session)
+    sweeper = _create_sweeper(db_session)
+
+    await sweeper.start()
+    try:
+        async with asyncio.timeout(5):
+            while len(await _invitation_codes(db_session)) > 2:
+                await asyncio.sleep(0.01)
+    finally:
+        await sweeper.stop()
+
+    assert await _invitation_codes(db_session) == ["pending_code", "rejected_code"]
+
+
+@pytest.mark.asyncio
+async def test_sweeper_keeps_running_after_an_error(
+    db_session: AsyncSession, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    sweeper = InvitationSweeper(
+        async_sessionmaker(db_session.bind, class_=AsyncSession), interval_seconds=0, batch_size=2
+    )
+    sweeps = 0
+    swept = asyncio.Event()
+
+    async def sweep() -> int:
+        nonlocal sweeps
+        sweeps += 1
+        if sweeps == 1:
+            raise OSError("Connection reset")
+        swept.set()
+        return 0
+
+    monkeypatch.setattr(sweeper, "sweep", sweep)
+
+    await sweeper.start()
+    try:
+        async with asyncio.timeout(5):
+            await swept.wait()
+    finally:
+        await sweeper.stop()
+
+    assert sweeps >= 2
+    assert "Could not delete expired or accepted invitations" in caplog.text
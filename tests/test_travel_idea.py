@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from httpx import AsyncClient
 from pytest import FixtureRequest
@@ -5,6 +7,9 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import models
+from app.core import uploads
+from app.core.config import settings
+from app.core.pagination import encode_cursor
 from app.schemas.enums import TravelIdeaGroupRole
 from tests.factory import create_travel_idea_group
 
@@ -138,6 +143,254 @@ async def test_create_travel_idea(
     assert travel_idea.notes == request_body["notes"]
 
 
+@pytest.mark.asyncio
+async def test_create_travel_ideas_fails_not_a_member(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(db_session, user)
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/travel-idea/bulk",
+        json=[{"name": "Alhambra", "imageUrl": "img_123"}],
+    )
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Not authorised to access this travel idea group"
+
+
+@pytest.mark.asyncio
+async def test_create_travel_ideas_reports_invalid_items(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+
+    request_body = [
+        {"name": "Alhambra", "imageUrl": "img_123"},
+        {"notes": "Something noteworthy", "imageUrl": "img_456"},
+        {"name": "Vilnius"},
+    ]
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/travel-idea/bulk", json=request_body
+    )
+
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [["body", 1, "name"], ["body", 2, "imageUrl"]]
+
+    result = await db_session.execute(select(models.TravelIdea))
+    assert result.scalars().all() == []
+
+
+@pytest.mark.asyncio
+async def test_create_travel_ideas_fails_empty(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+
+    response = await authenticated_client.post(f"/travel-idea-group/{travel_idea_group.id}/travel-idea/bulk", json=[])
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_create_travel_ideas(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+
+    request_body = [
+        {"name": "Alhambra", "imageUrl": "img_123", "notes": "A beautiful palace"},
+        {"name": "Vancouver", "imageUrl": "img_456", "notes": None},
+        {"name": "Vilnius", "imageUrl": "img_789", "notes": None},
+    ]
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/travel-idea/bulk", json=request_body
+    )
+
+    assert response.status_code == 201, response.json()
+    response_json = response.json()
+    ids = [travel_idea.pop("id") for travel_idea in response_json]
+    assert response_json == request_body
+
+    result = await db_session.execute(select(models.TravelIdea).order_by(models.TravelIdea.id))
+    travel_ideas = result.scalars().all()
+    assert [travel_idea.id for travel_idea in travel_ideas] == ids
+    assert [travel_idea.name for travel_idea in travel_ideas] == ["Alhambra", "Vancouver", "Vilnius"]
+    assert all(travel_idea.travel_idea_group_id == travel_idea_group.id for travel_idea in travel_ideas)
+    assert all(travel_idea.created_by_id == user.id for travel_idea in travel_ideas)
+
+
+async def _imported_travel_ideas(db_session: AsyncSession) -> list[tuple[str, str | None, str]]:
+    result = await db_session.execute(
+        select(models.TravelIdea.name, models.TravelIdea.notes, models.TravelIdea.image_url).order_by(
+            models.TravelIdea.id
+        )
+    )
+    return [tuple(row) for row in result]
+
+
+@pytest.mark.asyncio
+async def test_import_travel_ideas_fails_not_a_member(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(db_session, user)
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/travel-idea/import",
+        params={"format": "csv"},
+        files={"file": ("ideas.csv", b"name,imageUrl\nAlhambra,img_123\n")},
+    )
+
+    assert response.status_code == 403
+    assert await _imported_travel_ideas(db_session) == []
+
+
+@pytest.mark.asyncio
+async def test_import_travel_ideas_from_csv(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "import_batch_size", 2)
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+    upload = (
+        "\ufeffname,notes,imageUrl,ignored\r\n"
+        'Alhambra,"A beautiful, ""old""\r\npalace",img_123,x\r\n'
+        ",Missing a name,img_456,x\r\n"
+        "Vancouver,,img_789,x\r\n"
+        "Vilnius\r\n"
+        "Tallinn,,img_012,x\r\n"
+    ).encode()
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/travel-idea/import",
+        params={"format": "csv"},
+        files={"file": ("ideas.csv", upload, "text/csv")},
+    )
+
+    assert response.status_code == 200, response.json()
+    assert response.json() == {
+        "imported": 3,
+        "failed": 2,
+        "errors": [
+            {"row": 2, "errors": [{"type": "string_type", "loc": ["name"], "msg": "Input should be a valid string"}]},
+            {
+                "row": 4,
+                "errors": [{"type": "string_type", "loc": ["imageUrl"], "msg": "Input should be a valid string"}],
+            },
+        ],
+    }
+    assert await _imported_travel_ideas(db_session) == [
+        ("Alhambra", 'A beautiful, "old"\r\npalace', "img_123"),
+        ("Vancouver", None, "img_789"),
+        ("Tallinn", None, "img_012"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_travel_ideas_from_geojson(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Small enough that values are split across chunks
+    monkeypatch.setattr(uploads, "CHUNK_SIZE", 7)
+    monkeypatch.setattr(settings, "import_batch_size", 2)
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+    features = [
+        {"name": "Alhambra", "notes": "A beautiful palace", "imageUrl": "img_123", "rating": 12345},
+        {"name": "x" * 51, "imageUrl": "img_456"},
+        {"name": "Vancouver", "image_url": "img_789"},
+        {"name": "Vilnius"},
+        {"name": "Tallinn", "imageUrl": "img_012"},
+    ]
+    upload = {
+        "type": "FeatureCollection",
+        "name": "Saved places",
+        "features": [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [-3.588, 37.176]},
+                "properties": properties,
+            }
+            for properties in features
+        ],
+        "bbox": [-180, -90, 180, 90],
+    }
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/travel-idea/import",
+        params={"format": "geojson"},
+        files={"file": ("places.geojson", json.dumps(upload, indent=2).encode(), "application/geo+json")},
+    )
+
+    assert response.status_code == 200, response.json()
+    assert response.json()["imported"] == 3
+    assert response.json()["failed"] == 2
+    assert [(error["row"], error["errors"][0]["type"]) for error in response.json()["errors"]] == [
+        (2, "string_too_long"),
+        (4, "missing"),
+    ]
+    assert await _imported_travel_ideas(db_session) == [
+        ("Alhambra", "A beautiful palace", "img_123"),
+        ("Vancouver", None, "img_789"),
+        ("Tallinn", None, "img_012"),
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("import_format", "upload"),
+    [
+        ("csv", "name,imageUrl\nAlhambra,img_123\n".encode("utf-16")),
+        ("geojson", b'{"type": "Feature", "properties": {}}'),
+        ("geojson", b'{"type": "FeatureCollection", "features": [{"properties": {"name": "Alhambra"}}'),
+        ("geojson", b'{"type": "FeatureCollection", "features": []} []'),
+    ],
+)
+async def test_import_travel_ideas_fails_invalid_file(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    import_format: str,
+    upload: bytes,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/travel-idea/import",
+        params={"format": import_format},
+        files={"file": ("upload", upload)},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid")
+    assert await _imported_travel_ideas(db_session) == []
+
+
 @pytest.mark.asyncio
 async def test_get_travel_idea_fails_travel_idea_group_doesnt_exist(authenticated_client: AsyncClient) -> None:
     response = await authenticated_client.get("/travel-idea-group/404/travel-idea/1")
@@ -162,6 +415,25 @@ async def test_get_travel_idea_fails_travel_idea_doesnt_exist(
     assert response.json()["detail"] == "Travel idea not found"
 
 
+@pytest.mark.asyncio
+async def test_get_travel_idea_fails_travel_idea_in_another_group(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea, _ = await _create_single_travel_idea(db_session, user, TravelIdeaGroupRole.MEMBER)
+    other_travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER, name_prefix="other"
+    )
+
+    response = await authenticated_client.get(
+        f"/travel-idea-group/{other_travel_idea_group.id}/travel-idea/{travel_idea.id}"
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Travel idea not found"
+
+
 @pytest.mark.asyncio
 async def test_get_travel_idea_fails_not_a_member(
     authenticated_client: AsyncClient,
@@ -195,6 +467,28 @@ async def test_get_travel_idea(
     }
 
 
+@pytest.mark.asyncio
+async def test_get_travel_idea_not_modified(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea, travel_idea_group = await _create_single_travel_idea(db_session, user, TravelIdeaGroupRole.MEMBER)
+    url = f"/travel-idea-group/{travel_idea_group.id}/travel-idea/{travel_idea.id}"
+    response = await authenticated_client.get(url)
+    etag = response.headers["ETag"]
+
+    response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    await authenticated_client.patch(url, json={"name": "Granada"})
+    response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Granada"
+    assert response.headers["ETag"] != etag
+
+
 @pytest.mark.asyncio
 async def test_get_travel_ideas_fails_travel_idea_group_doesnt_exist(authenticated_client: AsyncClient) -> None:
     response = await authenticated_client.get("/travel-idea-group/404/travel-idea/")
@@ -230,7 +524,7 @@ async def test_get_travel_ideas_empty_list(
     response = await authenticated_client.get(f"/travel-idea-group/{travel_idea_group.id}/travel-idea/")
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {"items": [], "nextCursor": None}
 
 
 @pytest.mark.asyncio
@@ -244,22 +538,173 @@ async def test_get_travel_ideas(
     response = await authenticated_client.get(f"/travel-idea-group/{travel_idea_group.id}/travel-idea/")
 
     assert response.status_code == 200
-    assert response.json() == [
-        {
-            "id": travel_ideas[0].id,
-            "name": travel_ideas[0].name,
-            "imageUrl": travel_ideas[0].image_url,
-            "notes": travel_ideas[0].notes,
-        },
-        {
-            "id": travel_ideas[1].id,
-            "name": travel_ideas[1].name,
-            "imageUrl": travel_ideas[1].image_url,
-            "notes": travel_ideas[1].notes,
-        },
+    assert response.json() == {
+        "items": [
+            {
+                "id": travel_ideas[0].id,
+                "name": travel_ideas[0].name,
+                "imageUrl": travel_ideas[0].image_url,
+                "notes": travel_ideas[0].notes,
+            },
+            {
+                "id": travel_ideas[1].id,
+                "name": travel_ideas[1].name,
+                "imageUrl": travel_ideas[1].image_url,
+                "notes": travel_ideas[1].notes,
+            },
+        ],
+        "nextCursor": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_travel_ideas_is_cached_until_a_travel_idea_changes(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea, travel_idea_group = await _create_single_travel_idea(db_session, user, TravelIdeaGroupRole.MEMBER)
+    url = f"/travel-idea-group/{travel_idea_group.id}/travel-idea/"
+    travel_idea_id = travel_idea.id
+    response = await authenticated_client.get(url)
+    assert [item["name"] for item in response.json()["items"]] == ["Alhambra"]
+
+    db_session.add(
+        models.TravelIdea(
+            name="Added behind the cache", image_url="img", created_by=user, travel_idea_group=travel_idea_group
+        )
+    )
+    await db_session.commit()
+    response = await authenticated_client.get(url)
+    assert [item["name"] for item in response.json()["items"]] == ["Alhambra"]
+
+    await authenticated_client.patch(f"{url}{travel_idea_id}", json={"name": "Granada"})
+    response = await authenticated_client.get(url)
+    assert [item["name"] for item in response.json()["items"]] == ["Granada", "Added behind the cache"]
+
+    await authenticated_client.delete(f"{url}{travel_idea_id}")
+    response = await authenticated_client.get(url)
+    assert [item["name"] for item in response.json()["items"]] == ["Added behind the cache"]
+
+
+@pytest.mark.asyncio
+async def test_get_travel_ideas_paginated(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, members, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+    travel_ideas = [
+        models.TravelIdea(
+            name=f"Idea {i}", image_url=f"img_{i}", created_by=members[0], travel_idea_group=travel_idea_group
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(travel_ideas)
+    await db_session.commit()
+
+    url = f"/travel-idea-group/{travel_idea_group.id}/travel-idea/"
+    pages = []
+    response = await authenticated_client.get(url, params={"limit": 2})
+    pages.append(response.json())
+    while pages[-1]["nextCursor"]:
+        response = await authenticated_client.get(url, params={"limit": 2, "cursor": pages[-1]["nextCursor"]})
+        assert response.status_code == 200
+        pages.append(response.json())
+
+    assert [[item["id"] for item in page["items"]] for page in pages] == [
+        [travel_ideas[0].id, travel_ideas[1].id],
+        [travel_ideas[2].id, travel_ideas[3].id],
+        [travel_ideas[4].id],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_travel_ideas_streamed(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "stream_batch_size", 2)
+    travel_idea_group, members, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+    travel_ideas = [
+        models.TravelIdea(
+            name=f"Idea {i}", image_url=f"img_{i}", created_by=members[0], travel_idea_group=travel_idea_group
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(travel_ideas)
+    await db_session.commit()
+
+    url = f"/travel-idea-group/{travel_idea_group.id}/travel-idea/"
+    first_page = await authenticated_client.get(url, params={"limit": 1})
+
+    # Everything after the cursor, in batches smaller than the list, regardless of the limit
+    response = await authenticated_client.get(
+        url,
+        params={"limit": 1, "cursor": first_page.json()["nextCursor"]},
+        headers={"Accept": "application/x-ndjson"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"id": travel_idea.id, "name": travel_idea.name, "notes": None, "imageUrl": travel_idea.image_url}
+        for travel_idea in travel_ideas[1:]
     ]
 
 
+@pytest.mark.asyncio
+async def test_get_travel_ideas_streamed_fails_not_a_member(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    _, travel_idea_group = await _create_single_travel_idea(db_session, user)
+
+    response = await authenticated_client.get(
+        f"/travel-idea-group/{travel_idea_group.id}/travel-idea/", headers={"Accept": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        "WyJhIl0=",
+        "W10=",
+        encode_cursor(True),
+        encode_cursor(10**29),
+        encode_cursor(2**63),
+        encode_cursor(-(2**63) - 1),
+    ],
+)
+async def test_get_travel_ideas_fails_invalid_cursor(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    cursor: str,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+
+    response = await authenticated_client.get(
+        f"/travel-idea-group/{travel_idea_group.id}/travel-idea/", params={"cursor": cursor}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
 @pytest.mark.asyncio
 async def test_update_travel_idea_fails_travel_idea_group_doesnt_exist(authenticated_client: AsyncClient) -> None:
     response = await authenticated_client.patch("/travel-idea-group/404/travel-idea/1", json={"notes": "New notes"})
@@ -1,15 +1,23 @@
+import csv
+import io
+import json
 from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app import models
+from app.core.config import settings
+from app.core.pagination import encode_cursor
+from app.database.instrumentation import track_queries
 from app.models.travel_idea import TravelIdea
 from app.models.travel_idea_group import TravelIdeaGroup
 from app.models.travel_idea_group_invitation import TravelIdeaGroupInvitation
 from app.schemas.enums import TravelIdeaGroupInvitationStatus, TravelIdeaGroupRole
+from app.services.travel_idea_group import get_travel_idea_group_access
+from app.services.user_account import upsert_user_account
 from tests.factory import create_travel_idea_group, create_travel_idea_group_invitation
 
 
@@ -43,6 +51,87 @@ async def test_create_travel_idea_group(
     assert len(travel_idea_group) == 1
     assert travel_idea_group[0].name == "Our travel bucket list"
 
+    result = await db_session.execute(select(models.TravelIdeaGroupMember))
+    membership = result.scalars().one()
+    assert membership.user_account_id == user.id
+    assert membership.travel_idea_group_id == travel_idea_group[0].id
+    assert membership.role == TravelIdeaGroupRole.OWNER
+
+
+@pytest.mark.asyncio
+async def test_clone_travel_idea_group_fails_not_found(authenticated_client: AsyncClient) -> None:
+    response = await authenticated_client.post("/travel-idea-group/1/clone", json={"name": "Our trip"})
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_clone_travel_idea_group_fails_not_a_member(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(db_session, user)
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/clone", json={"name": "Our trip"}
+    )
+
+    assert response.status_code == 403
+    result = await db_session.execute(select(func.count()).select_from(TravelIdeaGroup))
+    assert result.scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_clone_travel_idea_group(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    travel_idea_group, members, owner = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+    travel_ideas = [
+        TravelIdea(
+            name=f"Idea {i}",
+            notes="Some notes" if i % 2 else None,
+            image_url=f"img_{i}",
+            created_by=owner if i % 2 else members[1],
+            travel_idea_group=travel_idea_group,
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(travel_ideas)
+    await db_session.commit()
+
+    with track_queries(record_statements=True) as stats:
+        response = await authenticated_client.post(
+            f"/travel-idea-group/{travel_idea_group.id}/clone", json={"name": "Our trip"}
+        )
+
+    assert response.status_code == 201
+    response_json = response.json()
+    clone_id = response_json.pop("id")
+    assert clone_id != travel_idea_group.id
+    assert response_json == {"name": "Our trip", "ownedBy": {"email": user.email, "name": user.name}, "sharedWith": []}
+
+    # The ideas are copied by one INSERT ... SELECT
+    inserts = [statement for statement in stats.statements if statement.startswith("INSERT INTO travel_idea ")]
+    assert len(inserts) == 1
+    assert "SELECT" in inserts[0]
+
+    result = await db_session.execute(
+        select(TravelIdea.travel_idea_group_id, TravelIdea.name, TravelIdea.notes, TravelIdea.image_url)
+        .where(TravelIdea.created_by_id == user.id)
+        .order_by(TravelIdea.id)
+    )
+    assert [tuple(row) for row in result] == [
+        (clone_id, travel_idea.name, travel_idea.notes, travel_idea.image_url) for travel_idea in travel_ideas
+    ]
+    result = await db_session.execute(
+        select(func.count()).select_from(TravelIdea).where(TravelIdea.travel_idea_group_id == travel_idea_group.id)
+    )
+    assert result.scalar() == 3
+
+    access = await get_travel_idea_group_access(db_session, clone_id, user.id)
+    assert access.role == TravelIdeaGroupRole.OWNER
+
 
 @pytest.mark.asyncio
 async def test_create_travel_idea_group_invitation_fails_not_found(
@@ -119,6 +208,40 @@ async def test_create_travel_idea_group_invitation_fails_invitee_is_the_owner(
     assert response.json()["detail"] == "User can already access this travel idea group"
 
 
+@pytest.mark.asyncio
+async def test_create_travel_idea_group_invitation_fails_invitee_is_the_owner_different_case(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    travel_idea_group, _, owner = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/invitation", json={"email": owner.email.upper()}
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "User can already access this travel idea group"
+
+
+@pytest.mark.asyncio
+async def test_create_travel_idea_group_invitation_normalises_email(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/invitation", json={"email": "Name@Website.com"}
+    )
+
+    assert response.status_code == 201
+
+    result = await db_session.execute(select(TravelIdeaGroupInvitation.email))
+    assert result.scalars().all() == ["name@website.com"]
+
+
 @pytest.mark.asyncio
 async def test_create_travel_idea_group_invitation(
     db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
@@ -148,6 +271,96 @@ async def test_create_travel_idea_group_invitation(
     assert invitation.travel_idea_group == travel_idea_group
 
 
+@pytest.mark.asyncio
+async def test_create_travel_idea_group_invitations_fails_not_owner(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/invitation/bulk", json={"emails": ["name@website.com"]}
+    )
+
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Not authorised to perform this action"
+
+
+@pytest.mark.asyncio
+async def test_create_travel_idea_group_invitations_fails_invalid_email(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/invitation/bulk",
+        json={"emails": ["name@website.com", "namewebsite.com"]},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "emails", 1]
+
+
+@pytest.mark.asyncio
+async def test_create_travel_idea_group_invitations(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    travel_idea_group, members, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+    db_session.add(
+        models.TravelIdeaGroupInvitation(
+            email="invited@website.com",
+            invitation_code="invited",
+            status=TravelIdeaGroupInvitationStatus.PENDING,
+            expires_at=datetime.now(UTC) + timedelta(weeks=1),
+            created_by=user,
+            travel_idea_group=travel_idea_group,
+        )
+    )
+    db_session.add(
+        models.TravelIdeaGroupInvitation(
+            email="expired@website.com",
+            invitation_code="expired",
+            status=TravelIdeaGroupInvitationStatus.PENDING,
+            expires_at=datetime.now(UTC) - timedelta(seconds=1),
+            created_by=user,
+            travel_idea_group=travel_idea_group,
+        )
+    )
+    await db_session.commit()
+
+    emails = ["One@Website.com", user.email, members[0].email.upper(), "invited@website.com", "expired@website.com"]
+    response = await authenticated_client.post(
+        f"/travel-idea-group/{travel_idea_group.id}/invitation/bulk", json={"emails": emails + ["one@website.com"]}
+    )
+
+    assert response.status_code == 201
+    assert response.json() == {
+        "invited": ["one@website.com", "expired@website.com"],
+        "alreadyMembers": [user.email, members[0].email],
+        "alreadyInvited": ["invited@website.com"],
+    }
+
+    result = await db_session.execute(
+        select(TravelIdeaGroupInvitation)
+        .where(TravelIdeaGroupInvitation.expires_at > datetime.now(UTC))
+        .order_by(TravelIdeaGroupInvitation.id)
+    )
+    invitations = result.scalars().all()
+    assert [invitation.email for invitation in invitations] == [
+        "invited@website.com",
+        "one@website.com",
+        "expired@website.com",
+    ]
+    assert len({invitation.invitation_code for invitation in invitations}) == 3
+    assert all(invitation.status == TravelIdeaGroupInvitationStatus.PENDING for invitation in invitations)
+    assert all(invitation.created_by_id == user.id for invitation in invitations)
+
+
 @pytest.mark.asyncio
 async def test_get_travel_idea_group_fails_doesnt_exist(authenticated_client: AsyncClient) -> None:
     response = await authenticated_client.get("/travel-idea-group/4")
@@ -194,6 +407,147 @@ async def test_get_travel_idea_group(
     }
 
 
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_is_cached_until_updated(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+    travel_idea_group_id = travel_idea_group.id
+    response = await authenticated_client.get(f"/travel-idea-group/{travel_idea_group_id}")
+    cached_name = response.json()["name"]
+
+    await db_session.execute(
+        update(TravelIdeaGroup)
+        .where(TravelIdeaGroup.id == travel_idea_group_id)
+        .values(name="Changed behind the cache")
+    )
+    await db_session.commit()
+    response = await authenticated_client.get(f"/travel-idea-group/{travel_idea_group_id}")
+    assert response.json()["name"] == cached_name
+
+    await authenticated_client.put(f"/travel-idea-group/{travel_idea_group_id}", json={"name": "A new name"})
+    response = await authenticated_client.get(f"/travel-idea-group/{travel_idea_group_id}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "A new name"
+
+
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_is_invalidated_when_a_member_signs_in_renamed(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+    travel_idea_group_id = travel_idea_group.id
+    response = await authenticated_client.get(f"/travel-idea-group/{travel_idea_group_id}")
+    etag = response.headers["ETag"]
+
+    await upsert_user_account(db_session, user.email, "Renamed")
+
+    response = await authenticated_client.get(
+        f"/travel-idea-group/{travel_idea_group_id}", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert {"email": user.email, "name": "Renamed"} in response.json()["sharedWith"]
+
+
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_not_modified(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+    url = f"/travel-idea-group/{travel_idea_group.id}"
+    response = await authenticated_client.get(url)
+    etag = response.headers["ETag"]
+    assert etag == 'W/"1"'
+
+    response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    await authenticated_client.post(f"{url}/travel-idea/", json={"name": "Alhambra", "imageUrl": "img_123"})
+    response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] == 'W/"2"'
+
+
+@pytest.mark.asyncio
+async def test_travel_idea_group_version_is_bumped_by_every_write(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+    travel_idea_group_id = travel_idea_group.id
+    url = f"/travel-idea-group/{travel_idea_group_id}"
+
+    async def get_version() -> int:
+        return await db_session.scalar(
+            select(TravelIdeaGroup.version).where(TravelIdeaGroup.id == travel_idea_group_id)
+        )
+
+    response = await authenticated_client.post(f"{url}/travel-idea/", json={"name": "Alhambra", "imageUrl": "img"})
+    travel_idea_id = response.json()["id"]
+    await authenticated_client.post(f"{url}/travel-idea/bulk", json=[{"name": "Granada", "imageUrl": "img"}])
+    await authenticated_client.patch(f"{url}/travel-idea/{travel_idea_id}", json={"notes": "Book ahead"})
+    await authenticated_client.delete(f"{url}/travel-idea/{travel_idea_id}")
+    await authenticated_client.post(f"{url}/invitation", json={"email": "invitee@email.com"})
+    await authenticated_client.post(f"{url}/invitation/bulk", json={"emails": ["other_invitee@email.com"]})
+    await authenticated_client.request("DELETE", f"{url}/invitation", json={"email": "invitee@email.com"})
+    await authenticated_client.put(url, json={"name": "A new name"})
+
+    assert await get_version() == 9
+
+
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_cache_still_checks_access(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+    response = await authenticated_client.get(f"/travel-idea-group/{travel_idea_group.id}")
+    assert response.status_code == 200
+
+    await db_session.execute(
+        delete(models.TravelIdeaGroupMember).where(models.TravelIdeaGroupMember.user_account_id == user.id)
+    )
+    await db_session.commit()
+    response = await authenticated_client.get(f"/travel-idea-group/{travel_idea_group.id}")
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("role", [TravelIdeaGroupRole.OWNER, TravelIdeaGroupRole.MEMBER, None])
+async def test_get_travel_idea_group_access(
+    db_session: AsyncSession, user: models.UserAccount, role: TravelIdeaGroupRole | None
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(db_session, user, current_user_role=role)
+
+    access = await get_travel_idea_group_access(db_session, travel_idea_group.id, user.id)
+
+    assert access.role == role
+    assert await get_travel_idea_group_access(db_session, 404, user.id) is None
+
+
 @pytest.mark.asyncio
 async def test_get_travel_idea_group_invitations_fails_doesnt_exist(authenticated_client: AsyncClient) -> None:
     response = await authenticated_client.get("/travel-idea-group/4/invitation")
@@ -202,6 +556,36 @@ async def test_get_travel_idea_group_invitations_fails_doesnt_exist(authenticate
     assert response.json()["detail"] == "Travel idea group not found"
 
 
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_invitations_not_modified(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    invitation, travel_idea_group, _ = await create_travel_idea_group_invitation(
+        db_session,
+        "invitee@email.com",
+        TravelIdeaGroupInvitationStatus.PENDING,
+        "expiring",
+        datetime.now(UTC) + timedelta(weeks=2),
+        creator=user,
+    )
+    url = f"/travel-idea-group/{travel_idea_group.id}/invitation"
+    response = await authenticated_client.get(url)
+    etag = response.headers["ETag"]
+
+    response = await authenticated_client.get(url, headers={"If-None-Match": f'W/"0", {etag}'})
+    assert response.status_code == 304
+
+    # Expiring doesn't write to the group, so it doesn't bump the version either
+    invitation.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+    await db_session.commit()
+    response = await authenticated_client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == []
+
+
 @pytest.mark.asyncio
 async def test_get_travel_idea_group_invitations_fails_not_owner(
     authenticated_client: AsyncClient,
@@ -218,6 +602,158 @@ async def test_get_travel_idea_group_invitations_fails_not_owner(
     assert response.json()["detail"] == "Not authorised to perform this action"
 
 
+async def _create_travel_ideas_to_export(
+    db_session: AsyncSession, user: models.UserAccount
+) -> tuple[models.TravelIdeaGroup, list[TravelIdea]]:
+    travel_idea_group, members, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.MEMBER
+    )
+    travel_ideas = [
+        TravelIdea(
+            name=f"Idea {i}",
+            notes='Quotes, "commas" and\nnew lines' if i == 0 else None,
+            image_url=f"img_{i}",
+            created_by=members[i % 2],
+            travel_idea_group=travel_idea_group,
+        )
+        for i in range(5)
+    ]
+    db_session.add_all(travel_ideas)
+    await db_session.commit()
+    return travel_idea_group, travel_ideas
+
+
+@pytest.mark.asyncio
+async def test_export_travel_idea_group_fails_not_a_member(
+    authenticated_client: AsyncClient, db_session: AsyncSession, user: models.UserAccount
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(db_session, user)
+
+    response = await authenticated_client.get(f"/travel-idea-group/{travel_idea_group.id}/export")
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_export_travel_idea_group_as_json(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "stream_batch_size", 2)
+    travel_idea_group, travel_ideas = await _create_travel_ideas_to_export(db_session, user)
+
+    response = await authenticated_client.get(
+        f"/travel-idea-group/{travel_idea_group.id}/export", params={"format": "json"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["content-disposition"] == (
+        f'attachment; filename="travel-idea-group-{travel_idea_group.id}.json"'
+    )
+    assert response.json() == [
+        {
+            "id": travel_idea.id,
+            "name": travel_idea.name,
+            "notes": travel_idea.notes,
+            "imageUrl": travel_idea.image_url,
+            "createdAt": travel_idea.created_at.isoformat(),
+            "createdByName": travel_idea.created_by.name,
+        }
+        for travel_idea in travel_ideas
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_travel_idea_group_as_csv(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "stream_batch_size", 2)
+    travel_idea_group, travel_ideas = await _create_travel_ideas_to_export(db_session, user)
+
+    response = await authenticated_client.get(
+        f"/travel-idea-group/{travel_idea_group.id}/export", params={"format": "csv"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/csv; charset=utf-8"
+    assert list(csv.reader(io.StringIO(response.text))) == [
+        ["name", "notes", "imageUrl", "id", "createdAt", "createdByName"],
+        *(
+            [
+                travel_idea.name,
+                travel_idea.notes or "",
+                travel_idea.image_url,
+                str(travel_idea.id),
+                travel_idea.created_at.isoformat(),
+                travel_idea.created_by.name,
+            ]
+            for travel_idea in travel_ideas
+        ),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_travel_idea_group_as_csv_escapes_formulas(
+    authenticated_client: AsyncClient, db_session: AsyncSession, user: models.UserAccount
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+    names = ['=HYPERLINK("https://example.com", "Click")', "+1", "-1", "@SUM(A1)", "\tTab", "\rReturn", "Fine = ok"]
+    db_session.add_all(
+        TravelIdea(
+            name=name, notes="=cmd|' /C calc'!A0", image_url="img", created_by=user, travel_idea_group=travel_idea_group
+        )
+        for name in names
+    )
+    await db_session.commit()
+
+    response = await authenticated_client.get(
+        f"/travel-idea-group/{travel_idea_group.id}/export", params={"format": "csv"}
+    )
+
+    rows = list(csv.reader(io.StringIO(response.text)))[1:]
+    assert [row[0] for row in rows] == [
+        '\'=HYPERLINK("https://example.com", "Click")',
+        "'+1",
+        "'-1",
+        "'@SUM(A1)",
+        "'\tTab",
+        "'\rReturn",
+        "Fine = ok",
+    ]
+    assert {row[1] for row in rows} == {"'=cmd|' /C calc'!A0"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("export_format", "content"), [("json", "[]"), ("csv", "name,notes,imageUrl,id,createdAt,createdByName\r\n")]
+)
+async def test_export_travel_idea_group_empty(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    export_format: str,
+    content: str,
+) -> None:
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+
+    response = await authenticated_client.get(
+        f"/travel-idea-group/{travel_idea_group.id}/export", params={"format": export_format}
+    )
+
+    assert response.status_code == 200
+    assert response.text == content
+
+
 @pytest.mark.asyncio
 async def test_get_travel_idea_group_invitations(
     authenticated_client: AsyncClient,
@@ -306,7 +842,7 @@ async def test_get_travel_idea_groups_none_exist(authenticated_client: AsyncClie
     response = await authenticated_client.get("/travel-idea-group/")
 
     assert response.status_code == 200
-    assert response.json() == []
+    assert response.json() == {"items": [], "nextCursor": None}
 
 
 @pytest.mark.asyncio
@@ -333,27 +869,105 @@ async def test_get_travel_idea_groups(
 
     assert response.status_code == 200
 
-    assert len(response.json()) == 2
-    assert response.json() == [
-        {
-            "id": owned_travel_idea_group.id,
-            "name": owned_travel_idea_group.name,
-            "ownedBy": {"email": owned_group_owner.email, "name": owned_group_owner.name},
-            "sharedWith": [
-                {"email": owned_group_members[0].email, "name": owned_group_members[0].name},
-                {"email": owned_group_members[1].email, "name": owned_group_members[1].name},
-            ],
-        },
-        {
-            "id": shared_travel_idea_group.id,
-            "name": shared_travel_idea_group.name,
-            "ownedBy": {"email": shared_group_owner.email, "name": shared_group_owner.name},
-            "sharedWith": [
-                {"email": shared_group_members[0].email, "name": shared_group_members[0].name},
-                {"email": shared_group_members[1].email, "name": shared_group_members[1].name},
-            ],
-        },
+    assert response.json() == {
+        "items": [
+            {
+                "id": owned_travel_idea_group.id,
+                "name": owned_travel_idea_group.name,
+                "ownedBy": {"email": owned_group_owner.email, "name": owned_group_owner.name},
+                "memberCount": len(owned_group_members),
+            },
+            {
+                "id": shared_travel_idea_group.id,
+                "name": shared_travel_idea_group.name,
+                "ownedBy": {"email": shared_group_owner.email, "name": shared_group_owner.name},
+                "memberCount": len(shared_group_members),
+            },
+        ],
+        "nextCursor": None,
+    }
+
+
+@pytest.mark.asyncio
+async def test_get_travel_idea_groups_paginated(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+) -> None:
+    # Groups with the same name are ordered by id
+    travel_idea_groups = [
+        models.TravelIdeaGroup(
+            name=name,
+            owned_by=user,
+            memberships=[models.TravelIdeaGroupMember(user_account=user, role=TravelIdeaGroupRole.OWNER)],
+        )
+        for name in ["b", "a", "b", "c", "a"]
+    ]
+    db_session.add_all(travel_idea_groups)
+    await db_session.commit()
+
+    pages = []
+    response = await authenticated_client.get("/travel-idea-group/", params={"limit": 2})
+    pages.append(response.json())
+    while pages[-1]["nextCursor"]:
+        response = await authenticated_client.get(
+            "/travel-idea-group/", params={"limit": 2, "cursor": pages[-1]["nextCursor"]}
+        )
+        assert response.status_code == 200
+        pages.append(response.json())
+
+    assert [[item["id"] for item in page["items"]] for page in pages] == [
+        [travel_idea_groups[1].id, travel_idea_groups[4].id],
+        [travel_idea_groups[0].id, travel_idea_groups[2].id],
+        [travel_idea_groups[3].id],
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cursor_values", [("a",), ("a", "1"), ("a", False), ("a", 2**63)])
+async def test_get_travel_idea_groups_fails_invalid_cursor(
+    authenticated_client: AsyncClient, cursor_values: tuple[object, ...]
+) -> None:
+    response = await authenticated_client.get("/travel-idea-group/", params={"cursor": encode_cursor(*cursor_values)})
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid cursor"
+
+
+@pytest.mark.asyncio
+async def test_get_travel_idea_groups_streamed(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "stream_batch_size", 2)
+    travel_idea_groups = [
+        models.TravelIdeaGroup(
+            name=name,
+            owned_by=user,
+            memberships=[models.TravelIdeaGroupMember(user_account=user, role=TravelIdeaGroupRole.OWNER)],
+        )
+        for name in ["b", "a", "b", "c", "a"]
     ]
+    db_session.add_all(travel_idea_groups)
+    await db_session.commit()
+
+    response = await authenticated_client.get(
+        "/travel-idea-group/", params={"limit": 1}, headers={"Accept": "application/json, application/x-ndjson"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line)["id"] for line in response.text.splitlines()] == [
+        travel_idea_groups[i].id for i in [1, 4, 0, 2, 3]
+    ]
+    assert json.loads(response.text.splitlines()[0]) == {
+        "id": travel_idea_groups[1].id,
+        "name": "a",
+        "ownedBy": {"email": user.email, "name": user.name},
+        "memberCount": 0,
+    }
 
 
 @pytest.mark.asyncio
@@ -477,6 +1091,46 @@ async def test_delete_travel_idea_group(
     assert group_members.scalar() == 0
 
 
+@pytest.mark.asyncio
+async def test_delete_travel_idea_group_in_background(
+    authenticated_client: AsyncClient,
+    db_session: AsyncSession,
+    user: models.UserAccount,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "travel_idea_group_delete_chunk_size", 2)
+    travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER
+    )
+    other_travel_idea_group, _, _ = await create_travel_idea_group(
+        db_session, user, current_user_role=TravelIdeaGroupRole.OWNER, name_prefix="other"
+    )
+    db_session.add_all(
+        [
+            models.TravelIdea(name=f"Idea {i}", image_url="img", created_by=user, travel_idea_group=group)
+            for i in range(5)
+            for group in (travel_idea_group, other_travel_idea_group)
+        ]
+    )
+    await db_session.commit()
+    travel_idea_group_id, other_travel_idea_group_id = travel_idea_group.id, other_travel_idea_group.id
+
+    response = await authenticated_client.delete(
+        f"/travel-idea-group/{travel_idea_group_id}", params={"background": True}
+    )
+
+    assert response.status_code == 202
+    assert response.content == b""
+    assert "content-type" not in response.headers
+
+    db_session.expire_all()
+    assert await db_session.get(TravelIdeaGroup, travel_idea_group_id) is None
+    travel_ideas = await db_session.execute(select(TravelIdea.travel_idea_group_id).distinct())
+    assert travel_ideas.scalars().all() == [other_travel_idea_group_id]
+    group_members = await db_session.execute(select(models.TravelIdeaGroupMember.travel_idea_group_id).distinct())
+    assert group_members.scalars().all() == [other_travel_idea_group_id]
+
+
 @pytest.mark.asyncio
 async def test_revoke_travel_idea_group_invitation_fails_doesnt_exist(authenticated_client: AsyncClient) -> None:
     response = await authenticated_client.request(
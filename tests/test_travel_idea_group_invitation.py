@@ -1,4 +1,7 @@
+import json
+import time
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 
 import pytest
 from httpx import AsyncClient
@@ -7,7 +10,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app import models
-from app.schemas.enums import TravelIdeaGroupInvitationResponseStatus, TravelIdeaGroupInvitationStatus
+from app.core import cache
+from app.schemas.enums import (
+    TravelIdeaGroupInvitationResponseStatus,
+    TravelIdeaGroupInvitationStatus,
+    TravelIdeaGroupRole,
+)
+from app.services.user_account import upsert_user_account
 from tests.factory import create_travel_idea_group_invitation
 
 
@@ -85,6 +94,126 @@ async def test_get_travel_idea_group_invitations(
     ]
 
 
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_invitations_streamed(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    for name_prefix in ["first", "second"]:
+        await create_travel_idea_group_invitation(
+            db_session,
+            user.email,
+            TravelIdeaGroupInvitationStatus.PENDING,
+            name_prefix=name_prefix,
+            expires_at=datetime.now(UTC) + timedelta(weeks=2),
+        )
+
+    response = await authenticated_client.get("/invitation/", headers={"Accept": "application/x-ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {
+            "invitationCode": f"{name_prefix}_code",
+            "travelIdeaGroupName": f"Some list ({name_prefix})",
+            "invitedBy": {"email": f"user_{name_prefix}_1@email.com", "name": f"user_{name_prefix}_1"},
+        }
+        for name_prefix in ["first", "second"]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_invitations_is_cached_until_responded_to(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    invitation, travel_idea_group, _ = await create_travel_idea_group_invitation(
+        db_session,
+        user.email,
+        TravelIdeaGroupInvitationStatus.PENDING,
+        name_prefix="pending",
+        expires_at=datetime.now(UTC) + timedelta(weeks=2),
+    )
+    invitation_code = invitation.invitation_code
+    response = await authenticated_client.get("/invitation/")
+    assert [invitation["travelIdeaGroupName"] for invitation in response.json()] == ["Some list (pending)"]
+
+    travel_idea_group.name = "Renamed behind the cache"
+    await db_session.commit()
+    response = await authenticated_client.get("/invitation/")
+    assert [invitation["travelIdeaGroupName"] for invitation in response.json()] == ["Some list (pending)"]
+
+    await authenticated_client.patch(
+        f"/invitation/{invitation_code}", json={"status": TravelIdeaGroupInvitationResponseStatus.REJECTED.value}
+    )
+    response = await authenticated_client.get("/invitation/")
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_invitations_is_invalidated_when_the_inviter_signs_in_renamed(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    _, _, creator = await create_travel_idea_group_invitation(
+        db_session,
+        user.email,
+        TravelIdeaGroupInvitationStatus.PENDING,
+        name_prefix="pending",
+        expires_at=datetime.now(UTC) + timedelta(weeks=2),
+    )
+    response = await authenticated_client.get("/invitation/")
+    assert [invitation["invitedBy"]["name"] for invitation in response.json()] == [creator.name]
+
+    await upsert_user_account(db_session, creator.email, "Renamed")
+
+    response = await authenticated_client.get("/invitation/")
+    assert [invitation["invitedBy"]["name"] for invitation in response.json()] == ["Renamed"]
+
+
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_invitations_is_not_cached_past_expiry(
+    db_session: AsyncSession,
+    authenticated_client: AsyncClient,
+    user: models.UserAccount,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Expires well within the response cache's TTL, which must be cut short to match
+    invitation, _, _ = await create_travel_idea_group_invitation(
+        db_session,
+        user.email,
+        TravelIdeaGroupInvitationStatus.PENDING,
+        name_prefix="expiring",
+        expires_at=datetime.now(UTC) + timedelta(seconds=60),
+    )
+    response = await authenticated_client.get("/invitation/")
+    assert len(response.json()) == 1
+
+    # Moves the invitation and the cache's clock past the expiry rather than waiting for it
+    invitation.expires_at = datetime.now(UTC) - timedelta(seconds=1)
+    await db_session.commit()
+    later = time.monotonic() + 61
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: later))
+    response = await authenticated_client.get("/invitation/")
+
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_get_travel_idea_group_invitations_matches_email_case_insensitively(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    await create_travel_idea_group_invitation(
+        db_session,
+        user.email.upper(),
+        TravelIdeaGroupInvitationStatus.PENDING,
+        name_prefix="pending",
+        expires_at=datetime.now(UTC) + timedelta(weeks=2),
+    )
+
+    response = await authenticated_client.get("/invitation/")
+
+    assert response.status_code == 200
+    assert [invitation["invitationCode"] for invitation in response.json()] == ["pending_code"]
+
+
 @pytest.mark.asyncio
 async def test_accept_or_reject_travel_idea_group_invitation_fails_missing_status(
     db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
@@ -231,7 +360,11 @@ async def test_reject_travel_idea_group_invitation(
     db_session.expire_all()
     updated_invitation = await db_session.get(models.TravelIdeaGroupInvitation, invitation_id)
     assert updated_invitation.status == TravelIdeaGroupInvitationStatus.REJECTED
-    group_members = await db_session.execute(select(func.count()).select_from(models.TravelIdeaGroupMember))
+    group_members = await db_session.execute(
+        select(func.count())
+        .select_from(models.TravelIdeaGroupMember)
+        .where(models.TravelIdeaGroupMember.role == TravelIdeaGroupRole.MEMBER)
+    )
     assert group_members.scalar() == 0
 
 
@@ -263,11 +396,57 @@ async def test_accept_travel_idea_group_invitation(
     assert updated_invitation.status == TravelIdeaGroupInvitationStatus.ACCEPTED
 
     result = await db_session.execute(
-        select(models.TravelIdeaGroupMember).options(
+        select(models.TravelIdeaGroupMember)
+        .options(
             joinedload(models.TravelIdeaGroupMember.user_account),
             joinedload(models.TravelIdeaGroupMember.travel_idea_group),
         )
+        .where(models.TravelIdeaGroupMember.role == TravelIdeaGroupRole.MEMBER)
     )
     member = result.scalar_one()
     assert member.user_account == user
     assert member.travel_idea_group == travel_idea_group
+
+
+@pytest.mark.asyncio
+async def test_accept_travel_idea_group_invitation_when_already_a_member(
+    db_session: AsyncSession, authenticated_client: AsyncClient, user: models.UserAccount
+) -> None:
+    invitation, travel_idea_group, _ = await create_travel_idea_group_invitation(
+        db_session,
+        user.email,
+        TravelIdeaGroupInvitationStatus.PENDING,
+        name_prefix="rejoining",
+        expires_at=datetime.now(UTC) + timedelta(weeks=2),
+    )
+    db_session.add(
+        models.TravelIdeaGroupMember(
+            travel_idea_group=travel_idea_group, user_account=user, role=TravelIdeaGroupRole.MEMBER
+        )
+    )
+    await db_session.commit()
+    invitation_code = invitation.invitation_code
+    travel_idea_group_id = travel_idea_group.id
+
+    response = await authenticated_client.patch(
+        f"/invitation/{invitation_code}",
+        json={"status": TravelIdeaGroupInvitationResponseStatus.ACCEPTED.value},
+    )
+    assert response.status_code == 200
+
+    response = await authenticated_client.patch(
+        f"/invitation/{invitation_code}",
+        json={"status": TravelIdeaGroupInvitationResponseStatus.ACCEPTED.value},
+    )
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Valid invitation not found"}
+
+    group_members = await db_session.execute(
+        select(func.count())
+        .select_from(models.TravelIdeaGroupMember)
+        .where(
+            models.TravelIdeaGroupMember.travel_idea_group_id == travel_idea_group_id,
+            models.TravelIdeaGroupMember.user_account_id == user.id,
+        )
+    )
+    assert group_members.scalar() == 1
@@ -0,0 +1,59 @@
+import io
+import json
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from app.core import uploads
+from app.core.uploads import RecordBatch, read_geojson_records
+
+
+def _upload(data: bytes) -> UploadFile:
+    return UploadFile(io.BytesIO(data), size=len(data))
+
+
+def _feature_collection(features: list[dict]) -> bytes:
+    return json.dumps({"type": "FeatureCollection", "features": features}).encode()
+
+
+async def _read_all(upload: UploadFile) -> RecordBatch:
+    return [record async for batch in read_geojson_records(upload, 100) for record in batch]
+
+
+@pytest.mark.asyncio
+async def test_read_geojson_records_reads_feature_larger_than_chunk_in_few_reads() -> None:
+    route = {
+        "type": "Feature",
+        "geometry": {"type": "LineString", "coordinates": [[-3.5 + i * 1e-6, 37.1] for i in range(100_000)]},
+        "properties": {"name": "Route"},
+    }
+    data = _feature_collection([route, {"type": "Feature", "properties": {"name": "Alhambra"}}])
+    assert len(data) > 16 * uploads.CHUNK_SIZE
+    upload = _upload(data)
+    reads = 0
+    read = upload.read
+
+    async def counting_read(size: int = -1) -> bytes:
+        nonlocal reads
+        reads += 1
+        return await read(size)
+
+    upload.read = counting_read
+
+    assert await _read_all(upload) == [(1, {"name": "Route"}), (2, {"name": "Alhambra"})]
+    # Growing the reads geometrically takes a handful of them rather than one per chunk
+    assert reads < 10
+
+
+@pytest.mark.asyncio
+async def test_read_geojson_records_fails_at_malformed_value_without_reading_the_rest() -> None:
+    features = [{"type": "Feature", "properties": {"name": f"Idea {i}"}} for i in range(20_000)]
+    data = _feature_collection(features).replace(b'"Idea 0"', b"Idea 0", 1)
+    assert len(data) > 4 * uploads.CHUNK_SIZE
+    upload = _upload(data)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await _read_all(upload)
+
+    assert exc_info.value.status_code == 400
+    assert upload.file.tell() == uploads.CHUNK_SIZE